@@ -0,0 +1,169 @@
+"""!
+@file compare_extractors.py
+@brief Differential equivalence report: reference extraction/aggregation vs an alternative engine on a JD corpus.
+
+Per JD, the reference (`analyze_jd_content` with the regex extractor) and the alternative must find the same skills
+and seniority level; mismatches are reported with a minimized repro text. The reference results are then aggregated
+by `GraphBuilder.update_metrics` and by the alternative aggregator, and the two `universe.json` documents are diffed.
+
+Usage (from DataFactory/):
+    python3 compare_extractors.py [--input data/input/raw_jds.txt | --synthetic 2000] [--engine ngram|batch]
+                                  [--aggregator batch|spilling] [--repeat 3] [--output report.json]
+"""
+
+import sys
+import os
+import json
+import tempfile
+import argparse
+from typing import List, Dict, Any, Callable
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from config import cfg
+from core.taxonomy import TaxonomyManager
+from core.graph_engine import GraphBuilder, GraphStats
+from core.skill_matrix import SkillMatrix
+from ingestion.reader import Reader
+from utils.text_processor import TextProcessor
+from utils.ngram_matcher import NgramSkillMatcher
+from utils.seniority_analyzer import SeniorityAnalyzer
+from utils.differential import DifferentialRunner, Engine, JDResult
+from main import analyze_jd_content, build_fuzzy_index, finalize_and_export
+
+# Tiny budget so the spilling aggregator actually spills on small corpora
+SPILL_BUDGET_MB = 0.05
+
+def analysis_engines() -> Dict[str, Engine]:
+    """!
+    @brief The reference ("regex") and alternative JD analysis engines, sharing prebuilt taxonomy tables.
+    """
+    matchable_terms = TaxonomyManager.get_matchable_terms()
+    alias_map = TaxonomyManager.get_alias_map()
+    fuzzy_index = build_fuzzy_index(alias_map)
+    matcher = NgramSkillMatcher(alias_map)
+
+    def per_jd(ngram_matcher):
+        def run(jds: List[str]) -> List[JDResult]:
+            results = []
+            for jd in jds:
+                found_skills, _, level = analyze_jd_content(jd, matchable_terms, alias_map, fuzzy_index, ngram_matcher)
+                results.append((tuple(sorted(found_skills)), level))
+            return results
+        return run
+
+    def batch(jds: List[str]) -> List[JDResult]:
+        matrix = TextProcessor.extract_skills_batch(jds, matcher, fuzzy_index, with_levels=True)
+        return [(tuple(sorted(matrix.row_names(i))), SeniorityAnalyzer.LEVELS[matrix.levels[i]]) for i in range(matrix.n_rows)]
+
+    return {
+        "regex": Engine("regex", per_jd(None)),
+        "ngram": Engine("ngram", per_jd(matcher)),
+        "batch": Engine("batch", batch)
+    }
+
+def aggregation_engines() -> Dict[str, Engine]:
+    """!
+    @brief The reference ("incremental", as in `process_data`) and alternative aggregators of per-JD results.
+    """
+    all_skills = TaxonomyManager.get_all_skills()
+    skill_index = TaxonomyManager.get_skill_index()
+
+    def incremental(edge_memory_budget_mb: float) -> Callable[[List[JDResult]], GraphStats]:
+        def run(results: List[JDResult]) -> GraphStats:
+            stats = GraphBuilder.initialize_stats(all_skills, edge_memory_budget_mb=edge_memory_budget_mb)
+            for found_skills, level in results:
+                stats.seniority_dist[level] += 1
+                GraphBuilder.update_metrics(stats, list(found_skills), level)
+            return stats
+        return run
+
+    def batch(results: List[JDResult]) -> GraphStats:
+        stats = GraphBuilder.initialize_stats(all_skills, edge_skill_ids=list(skill_index.keys()))
+        matrix = SkillMatrix.from_rows(
+            [[skill_index[skill] for skill in found_skills] for found_skills, _ in results],
+            list(skill_index.keys()),
+            [SeniorityAnalyzer.LEVELS.index(level) for _, level in results])
+        GraphBuilder.update_metrics_batch(stats, matrix)
+        return stats
+
+    return {
+        "incremental": Engine("incremental", incremental(0)),
+        "batch": Engine("batch", batch),
+        "spilling": Engine("spilling", incremental(SPILL_BUDGET_MB))
+    }
+
+def build_universe(total_jobs: int) -> Callable[[GraphStats], Dict[str, Any]]:
+    """Runs the pipeline's final transformation and export on `GraphStats` in a scratch directory."""
+    skill_to_group = TaxonomyManager.get_skill_to_group_map()
+    threshold = cfg.get("pipeline.threshold", 1)
+
+    def to_universe(stats: GraphStats) -> Dict[str, Any]:
+        with tempfile.TemporaryDirectory() as output_dir:
+            finalize_and_export(total_jobs, stats, skill_to_group, threshold, output_dir)
+            return Reader.load_json(os.path.join(output_dir, "universe.json"))
+    return to_universe
+
+def build_report(jds: List[str], engine: str = "ngram", aggregator: str = "batch", repeat: int = 1) -> Dict[str, Any]:
+    """!
+    @brief Compares `engine` with the regex reference on every JD, then `aggregator` with incremental aggregation.
+    """
+    runner = DifferentialRunner(repeat=repeat)
+    analyzers = analysis_engines()
+    analysis = runner.compare_analysis(analyzers["regex"], analyzers[engine], jds)
+
+    reference_results = analyzers["regex"].run(jds)
+    aggregators = aggregation_engines()
+    aggregation = runner.compare_aggregation(aggregators["incremental"], aggregators[aggregator], reference_results, build_universe(len(jds)))
+
+    return {"analysis": analysis, "aggregation": aggregation, "taxonomyTerms": len(TaxonomyManager.get_alias_map())}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Differential equivalence report of alternative extraction and aggregation engines.")
+    parser.add_argument("--input", default=cfg.get_abs_path("paths.input"), help="Raw JD file (###END### separated).")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use this many generated JDs instead of --input.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the synthetic corpus.")
+    parser.add_argument("--engine", choices=["ngram", "batch"], default="ngram", help="Alternative JD analysis engine.")
+    parser.add_argument("--aggregator", choices=["batch", "spilling"], default="batch", help="Alternative aggregation engine.")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per engine (best is kept).")
+    parser.add_argument("--output", default=None, help="Optional path for the JSON report.")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        keywords = SeniorityAnalyzer._load_seniority_keywords()
+        fillers = [word for category, _, _ in SeniorityAnalyzer.KEYWORD_WEIGHTS for word in keywords[category]]
+        jds = DifferentialRunner.synthetic_corpus(
+            TaxonomyManager.get_matchable_terms(), args.synthetic, seed=args.seed,
+            title_words=SeniorityAnalyzer.get_title_keywords(), filler_words=fillers)
+    else:
+        jds = Reader.load_raw_jds(file_path=args.input)
+    report = build_report(jds, args.engine, args.aggregator, args.repeat)
+
+    analysis, aggregation = report["analysis"], report["aggregation"]
+    for name, section in (("Analysis", analysis), ("Aggregation", aggregation)):
+        timing = section["timing"]
+        print(f"{name}: {timing['reference']} {timing['referenceSeconds']}s | {timing['alternative']} {timing['alternativeSeconds']}s | Speedup: {timing['speedup']}x")
+    print(f"JDs: {analysis['jds']} | Identical: {analysis['identical']} | Mismatches: {len(analysis['mismatches'])}")
+    for mismatch in analysis["mismatches"]:
+        print(f"  JD {mismatch['jd']}: only reference={mismatch['onlyReference']} only {args.engine}={mismatch['onlyAlternative']} "
+              f"levels={mismatch['referenceLevel']}/{mismatch['alternativeLevel']}")
+        if "repro" in mismatch:
+            print(f"    repro: {mismatch['repro']['text']!r}")
+
+    differences = aggregation["differences"]
+    print(f"Universe identical: {aggregation['identical']}")
+    if not aggregation["identical"]:
+        print(f"  meta: {differences['meta'][:5]}")
+        for section in ("nodes", "links"):
+            diff = differences[section]
+            print(f"  {section}: only reference={len(diff['onlyReference'])} only {args.aggregator}={len(diff['onlyAlternative'])} "
+                  f"changed={len(diff['changed'])} same order={diff['sameOrder']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"✅ Created {args.output}")
+
+if __name__ == "__main__":
+    main()
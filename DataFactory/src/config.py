@@ -1,34 +1,91 @@
-import yaml
+import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class Config:
+    """!
+    @brief Pipeline settings from `config/settings.yaml`, with environment overrides.
+
+    @details
+    Nothing is read when the module is imported: the YAML file is parsed on the first `get` that the
+    environment does not answer, so short CLI invocations and worker spawns do not pay for it.
+
+    -   **Overrides**: `CAREERNAV_<SECTION>__<KEY>` overrides `section.key` (levels separated by a double
+        underscore, e.g. `CAREERNAV_LOGGING__LEVEL=DEBUG` or `CAREERNAV_EXPORT__GRAPH_STORE=true`). Values are
+        parsed as JSON when possible (numbers, `true`/`false`, lists), otherwise kept as strings.
+        A key set in the environment is returned without reading the YAML file at all.
+    -   `CAREERNAV_CONFIG` points to another settings file.
+    """
     _instance = None
-    _config = {}
+    _config: Dict[str, Any] = {}
+    _loaded = False
+
+    ENV_PREFIX = "CAREERNAV_"
+    CONFIG_PATH_VARIABLE = "CAREERNAV_CONFIG"
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Config, cls).__new__(cls)
-            cls._load_config()
         return cls._instance
 
+    @staticmethod
+    def _env_name(path: str) -> str:
+        return Config.ENV_PREFIX + "__".join(key.upper() for key in path.split('.'))
+
+    @staticmethod
+    def _parse_env_value(raw: str) -> Any:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw
+
     @classmethod
     def _load_config(cls):
-        # Assuming run from root DataFactory/
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'settings.yaml')
-        # Fallback if running from src?
-        if not os.path.exists(config_path):
-             config_path = "config/settings.yaml" # Try relative to CWD
-        
+        import yaml
+
+        config_path = os.environ.get(cls.CONFIG_PATH_VARIABLE)
+        if not config_path:
+            # Assuming run from root DataFactory/
+            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'settings.yaml')
+            # Fallback if running from src?
+            if not os.path.exists(config_path):
+                 config_path = "config/settings.yaml" # Try relative to CWD
+
         try:
             with open(config_path, 'r') as f:
-                cls._config = yaml.safe_load(f)
+                cls._config = yaml.safe_load(f) or {}
         except FileNotFoundError:
             print(f"⚠️ Config not found at {config_path}, using defaults.")
             cls._config = {}
 
+        # Overrides also apply to whole sections read with `get("section")`
+        for name, raw in os.environ.items():
+            if not name.startswith(cls.ENV_PREFIX) or name == cls.CONFIG_PATH_VARIABLE:
+                continue
+            keys = name[len(cls.ENV_PREFIX):].lower().split("__")
+            section = cls._config
+            for key in keys[:-1]:
+                if not isinstance(section.get(key), dict):
+                    section[key] = {}
+                section = section[key]
+            section[keys[-1]] = cls._parse_env_value(raw)
+        cls._loaded = True
+
+    @classmethod
+    def reload(cls):
+        """Forgets the parsed settings; the next `get` reads the file (and environment) again."""
+        cls._config = {}
+        cls._loaded = False
+
     @classmethod
     def get(cls, path: str, default: Any = None) -> Any:
+        override: Optional[str] = os.environ.get(cls._env_name(path))
+        if override is not None:
+            value = cls._parse_env_value(override)
+            return value if value is not None else default
+        if not cls._loaded:
+            cls._load_config()
+
         keys = path.split('.')
         val = cls._config
         for key in keys:
@@ -49,5 +106,5 @@ class Config:
              return os.path.join(self.project_root, val)
         return val
 
-# Global accessor
+# Global accessor (settings are loaded on first use)
 cfg = Config()
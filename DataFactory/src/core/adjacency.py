@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple
+from dataclasses import dataclass
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+@dataclass
+class AdjacencyMatrix:
+    """!
+    @brief Symmetric weighted adjacency of the filtered skill graph in CSR layout.
+
+    @details
+    Row `i` (node `node_ids[i]`) holds its neighbors `indices[indptr[i]:indptr[i + 1]]` (sorted ascending)
+    with the matching edge weights in `weights`. Every undirected edge is stored twice (once per endpoint).
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    node_ids: List[str]
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """Returns the neighbor indices of node `i`."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def row_ids(self) -> np.ndarray:
+        """Returns the row number of every stored entry (the COO row array)."""
+        return np.repeat(np.arange(self.n_nodes, dtype=np.int64), np.diff(self.indptr))
+
+    def degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def strength(self) -> np.ndarray:
+        """Weighted degree: the sum of incident edge weights per node."""
+        return np.bincount(self.row_ids(), self.weights, self.n_nodes)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Computes `W @ x`."""
+        return np.bincount(self.row_ids(), self.weights * x[self.indices], self.n_nodes)
+
+    @staticmethod
+    def from_edges(node_ids: List[str], edge_counts: Dict[Tuple[str, str], Dict[str, int]]) -> "AdjacencyMatrix":
+        """!
+        @brief Builds the CSR arrays from the edge dictionary, weighting each edge by its `total`.
+
+        @details Edges touching nodes outside `node_ids` are ignored.
+        """
+        position: Dict[str, int] = {node: i for i, node in enumerate(node_ids)}
+        src: List[int] = []
+        tgt: List[int] = []
+        values: List[float] = []
+        for (a, b), stats in edge_counts.items():
+            if a in position and b in position:
+                src.append(position[a])
+                tgt.append(position[b])
+                values.append(stats["total"])
+
+        rows = np.asarray(src + tgt, dtype=np.int64)
+        cols = np.asarray(tgt + src, dtype=np.int64)
+        weights = np.asarray(values + values, dtype=np.float64)
+
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(node_ids)), out=indptr[1:])
+
+        return AdjacencyMatrix(
+            indptr=indptr,
+            indices=cols[order].astype(np.int32),
+            weights=weights[order],
+            node_ids=list(node_ids)
+        )
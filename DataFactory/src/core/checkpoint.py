@@ -0,0 +1,163 @@
+import os
+import glob
+import pickle
+import struct
+import hashlib
+import threading
+import zlib
+from typing import List, Dict, Any, Optional
+from core.edge_accumulator import SpillingEdgeCounter
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class Checkpoint:
+    """!
+    @brief Binary snapshots of an in-progress analysis run, for `process_data(resume=True)`.
+
+    @details
+    A checkpoint file `checkpoint_<position>.ckpt` holds a header `MAGIC | VERSION (uint16) | sha256 of the body`
+    followed by the zlib-compressed pickle of the run state (stats, reader position, ...). Files are written
+    to a temporary name and renamed, and a file whose magic, version or checksum does not match is skipped,
+    so `latest` always returns a complete state: the newest one that verifies.
+
+    Edge runs of a `SpillingEdgeCounter` are immutable, so they are hard-linked once into `<directory>/edge_runs/`
+    and referenced by path instead of being copied into every checkpoint.
+    """
+
+    MAGIC = b"CNCKPT"
+    VERSION = 1
+    HEADER = struct.Struct("<6sH32s")
+    FILE_PATTERN = "checkpoint_*.ckpt"
+
+    @staticmethod
+    def path_for(directory: str, position: int) -> str:
+        return os.path.join(directory, f"checkpoint_{position:012d}.ckpt")
+
+    @staticmethod
+    def pack(payload: bytes, compression_level: int = 1) -> bytes:
+        """Compresses a pickled state and prepends the header."""
+        body = zlib.compress(payload, compression_level)
+        return Checkpoint.HEADER.pack(Checkpoint.MAGIC, Checkpoint.VERSION, hashlib.sha256(body).digest()) + body
+
+    @staticmethod
+    def unpack(data: bytes) -> Dict[str, Any]:
+        """!
+        @brief Verifies and decodes a checkpoint file's content.
+        @throws ValueError if the header or checksum does not match.
+        """
+        if len(data) < Checkpoint.HEADER.size:
+            raise ValueError("Truncated checkpoint.")
+        magic, version, checksum = Checkpoint.HEADER.unpack_from(data)
+        if magic != Checkpoint.MAGIC:
+            raise ValueError("Not a checkpoint file.")
+        if version != Checkpoint.VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version}.")
+        body = data[Checkpoint.HEADER.size:]
+        if hashlib.sha256(body).digest() != checksum:
+            raise ValueError("Checkpoint checksum mismatch.")
+        return pickle.loads(zlib.decompress(body))
+
+    @staticmethod
+    def write(path: str, data: bytes) -> None:
+        """Writes `data` to `path` atomically (temporary file, fsync, rename)."""
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def paths(directory: str) -> List[str]:
+        """Checkpoint files of `directory`, newest (highest position) first."""
+        return sorted(glob.glob(os.path.join(directory, Checkpoint.FILE_PATTERN)), reverse=True)
+
+    @staticmethod
+    def latest(directory: str) -> Optional[Dict[str, Any]]:
+        """!
+        @brief Loads the newest checkpoint of `directory` that verifies.
+        @return The run state, or None if there is no valid checkpoint.
+        """
+        for path in Checkpoint.paths(directory):
+            try:
+                with open(path, "rb") as f:
+                    state = Checkpoint.unpack(f.read())
+                logger.info(f"Loaded checkpoint {path} (position {state['position']}).")
+                return state
+            except (OSError, ValueError, zlib.error, pickle.UnpicklingError, EOFError) as e:
+                logger.warning(f"Skipping invalid checkpoint {path}: {e}")
+        return None
+
+class CheckpointWriter:
+    """!
+    @brief Writes checkpoints every `every_jds` JDs or `every_seconds` seconds without stalling the analysis loop.
+
+    @details
+    `save` pickles the state on the calling thread (the only part that must see a consistent state), then
+    compresses and writes it on a background thread while processing continues. At most one write is in
+    flight: a checkpoint falling due while the previous one is still being written waits for it.
+    Only the `keep` newest checkpoints are kept.
+    """
+
+    def __init__(self, directory: str, every_jds: int = 10000, every_seconds: float = 300, keep: int = 2, compression_level: int = 1):
+        self.directory = directory
+        self.every_jds = every_jds
+        self.every_seconds = every_seconds
+        self.keep = max(1, keep)
+        self.compression_level = compression_level
+        self._last_position = 0
+        self._last_time = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self, position: int, now: float) -> None:
+        """Sets the reference point of the schedule (e.g. the resumed position)."""
+        self._last_position = position
+        self._last_time = now
+
+    def due(self, position: int, now: float) -> bool:
+        return (self.every_jds > 0 and position - self._last_position >= self.every_jds) or \
+            (self.every_seconds > 0 and now - self._last_time >= self.every_seconds)
+
+    def save(self, state: Dict[str, Any], now: float) -> None:
+        """!
+        @brief Snapshots `state` (which must hold its reader `position`) and writes it in the background.
+        """
+        self.wait()
+        stats = state.get("stats")
+        if stats is not None and isinstance(stats.edge_counts, SpillingEdgeCounter):
+            stats.edge_counts.persist_runs(os.path.join(self.directory, "edge_runs"))
+        payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        position = state["position"]
+        self._thread = threading.Thread(target=self._write, args=(payload, position), name="checkpoint-writer", daemon=True)
+        self._thread.start()
+        self.start(position, now)
+
+    def _write(self, payload: bytes, position: int) -> None:
+        try:
+            path = Checkpoint.path_for(self.directory, position)
+            Checkpoint.write(path, Checkpoint.pack(payload, self.compression_level))
+            for stale_path in Checkpoint.paths(self.directory)[self.keep:]:
+                os.remove(stale_path)
+            logger.info(f"Checkpoint written at JD {position} ({len(payload) / 1e6:.1f} MB before compression).")
+        except BaseException as e:
+            self._error = e
+
+    def wait(self) -> None:
+        """Blocks until the pending write (if any) is done; a failed write is logged, not raised."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            logger.warning(f"Checkpoint write failed: {self._error}")
+            self._error = None
+
+    def clear(self) -> None:
+        """Removes every checkpoint and persisted edge run (after the run completed)."""
+        self.wait()
+        for path in Checkpoint.paths(self.directory):
+            os.remove(path)
+        for path in glob.glob(os.path.join(self.directory, "edge_runs", "*")):
+            os.remove(path)
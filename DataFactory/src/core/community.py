@@ -0,0 +1,210 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any
+from core.adjacency import AdjacencyMatrix
+from utils.logger import get_logger
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+logger = get_logger(__name__)
+
+class CommunityDetector:
+    """!
+    @brief Louvain modularity optimization over the CSR skill graph.
+
+    @details
+    Each level runs the classic two phases:
+    1.  Local moving: nodes are visited in a seeded random order and moved to the neighboring community
+        with the best modularity gain `k_i,in - resolution * tot_c * k_i / 2m`, until a pass moves nothing.
+    2.  Aggregation: every community collapses into one node; the new CSR graph (with self-loops holding
+        internal weight) is built with a vectorized `np.unique` over community pairs.
+
+    A pass touches every stored entry once, so each level is O(E) and the number of levels is small in
+    practice, which keeps the whole run near-linear in the edge count. Results are deterministic for a
+    given seed.
+    """
+
+    @staticmethod
+    def detect(
+        adjacency: AdjacencyMatrix,
+        resolution: float = 1.0,
+        seed: int = 42,
+        max_levels: int = 10,
+        max_passes: int = 50
+    ) -> np.ndarray:
+        """!
+        @brief Assigns every node a community id.
+
+        @param adjacency Graph to partition (see `AdjacencyMatrix.from_edges`).
+        @param resolution Modularity resolution (> 1 yields more, smaller communities).
+        @param seed Seed for the node visiting order.
+        @param max_levels Maximum number of aggregation levels.
+        @param max_passes Maximum local moving passes per level.
+        @return Community id per node (aligned with `adjacency.node_ids`), numbered by size descending.
+        """
+        n = adjacency.n_nodes
+        labels = np.arange(n, dtype=np.int64)
+        if n == 0:
+            return labels
+
+        rng = np.random.default_rng(seed)
+        indptr, indices, weights = adjacency.indptr, adjacency.indices.astype(np.int64), adjacency.weights
+
+        for level in range(max_levels):
+            membership, moved = CommunityDetector._local_moving(indptr, indices, weights, resolution, rng, max_passes)
+            labels = membership[labels]
+            logger.debug(f"Louvain level {level}: {len(np.unique(membership))} communities.")
+            if not moved:
+                break
+            indptr, indices, weights = CommunityDetector._aggregate(indptr, indices, weights, membership)
+
+        return CommunityDetector._relabel_by_size(labels)
+
+    @staticmethod
+    def _local_moving(
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        resolution: float,
+        rng: np.random.Generator,
+        max_passes: int
+    ) -> Tuple[np.ndarray, bool]:
+        """Phase 1. Returns compact community ids per node and whether any node changed community."""
+        n = len(indptr) - 1
+        node_strength = np.bincount(np.repeat(np.arange(n), np.diff(indptr)), weights, n)
+        total_weight = float(node_strength.sum())
+        community = list(range(n))
+        if total_weight == 0:
+            return np.arange(n, dtype=np.int64), False
+
+        community_total: List[float] = node_strength.tolist()
+        strength: List[float] = node_strength.tolist()
+        bounds: List[int] = indptr.tolist()
+        neighbor_list: List[int] = indices.tolist()
+        weight_list: List[float] = weights.tolist()
+        order: List[int] = rng.permutation(n).tolist()
+
+        any_moved = False
+        for _ in range(max_passes):
+            moves = 0
+            for node in order:
+                current = community[node]
+                k_i = strength[node]
+
+                # Weight from node to each neighboring community (self-loops excluded)
+                links: Dict[int, float] = {}
+                for position in range(bounds[node], bounds[node + 1]):
+                    neighbor = neighbor_list[position]
+                    if neighbor != node:
+                        target = community[neighbor]
+                        links[target] = links.get(target, 0.0) + weight_list[position]
+
+                community_total[current] -= k_i
+                scale = resolution * k_i / total_weight
+                best = current
+                best_gain = links.get(current, 0.0) - community_total[current] * scale
+                # Strict improvement only: ties stay put, otherwise go to the lowest community id
+                for target in sorted(links):
+                    gain = links[target] - community_total[target] * scale
+                    if gain > best_gain + 1e-12:
+                        best, best_gain = target, gain
+                community_total[best] += k_i
+
+                if best != current:
+                    community[node] = best
+                    moves += 1
+            if moves == 0:
+                break
+            any_moved = True
+
+        _, compact = np.unique(np.asarray(community, dtype=np.int64), return_inverse=True)
+        return compact.astype(np.int64), any_moved
+
+    @staticmethod
+    def _aggregate(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, membership: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Phase 2. Collapses communities into nodes, summing weights between (and within) them."""
+        n_communities = int(membership.max()) + 1
+        rows = membership[np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))]
+        cols = membership[indices]
+        keys, inverse = np.unique(rows * n_communities + cols, return_inverse=True)
+        summed = np.bincount(inverse, weights, len(keys))
+
+        new_rows = keys // n_communities
+        new_indptr = np.zeros(n_communities + 1, dtype=np.int64)
+        np.cumsum(np.bincount(new_rows, minlength=n_communities), out=new_indptr[1:])
+        return new_indptr, keys % n_communities, summed
+
+    @staticmethod
+    def _relabel_by_size(labels: np.ndarray) -> np.ndarray:
+        """Renumbers communities 0..C-1 by size descending, ties by smallest member index."""
+        _, compact = np.unique(labels, return_inverse=True)
+        sizes = np.bincount(compact)
+        first_member = np.full(len(sizes), len(labels), dtype=np.int64)
+        np.minimum.at(first_member, compact, np.arange(len(labels)))
+        order = np.lexsort((first_member, -sizes))
+        rank = np.empty(len(sizes), dtype=np.int64)
+        rank[order] = np.arange(len(sizes))
+        return rank[compact]
+
+    @staticmethod
+    def modularity(adjacency: AdjacencyMatrix, labels: np.ndarray, resolution: float = 1.0) -> float:
+        """!
+        @brief Newman modularity `Q = sum_c [in_c / 2m - resolution * (tot_c / 2m)^2]` of a partition.
+        """
+        rows = adjacency.row_ids()
+        total_weight = adjacency.weights.sum()
+        if total_weight == 0:
+            return 0.0
+        n_communities = int(labels.max()) + 1
+        same = labels[rows] == labels[adjacency.indices]
+        internal = np.bincount(labels[rows][same], adjacency.weights[same], n_communities)
+        totals = np.bincount(labels, adjacency.strength(), n_communities)
+        return float((internal / total_weight - resolution * (totals / total_weight) ** 2).sum())
+
+    @staticmethod
+    def summarize(
+        nodes_list: List[Dict[str, Any]],
+        node_ids: List[str],
+        labels: np.ndarray,
+        adjacency: AdjacencyMatrix,
+        top_n: int = 5
+    ) -> List[Dict[str, Any]]:
+        """!
+        @brief Writes `community` onto each node and builds one summary per community.
+
+        @param nodes_list Final node objects (modified in place).
+        @param node_ids The order `labels` follows.
+        @param labels Output of `detect`.
+        @param adjacency The graph `labels` was computed on, for internal edge weight.
+        @param top_n Number of most frequent skills listed per community.
+        @return List of `{ id, size, topSkills, dominantGroup, avgSeniorityScore, internalWeight }`, by id.
+        """
+        node_index: Dict[str, Dict[str, Any]] = {node["id"]: node for node in nodes_list}
+        rows = adjacency.row_ids()
+        same = labels[rows] == labels[adjacency.indices]
+        n_communities = int(labels.max()) + 1 if len(labels) else 0
+        # Every internal edge is stored twice
+        internal = np.bincount(labels[rows][same], adjacency.weights[same], n_communities) / 2
+
+        members: List[List[Dict[str, Any]]] = [[] for _ in range(n_communities)]
+        for node_id, label in zip(node_ids, labels.tolist()):
+            node = node_index[node_id]
+            node["community"] = label
+            members[label].append(node)
+
+        summaries: List[Dict[str, Any]] = []
+        for label, community_nodes in enumerate(members):
+            group_counts: Dict[str, int] = {}
+            for node in community_nodes:
+                group_counts[node["group"]] = group_counts.get(node["group"], 0) + 1
+            top_nodes = sorted(community_nodes, key=lambda node: (-node["val"], node["id"]))[:top_n]
+
+            summaries.append({
+                "id": label,
+                "size": len(community_nodes),
+                "topSkills": [node["id"] for node in top_nodes],
+                "dominantGroup": min(group_counts, key=lambda group: (-group_counts[group], group)),
+                "avgSeniorityScore": round(sum(node["seniorityScore"] for node in community_nodes) / len(community_nodes), 2),
+                "internalWeight": int(internal[label])
+            })
+        return summaries
@@ -0,0 +1,261 @@
+from __future__ import annotations
+import os
+import heapq
+import shutil
+import tempfile
+import weakref
+from typing import List, Dict, Tuple, Iterable, Iterator, Optional
+from utils.lazy_import import lazy_import
+from utils.logger import get_logger
+
+np = lazy_import("numpy")
+logger = get_logger(__name__)
+
+EdgeKey = Tuple[str, str]
+
+class SpillingEdgeCounter:
+    """!
+    @brief Bounded-memory replacement for the `edge_counts` dictionary of `GraphStats`.
+
+    @details
+    Co-occurrence counting materializes one entry per unique skill pair, and long-tail pairs seen once
+    dominate memory on large corpora. This counter keeps at most `max_entries` pairs in memory.
+    When full, the heaviest half (by total) stays resident and keeps accumulating exactly, while the
+    long tail is written to disk as a run sorted by pair.
+
+    `items()` k-way merges the resident entries with every run and sums counts per pair, so the result
+    is exact for every pair (not an estimate) and is produced in sorted pair order while only holding
+    one entry per run in memory. At most `MERGE_FAN_IN` runs are open at once: beyond that, batches of
+    runs are first merged into temporary intermediate runs (the spilled runs themselves are never rewritten,
+    since checkpoints may reference them).
+
+    Runs are tab-separated lines: `source \\t target \\t total \\t senior_count \\t managerial_count`.
+    """
+
+    # Rough CPython footprint of one entry: key tuple + counter dict + hash table slot
+    BYTES_PER_ENTRY = 360
+    # Runs merged (and files open) at once by `items()`
+    MERGE_FAN_IN = 64
+
+    def __init__(self, max_entries: int, spill_dir: Optional[str] = None):
+        """!
+        @param max_entries Maximum number of pairs held in memory before spilling.
+        @param spill_dir Parent directory for run files (system temp dir if None).
+        """
+        self.max_entries = max(2, int(max_entries))
+        self._counts: Dict[EdgeKey, Dict[str, int]] = {}
+        self._run_paths: List[str] = []
+        self._spilled_entries = 0
+        self._run_dir = tempfile.mkdtemp(prefix="edge_runs_", dir=spill_dir)
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self._run_dir, True)
+
+    @staticmethod
+    def from_budget(memory_budget_mb: float, spill_dir: Optional[str] = None) -> "SpillingEdgeCounter":
+        """Creates a counter whose resident entries fit (approximately) in `memory_budget_mb`."""
+        max_entries = int(memory_budget_mb * 1024 * 1024) // SpillingEdgeCounter.BYTES_PER_ENTRY
+        return SpillingEdgeCounter(max_entries, spill_dir)
+
+    @property
+    def run_count(self) -> int:
+        return len(self._run_paths)
+
+    def increment(self, pair: EdgeKey, is_senior: bool, is_managerial: bool) -> None:
+        """!
+        @brief Adds one co-occurrence of `pair` (already sorted) to the counters.
+        """
+        self.add(pair, 1, 1 if is_senior else 0, 1 if is_managerial else 0)
+
+    def add(self, pair: EdgeKey, total: int, senior_count: int = 0, managerial_count: int = 0) -> None:
+        """!
+        @brief Adds pre-aggregated counts for `pair` (e.g. when merging shard partials).
+        """
+        counts = self._counts.get(pair)
+        if counts is None:
+            if len(self._counts) >= self.max_entries:
+                self._spill()
+            counts = {"total": 0, "senior_count": 0, "managerial_count": 0}
+            self._counts[pair] = counts
+
+        counts["total"] += total
+        counts["senior_count"] += senior_count
+        counts["managerial_count"] += managerial_count
+
+    def _spill(self) -> None:
+        """Writes the lighter half of the resident entries to a new sorted run."""
+        by_weight = sorted(self._counts.items(), key=lambda item: item[1]["total"], reverse=True)
+        keep = self.max_entries // 2
+        tail = sorted(by_weight[keep:])
+        self._counts = dict(by_weight[:keep])
+
+        run_path = os.path.join(self._run_dir, f"run_{len(self._run_paths):05d}.tsv")
+        SpillingEdgeCounter._write_run(run_path, tail)
+
+        self._run_paths.append(run_path)
+        self._spilled_entries += len(tail)
+        logger.debug(f"Spilled {len(tail)} edges to {run_path} ({self._spilled_entries} spilled so far).")
+
+    @staticmethod
+    def _write_run(run_path: str, entries: Iterable[Tuple[EdgeKey, Dict[str, int]]]) -> None:
+        with open(run_path, "w", encoding="utf-8") as f:
+            for (src, tgt), stats in entries:
+                f.write(f"{src}\t{tgt}\t{stats['total']}\t{stats['senior_count']}\t{stats['managerial_count']}\n")
+
+    @staticmethod
+    def _read_run(run_path: str) -> Iterator[Tuple[EdgeKey, Dict[str, int]]]:
+        with open(run_path, "r", encoding="utf-8") as f:
+            for line in f:
+                src, tgt, total, senior, managerial = line.rstrip("\n").split("\t")
+                yield (src, tgt), {"total": int(total), "senior_count": int(senior), "managerial_count": int(managerial)}
+
+    def items(self) -> Iterator[Tuple[EdgeKey, Dict[str, int]]]:
+        """!
+        @brief Yields every pair with its exact merged counts, in sorted pair order.
+        """
+        run_paths = list(self._run_paths)
+        intermediate: List[str] = []
+        try:
+            # Leave one stream for the resident entries in the final merge
+            while len(run_paths) > self.MERGE_FAN_IN - 1:
+                batch, run_paths = run_paths[:self.MERGE_FAN_IN], run_paths[self.MERGE_FAN_IN:]
+                fd, merged_path = tempfile.mkstemp(prefix="merge_", suffix=".tsv", dir=self._run_dir)
+                os.close(fd)
+                intermediate.append(merged_path)
+                SpillingEdgeCounter._write_run(merged_path, SpillingEdgeCounter._merge([self._read_run(path) for path in batch]))
+                run_paths.append(merged_path)
+
+            yield from SpillingEdgeCounter._merge([iter(sorted(self._counts.items()))] + [self._read_run(path) for path in run_paths])
+        finally:
+            for path in intermediate:
+                os.remove(path)
+
+    @staticmethod
+    def _merge(streams: List[Iterator[Tuple[EdgeKey, Dict[str, int]]]]) -> Iterator[Tuple[EdgeKey, Dict[str, int]]]:
+        """Merges streams sorted by pair, summing the counts of equal pairs."""
+        current_key: Optional[EdgeKey] = None
+        current: Dict[str, int] = {}
+        for key, stats in heapq.merge(*streams, key=lambda item: item[0]):
+            if key != current_key:
+                if current_key is not None:
+                    yield current_key, current
+                current_key = key
+                current = {"total": 0, "senior_count": 0, "managerial_count": 0}
+            current["total"] += stats["total"]
+            current["senior_count"] += stats["senior_count"]
+            current["managerial_count"] += stats["managerial_count"]
+
+        if current_key is not None:
+            yield current_key, current
+
+    def close(self) -> None:
+        """Deletes the run files (runs moved by `persist_runs` are left alone)."""
+        self._cleanup()
+
+    # ---- Checkpointing
+
+    def persist_runs(self, directory: str) -> None:
+        """!
+        @brief Links the runs written so far into `directory`, and reads them from there from now on.
+
+        @details Used by checkpoints: runs never change once written, so each one is linked (or copied
+        across file systems) once, and survives this counter's temporary directory.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for i, run_path in enumerate(self._run_paths):
+            if os.path.dirname(run_path) == directory:
+                continue
+            target = os.path.join(directory, os.path.basename(run_path))
+            temp_path = target + ".tmp"
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            try:
+                os.link(run_path, temp_path)
+            except OSError:
+                shutil.copyfile(run_path, temp_path)
+            os.replace(temp_path, target)
+            self._run_paths[i] = target
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Run paths must outlive this process (see `persist_runs`)
+        return {"max_entries": self.max_entries, "counts": self._counts, "run_paths": self._run_paths, "spilled_entries": self._spilled_entries}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__init__(state["max_entries"])
+        self._counts = state["counts"]
+        self._run_paths = list(state["run_paths"])
+        self._spilled_entries = state["spilled_entries"]
+
+class ColumnarEdgeCounter:
+    """!
+    @brief Replacement for the `edge_counts` dictionary of `GraphStats` that counts on integer skill-id pairs.
+
+    @details
+    A pair is keyed as `rank(source) * n_skills + rank(target)`, with ranks in name order (`name_ranks`), so
+    ascending keys are pairs in sorted (source, target) order. `GraphBuilder.update_metrics_batch` appends
+    whole batches as key/count columns (`add_columns`), and `add` takes single name pairs (per-JD updates).
+    Pending columns are summed per key with `np.unique` / `np.bincount` once they hold `compact_every` entries.
+    Names are only looked up by `items()`, which yields pairs in sorted order like `SpillingEdgeCounter`.
+    Counts are integers.
+    """
+
+    def __init__(self, skill_ids: List[str], compact_every: int = 1 << 22):
+        """!
+        @param skill_ids Interned skill vocabulary of the batches (see `TaxonomyManager.get_skill_ids`).
+        @param compact_every Pending entries that trigger summing the columns per key.
+        """
+        self.skill_ids = skill_ids
+        self.compact_every = max(1, compact_every)
+        name_order = sorted(range(len(skill_ids)), key=skill_ids.__getitem__)
+        self._names = [skill_ids[skill_id] for skill_id in name_order]
+        self._rank_of_name = {name: rank for rank, name in enumerate(self._names)}
+        self.name_ranks = np.empty(len(skill_ids), dtype=np.int64)
+        self.name_ranks[name_order] = np.arange(len(skill_ids))
+        self._keys: List[np.ndarray] = []
+        self._counts: List[np.ndarray] = []
+        self._pending = 0
+
+    def add(self, pair: EdgeKey, total: int, senior_count: int = 0, managerial_count: int = 0) -> None:
+        """!
+        @brief Adds counts for one `pair` of skill names (already sorted).
+        """
+        key = self._rank_of_name[pair[0]] * len(self.skill_ids) + self._rank_of_name[pair[1]]
+        self.add_columns(np.array([key], dtype=np.int64), np.array([[total, senior_count, managerial_count]], dtype=np.int64))
+
+    def add_columns(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        """!
+        @brief Adds counts for many pairs at once.
+
+        @param keys Pair keys (see the class description); may repeat.
+        @param counts Array of shape (len(keys), 3): total, senior and managerial count per key.
+        """
+        self._keys.append(np.asarray(keys, dtype=np.int64))
+        self._counts.append(np.asarray(counts, dtype=np.int64).reshape(-1, 3))
+        self._pending += len(keys)
+        if self._pending >= self.compact_every:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Sums the pending columns per key into one sorted chunk."""
+        if len(self._keys) <= 1 and self._pending == 0:
+            return
+        keys = np.concatenate(self._keys) if self._keys else np.empty(0, dtype=np.int64)
+        counts = np.concatenate(self._counts) if self._counts else np.empty((0, 3), dtype=np.int64)
+        unique_keys, slots = np.unique(keys, return_inverse=True)
+        summed = np.stack([np.bincount(slots, weights=counts[:, column], minlength=len(unique_keys)) for column in range(3)], axis=1).astype(np.int64)
+        self._keys, self._counts, self._pending = [unique_keys], [summed], 0
+
+    def __len__(self) -> int:
+        self._compact()
+        return len(self._keys[0]) if self._keys else 0
+
+    def items(self) -> Iterator[Tuple[EdgeKey, Dict[str, int]]]:
+        """!
+        @brief Yields every pair with its summed counts, in sorted pair order.
+        """
+        self._compact()
+        if not self._keys:
+            return
+        sources, targets = np.divmod(self._keys[0], len(self.skill_ids))
+        names = np.array(self._names, dtype=object)
+        counts = self._counts[0].T.tolist()
+        for source, target, total, senior_count, managerial_count in zip(names[sources].tolist(), names[targets].tolist(), *counts):
+            yield (source, target), {"total": total, "senior_count": senior_count, "managerial_count": managerial_count}
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple
+from utils.logger import get_logger
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+logger = get_logger(__name__)
+
+EdgeKey = Tuple[str, str]
+
+class EdgeScorer:
+    """!
+    @brief Statistical significance scores and backbone pruning for co-occurrence edges.
+
+    @details
+    A raw count threshold keeps every edge touching ubiquitous skills ("agile", "git"), which turns the
+    graph into a hairball. Scores are computed in one vectorized pass over all edges from the node totals
+    and the number of JDs `N`:
+    -   `lift = P(a, b) / (P(a) * P(b))` with `P(x) = count(x) / N`.
+    -   `pmi = log(lift)`, `npmi = pmi / -log P(a, b)` in [-1, 1] (1 = always together, 0 = independent).
+    -   `disparity`: the Serrano et al. disparity filter p-value `(1 - w / s) ^ (k - 1)`, evaluated from both
+        endpoints (strength `s`, degree `k`) and keeping the smaller one. Low values mean the edge carries
+        an unusually large share of at least one endpoint's weight.
+
+    Pruning modes (`pipeline.edge_pruning`):
+    -   `none`: keep every edge.
+    -   `disparity`: keep edges with `disparity < alpha`.
+    -   `topk`: keep an edge if it is among the `k` best edges (by NPMI, then weight) of either endpoint.
+    -   `npmi`: keep edges with `npmi >= min_npmi`.
+    """
+
+    PRUNING_MODES = ("none", "disparity", "topk", "npmi")
+
+    @staticmethod
+    def score_edges(
+        edge_counts: Dict[EdgeKey, Dict[str, int]],
+        node_stats: Dict[str, Dict[str, int]],
+        total_jobs: int
+    ) -> Dict[EdgeKey, Dict[str, float]]:
+        """!
+        @brief Computes lift, PMI, NPMI and disparity for every edge.
+
+        @param edge_counts Filtered edge statistics (see `GraphBuilder.filter_edges`).
+        @param node_stats Raw node statistics, for per-skill JD counts.
+        @param total_jobs Number of JDs the statistics were collected from.
+        @return `{ (source, target): { "lift", "pmi", "npmi", "disparity" } }` in `edge_counts` order.
+        """
+        pairs: List[EdgeKey] = list(edge_counts.keys())
+        if not pairs or total_jobs <= 0:
+            return {}
+
+        node_ids: Dict[str, int] = {}
+        src_idx = np.empty(len(pairs), dtype=np.int64)
+        tgt_idx = np.empty(len(pairs), dtype=np.int64)
+        for i, (src, tgt) in enumerate(pairs):
+            src_idx[i] = node_ids.setdefault(src, len(node_ids))
+            tgt_idx[i] = node_ids.setdefault(tgt, len(node_ids))
+
+        weights = np.fromiter((stats["total"] for stats in edge_counts.values()), dtype=np.float64, count=len(pairs))
+        node_totals = np.array([node_stats[node]["total"] for node in node_ids], dtype=np.float64)
+
+        # PMI family
+        p_ab = weights / total_jobs
+        p_a = node_totals[src_idx] / total_jobs
+        p_b = node_totals[tgt_idx] / total_jobs
+        lift = p_ab / (p_a * p_b)
+        pmi = np.log(lift)
+        neg_log_p_ab = -np.log(p_ab)
+        # A pair present in every JD has -log P(a, b) = 0; it is perfectly associated (npmi = 1)
+        npmi = np.divide(pmi, neg_log_p_ab, out=np.ones_like(pmi), where=neg_log_p_ab > 0)
+
+        # Disparity filter
+        strength = np.bincount(src_idx, weights, len(node_ids)) + np.bincount(tgt_idx, weights, len(node_ids))
+        degree = np.bincount(src_idx, minlength=len(node_ids)) + np.bincount(tgt_idx, minlength=len(node_ids))
+        alpha_src = (1.0 - weights / strength[src_idx]) ** (degree[src_idx] - 1)
+        alpha_tgt = (1.0 - weights / strength[tgt_idx]) ** (degree[tgt_idx] - 1)
+        disparity = np.minimum(alpha_src, alpha_tgt)
+
+        scores: Dict[EdgeKey, Dict[str, float]] = {}
+        for i, pair in enumerate(pairs):
+            scores[pair] = {
+                "lift": round(float(lift[i]), 4),
+                "pmi": round(float(pmi[i]), 4),
+                "npmi": round(float(npmi[i]), 4),
+                "disparity": round(float(disparity[i]), 4)
+            }
+        return scores
+
+    @staticmethod
+    def prune_edges(
+        edge_counts: Dict[EdgeKey, Dict[str, int]],
+        edge_scores: Dict[EdgeKey, Dict[str, float]],
+        mode: str = "none",
+        alpha: float = 0.05,
+        top_k: int = 10,
+        min_npmi: float = 0.0
+    ) -> Dict[EdgeKey, Dict[str, int]]:
+        """!
+        @brief Reduces the edge set to its statistically meaningful backbone.
+
+        @param edge_counts Filtered edge statistics.
+        @param edge_scores Output of `score_edges` for the same edges.
+        @param mode One of `PRUNING_MODES`.
+        @param alpha Significance level for `disparity`.
+        @param top_k Edges kept per node for `topk`.
+        @param min_npmi Minimum NPMI for `npmi`.
+        @return The surviving edges, in their original order.
+        @throws ValueError If the mode is unknown.
+        """
+        if mode not in EdgeScorer.PRUNING_MODES:
+            raise ValueError(f"Unknown edge pruning mode '{mode}'. Expected one of {EdgeScorer.PRUNING_MODES}.")
+
+        if mode == "none":
+            return edge_counts
+
+        if mode == "disparity":
+            keep = {pair for pair in edge_counts if edge_scores[pair]["disparity"] < alpha}
+        elif mode == "npmi":
+            keep = {pair for pair in edge_counts if edge_scores[pair]["npmi"] >= min_npmi}
+        else:
+            # Rank each node's edges by (npmi, weight) and keep the union of the per-node top-k lists
+            incident: Dict[str, List[EdgeKey]] = {}
+            for pair in edge_counts:
+                incident.setdefault(pair[0], []).append(pair)
+                incident.setdefault(pair[1], []).append(pair)
+            keep = set()
+            for node_edges in incident.values():
+                node_edges.sort(key=lambda pair: (-edge_scores[pair]["npmi"], -edge_counts[pair]["total"], pair))
+                keep.update(node_edges[:top_k])
+
+        pruned = {pair: stats for pair, stats in edge_counts.items() if pair in keep}
+        logger.info(f"Edge pruning ({mode}): kept {len(pruned)}/{len(edge_counts)} edges.")
+        return pruned
@@ -0,0 +1,222 @@
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+import numpy as np
+from core.skill_matrix import SkillMatrix
+from utils.seniority_analyzer import SeniorityAnalyzer
+
+HIGH_LEVELS = ("Senior", "Managerial")
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits per row of a packed uint64 array (last axis)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    as_bytes = words.view(np.uint8).reshape(words.shape[:-1] + (-1,))
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1, dtype=np.int64)
+
+@dataclass
+class GapBatchResult:
+    """!
+    @brief Gap analysis of every (profile, job) pair of a batch, as dense arrays indexed `[profile, job]`.
+
+    @details Skill lists of a single pair are decoded on demand by `BatchGapAnalyzer.pair`.
+    """
+    missing_count: np.ndarray
+    implicit_count: np.ndarray
+    level_mismatch: np.ndarray
+    lacks_elite_skills: np.ndarray
+
+    @property
+    def seniority_mismatch(self) -> np.ndarray:
+        """Same flag as `GapAnalysisResult.SeniorityMismatch`: level mismatch, or a high-level profile without elite skills."""
+        return self.level_mismatch | self.lacks_elite_skills[:, None]
+
+class BatchGapAnalyzer:
+    """!
+    @brief Vectorized version of the Core `GapAnalyzer`, for cohort reports over many profiles x many jobs.
+
+    @details
+    Skill sets are packed into bitsets (rows of uint64 words) over interned skill ids: the taxonomy
+    vocabulary (`TaxonomyManager.get_skill_ids`), followed by any other skill named by the universe or a batch.
+    Names are matched case-insensitively, like the C# engine. For a profile `U` and a job `J`:
+    -   **Missing** skills are `J & ~U`.
+    -   **Implicit** skills are the union of the universe neighbors of every missing skill, `& ~U & ~J`.
+        Neighbors come from a precomputed bitmap with one row per skill, so the union is a handful of ORs.
+    -   **Elite check**: a Senior/Managerial profile whose `U & senior_mask` is empty (no `isSenior` node)
+        gets a seniority mismatch, as does a non-senior profile applying to a Senior/Managerial job.
+
+    `analyze` walks the jobs one at a time and evaluates all profiles at once, so memory stays
+    O(profiles x words) besides the `[profile, job]` result arrays.
+    """
+
+    def __init__(self, universe: Dict[str, Any], skill_ids: Optional[List[str]] = None):
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        for name in skill_ids or []:
+            self.intern(name)
+        for node in universe.get("nodes", []):
+            self.intern(node["id"])
+        for link in universe.get("links", []):
+            self.intern(link["source"])
+            self.intern(link["target"])
+
+        self._senior_ids = [self._index[node["id"].lower()] for node in universe.get("nodes", []) if node.get("isSenior")]
+        self._links = [(self._index[link["source"].lower()], self._index[link["target"].lower()]) for link in universe.get("links", [])]
+        self._neighbor_bits: Optional[np.ndarray] = None
+        self._senior_mask: Optional[np.ndarray] = None
+
+    # ---- Vocabulary and encoding
+
+    @property
+    def skill_ids(self) -> List[str]:
+        return self._names
+
+    @property
+    def n_words(self) -> int:
+        return (len(self._names) + 63) // 64
+
+    def intern(self, name: str) -> int:
+        """Returns the id of `name`, adding it to the vocabulary if needed."""
+        key = name.lower()
+        skill_id = self._index.get(key)
+        if skill_id is None:
+            skill_id = len(self._names)
+            self._index[key] = skill_id
+            self._names.append(key)
+            # Bitmaps are rebuilt at the new width on next use
+            self._neighbor_bits = None
+            self._senior_mask = None
+        return skill_id
+
+    def encode(self, skill_lists: List[List[str]], levels: Optional[List[str]] = None) -> SkillMatrix:
+        """!
+        @brief Interns skill names into a `SkillMatrix` over this analyzer's vocabulary.
+        @param levels Optional seniority level per row (names from `SeniorityAnalyzer.LEVELS`).
+        """
+        rows = [[self.intern(name) for name in skills] for skills in skill_lists]
+        level_codes = [SeniorityAnalyzer.LEVELS.index(level) for level in levels] if levels is not None else None
+        return SkillMatrix.from_rows(rows, self._names, level_codes)
+
+    def pack(self, matrix: SkillMatrix) -> np.ndarray:
+        """Packs the rows of `matrix` into an `(n_rows, n_words)` uint64 bitset array."""
+        bits = np.zeros((matrix.n_rows, self.n_words), dtype=np.uint64)
+        if len(matrix.indices):
+            indices = matrix.indices.astype(np.int64)
+            np.bitwise_or.at(bits, (matrix.row_ids(), indices >> 6), np.left_shift(np.uint64(1), (indices & 63).astype(np.uint64)))
+        return bits
+
+    def unpack(self, row_bits: np.ndarray) -> List[str]:
+        """Names of the skills set in one bitset row, in id order."""
+        flags = np.unpackbits(row_bits.view(np.uint8), bitorder="little")[:len(self._names)]
+        return [self._names[skill_id] for skill_id in np.flatnonzero(flags)]
+
+    def _ensure_bitmaps(self) -> None:
+        if self._neighbor_bits is not None:
+            return
+        n_skills = len(self._names)
+        neighbors = SkillMatrix.from_rows([[] for _ in range(n_skills)], self._names)
+        if self._links:
+            links = np.asarray(self._links, dtype=np.int64)
+            rows = np.concatenate([links[:, 0], links[:, 1]])
+            cols = np.concatenate([links[:, 1], links[:, 0]])
+            order = np.lexsort((cols, rows))
+            neighbors = SkillMatrix(
+                indptr=np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n_skills))]),
+                indices=cols[order],
+                skill_ids=self._names)
+        self._neighbor_bits = self.pack(neighbors)
+        self._senior_mask = self.pack(SkillMatrix.from_rows([self._senior_ids], self._names))[0]
+
+    @staticmethod
+    def _is_high_level(matrix: SkillMatrix) -> np.ndarray:
+        if matrix.levels is None:
+            return np.zeros(matrix.n_rows, dtype=bool)
+        return np.isin(matrix.levels, [SeniorityAnalyzer.LEVELS.index(level) for level in HIGH_LEVELS])
+
+    # ---- Analysis
+
+    def analyze(self, profiles: SkillMatrix, jobs: SkillMatrix) -> GapBatchResult:
+        """!
+        @brief Gap analysis of every profile against every job.
+
+        @param profiles Users' skills (and levels), e.g. from `encode`.
+        @param jobs Jobs' required skills (and levels).
+        @return Per-pair counts and flags.
+        """
+        self._ensure_bitmaps()
+        user_bits = self.pack(profiles)
+        job_bits = self.pack(jobs)
+        n_profiles, n_jobs = profiles.n_rows, jobs.n_rows
+
+        missing_count = np.zeros((n_profiles, n_jobs), dtype=np.int32)
+        implicit_count = np.zeros((n_profiles, n_jobs), dtype=np.int32)
+        not_user = ~user_bits
+
+        for q in range(n_jobs):
+            missing = job_bits[q] & not_user
+            missing_count[:, q] = _popcount(missing)
+
+            # All-ones mask where the profile lacks the job's k-th skill: (profiles, k, 1) & (k, words), OR-reduced over k
+            job_skills = jobs.row(q).astype(np.int64)
+            lacks_skill = (missing[:, job_skills >> 6] >> (job_skills & 63).astype(np.uint64)) & np.uint64(1)
+            implicit = np.bitwise_or.reduce((np.uint64(0) - lacks_skill)[:, :, None] & self._neighbor_bits[job_skills][None, :, :], axis=1)
+            implicit &= not_user
+            implicit &= ~job_bits[q]
+            implicit_count[:, q] = _popcount(implicit)
+
+        user_high = self._is_high_level(profiles)
+        job_high = self._is_high_level(jobs)
+        elite_counts = _popcount(user_bits & self._senior_mask)
+
+        return GapBatchResult(
+            missing_count=missing_count,
+            implicit_count=implicit_count,
+            level_mismatch=job_high[None, :] & ~user_high[:, None],
+            lacks_elite_skills=user_high & (elite_counts == 0))
+
+    def pair(self, profiles: SkillMatrix, jobs: SkillMatrix, p: int, q: int) -> Dict[str, Any]:
+        """!
+        @brief Full result of one pair, shaped like the Core `GapAnalysisResult` (minus the message).
+        """
+        self._ensure_bitmaps()
+        user_bits = self.pack(SkillMatrix(profiles.indptr[p:p + 2] - profiles.indptr[p], profiles.row(p), self._names))[0]
+        job_bits = self.pack(SkillMatrix(jobs.indptr[q:q + 2] - jobs.indptr[q], jobs.row(q), self._names))[0]
+        missing = job_bits & ~user_bits
+
+        implicit = np.zeros_like(missing)
+        for skill_id in np.flatnonzero(np.unpackbits(missing.view(np.uint8), bitorder="little")[:len(self._names)]):
+            implicit |= self._neighbor_bits[skill_id]
+        implicit &= ~user_bits & ~job_bits
+
+        user_high = bool(self._is_high_level(profiles)[p])
+        job_high = bool(self._is_high_level(jobs)[q])
+        lacks_elite = user_high and not (user_bits & self._senior_mask).any()
+        return {
+            "missingSkills": self.unpack(missing),
+            "implicitSkills": self.unpack(implicit),
+            "seniorityMismatch": (job_high and not user_high) or lacks_elite
+        }
+
+    def cohort_report(self, profiles: SkillMatrix, jobs: SkillMatrix, result: GapBatchResult, top_n: int = 10) -> List[Dict[str, Any]]:
+        """!
+        @brief Per-job summary of a batch: how many profiles are ready, and the skills most of them miss.
+
+        @return One `{ job, readyProfiles, medianMissing, seniorityMismatches, topMissing: [[skill, profiles], ...] }` per job.
+        """
+        user_bits = self.pack(profiles)
+        flags = np.unpackbits(user_bits.view(np.uint8), axis=1, bitorder="little")[:, :len(self._names)]
+        prevalence = flags.sum(axis=0, dtype=np.int64)
+        seniority_mismatch = result.seniority_mismatch
+
+        report: List[Dict[str, Any]] = []
+        for q in range(jobs.n_rows):
+            job_skills = jobs.row(q)
+            lacking = profiles.n_rows - prevalence[job_skills]
+            order = sorted(range(len(job_skills)), key=lambda i: (-lacking[i], self._names[job_skills[i]]))
+            report.append({
+                "job": q,
+                "readyProfiles": int((result.missing_count[:, q] == 0).sum()),
+                "medianMissing": float(np.median(result.missing_count[:, q])) if profiles.n_rows else 0.0,
+                "seniorityMismatches": int(seniority_mismatch[:, q].sum()),
+                "topMissing": [[self._names[job_skills[i]], int(lacking[i])] for i in order[:top_n] if lacking[i] > 0]
+            })
+        return report
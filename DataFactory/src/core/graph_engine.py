@@ -1,13 +1,20 @@
-from typing import List, Dict, Tuple, Any
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any, Union, Optional
 from collections import Counter
 import itertools
 from dataclasses import dataclass
+from core.skill_matrix import SkillMatrix
+from core.edge_accumulator import SpillingEdgeCounter, ColumnarEdgeCounter
+from utils.seniority_analyzer import SeniorityAnalyzer
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
 
 @dataclass
 class GraphStats:
     """Data Class for Graph Statistics"""
     node_stats: Dict[str, Dict[str, int]]
-    edge_counts: Dict[Tuple[str, str], Dict[str, int]]
+    edge_counts: Union[Dict[Tuple[str, str], Dict[str, int]], SpillingEdgeCounter, ColumnarEdgeCounter]
     seniority_dist: Counter
 
 class GraphBuilder:
@@ -21,8 +28,11 @@ class GraphBuilder:
     -   **Edges**: Co-occurrence counts between pairs of skills found in the same JD.
     """
 
+    # (skill_ids, names in name order, rank of every skill id) of the last vocabulary seen by `_update_edges_batch`
+    _NAME_ORDER_CACHE: Optional[Tuple[List[str], List[str], np.ndarray]] = None
+
     @staticmethod
-    def initialize_stats(all_skills: List[str]) -> GraphStats:
+    def initialize_stats(all_skills: List[str], edge_memory_budget_mb: float = 0, edge_skill_ids: Optional[List[str]] = None) -> GraphStats:
         """!
         @brief Initializes the data structures required for graph construction.
         
@@ -30,6 +40,10 @@ class GraphBuilder:
         Pre-populates the `node_stats` dictionary for every skill in the taxonomy to ensure O(1) lookups.
         
         @param all_skills List of all valid skill identifiers.
+        @param edge_memory_budget_mb If > 0, edges are counted by a `SpillingEdgeCounter` bounded to this budget
+            instead of an in-memory dictionary.
+        @param edge_skill_ids If given, edges are counted on integer pairs over this vocabulary by a
+            `ColumnarEdgeCounter` (for `update_metrics_batch`) instead of an in-memory dictionary.
         @return GraphStats object containing initialized structures.
         """
         # Node Stats: { "skill_name": { "total": 0, "senior_count": 0, "managerial_count": 0 } }
@@ -39,7 +53,11 @@ class GraphBuilder:
         
 
         # Edge Counts: { ("skill_a", "skill_b"): { "total": 0, "senior_count": 0, "managerial_count": 0 } }
-        edge_counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+        edge_counts: Union[Dict[Tuple[str, str], Dict[str, int]], SpillingEdgeCounter, ColumnarEdgeCounter] = {}
+        if edge_memory_budget_mb > 0:
+            edge_counts = SpillingEdgeCounter.from_budget(edge_memory_budget_mb)
+        elif edge_skill_ids is not None:
+            edge_counts = ColumnarEdgeCounter(edge_skill_ids)
 
         seniority_dist: Counter = Counter()
 
@@ -49,7 +67,8 @@ class GraphBuilder:
     def update_metrics(
         stats: GraphStats,
         found_skills: List[str], 
-        level: str
+        level: str,
+        weight: float = 1
     ) -> None:
         """!
         @brief Updates the graph statistics with data from a single Job Description.
@@ -62,6 +81,7 @@ class GraphBuilder:
         @param stats The GraphStats object to update.
         @param found_skills List of skills found in the current JD.
         @param level The seniority level of the current JD (e.g., 'Senior', 'Managerial', 'Junior').
+        @param weight Amount added to every counter (e.g. a time-decay weight, see `TemporalStats`).
         """
         
         is_senior = level == "Senior" or level == "Managerial"
@@ -69,25 +89,177 @@ class GraphBuilder:
 
         # Update Node Stats
         for skill in found_skills:
-            stats.node_stats[skill]["total"] += 1
+            stats.node_stats[skill]["total"] += weight
             if is_senior:
-                stats.node_stats[skill]["senior_count"] += 1
+                stats.node_stats[skill]["senior_count"] += weight
             if is_managerial:
-                stats.node_stats[skill]["managerial_count"] += 1
+                stats.node_stats[skill]["managerial_count"] += weight
                 
         # Update Edge Stats (Co-occurrences)
+        GraphBuilder._update_edges(stats, found_skills, is_senior, is_managerial, weight)
+
+    @staticmethod
+    def _update_edges(stats: GraphStats, found_skills: List[str], is_senior: bool, is_managerial: bool, weight: float = 1) -> None:
+        """Increments the co-occurrence counter of every unique pair (clique) of found skills."""
         if len(found_skills) > 1:
             # Sort to ensure (A, B) is same as (B, A)
             sorted_skills: List[str] = sorted(found_skills)
+            if not isinstance(stats.edge_counts, dict):
+                for pair in itertools.combinations(sorted_skills, 2):
+                    stats.edge_counts.add(pair, weight, weight if is_senior else 0, weight if is_managerial else 0)
+                return
+
             for pair in itertools.combinations(sorted_skills, 2):
                 if pair not in stats.edge_counts:
                     stats.edge_counts[pair] = {"total": 0, "senior_count": 0, "managerial_count": 0}
                 
-                stats.edge_counts[pair]["total"] += 1
+                stats.edge_counts[pair]["total"] += weight
                 if is_senior:
-                    stats.edge_counts[pair]["senior_count"] += 1
+                    stats.edge_counts[pair]["senior_count"] += weight
                 if is_managerial:
-                    stats.edge_counts[pair]["managerial_count"] += 1
+                    stats.edge_counts[pair]["managerial_count"] += weight
+
+    @staticmethod
+    def update_metrics_batch(stats: GraphStats, matrix: SkillMatrix) -> None:
+        """!
+        @brief Folds a whole `SkillMatrix` batch into the graph statistics.
+        
+        @details
+        Equivalent to calling `update_metrics` once per row (and counting each row's level in `seniority_dist`).
+        Node counters are computed with one `np.bincount` per counter over the CSR arrays, and edges are
+        counted on skill-id pairs (see `_update_edges_batch`).
+        
+        @param stats The GraphStats object to update.
+        @param matrix Batch of extracted skills; `matrix.levels` is required.
+        """
+        if matrix.levels is None:
+            raise ValueError("SkillMatrix.levels is required to update seniority-split metrics.")
+
+        senior_codes = [SeniorityAnalyzer.LEVELS.index("Senior"), SeniorityAnalyzer.LEVELS.index("Managerial")]
+        is_senior_row = np.isin(matrix.levels, senior_codes)
+        is_managerial_row = matrix.levels == SeniorityAnalyzer.LEVELS.index("Managerial")
+
+        # Update Node Stats (vectorized)
+        row_ids = matrix.row_ids()
+        totals = np.bincount(matrix.indices, minlength=matrix.n_skills)
+        senior_counts = np.bincount(matrix.indices, weights=is_senior_row[row_ids], minlength=matrix.n_skills)
+        managerial_counts = np.bincount(matrix.indices, weights=is_managerial_row[row_ids], minlength=matrix.n_skills)
+
+        for skill_id in np.flatnonzero(totals):
+            node = stats.node_stats[matrix.skill_ids[skill_id]]
+            node["total"] += int(totals[skill_id])
+            node["senior_count"] += int(senior_counts[skill_id])
+            node["managerial_count"] += int(managerial_counts[skill_id])
+
+        # Update Seniority Distribution
+        codes, counts = np.unique(matrix.levels, return_counts=True)
+        for code, count in zip(codes, counts):
+            stats.seniority_dist[SeniorityAnalyzer.LEVELS[code]] += int(count)
+
+        # Update Edge Stats (Co-occurrences)
+        GraphBuilder._update_edges_batch(stats, matrix, is_senior_row, is_managerial_row)
+
+    @staticmethod
+    def _name_order(skill_ids: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Returns the skill names in name order and the rank of every skill id, cached for the last vocabulary."""
+        cached = GraphBuilder._NAME_ORDER_CACHE
+        if cached is None or cached[0] != skill_ids:
+            name_order = sorted(range(len(skill_ids)), key=skill_ids.__getitem__)
+            name_rank = np.empty(len(skill_ids), dtype=np.int64)
+            name_rank[name_order] = np.arange(len(skill_ids))
+            cached = GraphBuilder._NAME_ORDER_CACHE = (list(skill_ids), [skill_ids[skill_id] for skill_id in name_order], name_rank)
+        return cached[1], cached[2]
+
+    @staticmethod
+    def _update_edges_batch(stats: GraphStats, matrix: SkillMatrix, is_senior_row: np.ndarray, is_managerial_row: np.ndarray) -> None:
+        """!
+        @brief Clique counting of `update_metrics_batch` on integer skill ids.
+
+        @details Skill ids are replaced by their rank in name order and each row is sorted by rank, so the
+        pairs of a row come out as `(smaller name, larger name)` in `itertools.combinations` order. Rows of equal
+        length are expanded together with `np.triu_indices` into pair keys `rank * n_skills + rank`.
+        A `ColumnarEdgeCounter` takes the keys as they are; otherwise pairs are counted with `np.unique` /
+        `np.bincount`, names are looked up once per distinct pair, and new edges are inserted in order of
+        first occurrence, as the row-by-row `_update_edges` would.
+        """
+        lengths = np.diff(matrix.indptr)
+        pairs_per_row = lengths * (lengths - 1) // 2
+        if not pairs_per_row.any():
+            return
+
+        columnar = isinstance(stats.edge_counts, ColumnarEdgeCounter)
+        if columnar:
+            if stats.edge_counts.skill_ids != matrix.skill_ids:
+                raise ValueError("The SkillMatrix vocabulary differs from the one edges are counted on.")
+            name_rank = stats.edge_counts.name_ranks
+        else:
+            names, name_rank = GraphBuilder._name_order(matrix.skill_ids)
+        n_skills = matrix.n_skills
+        row_ids = matrix.row_ids()
+        ranks = name_rank[matrix.indices]
+        ranks = ranks[np.lexsort((ranks, row_ids))]
+        first_pair = np.concatenate([[0], np.cumsum(pairs_per_row)])
+
+        keys_chunks, sequence_chunks, row_chunks = [], [], []
+        for length in np.unique(lengths[lengths > 1]).tolist():
+            rows = np.flatnonzero(lengths == length)
+            block = ranks[matrix.indptr[rows][:, None] + np.arange(length)]
+            left, right = np.triu_indices(length, 1)
+            keys_chunks.append((block[:, left] * n_skills + block[:, right]).ravel())
+            sequence_chunks.append((first_pair[rows][:, None] + np.arange(len(left))).ravel())
+            row_chunks.append(np.repeat(rows, len(left)))
+
+        if columnar:
+            pair_rows = np.concatenate(row_chunks)
+            counts = np.stack([np.ones(len(pair_rows), dtype=np.int64), is_senior_row[pair_rows], is_managerial_row[pair_rows]], axis=1)
+            stats.edge_counts.add_columns(np.concatenate(keys_chunks), counts)
+            return
+
+        order = np.argsort(np.concatenate(sequence_chunks), kind="stable")
+        keys, pair_rows = np.concatenate(keys_chunks)[order], np.concatenate(row_chunks)[order]
+        unique_keys, first_seen, slots = np.unique(keys, return_index=True, return_inverse=True)
+        totals = np.bincount(slots, minlength=len(unique_keys))
+        senior_counts = np.bincount(slots, weights=is_senior_row[pair_rows], minlength=len(unique_keys)).astype(np.int64)
+        managerial_counts = np.bincount(slots, weights=is_managerial_row[pair_rows], minlength=len(unique_keys)).astype(np.int64)
+
+        by_first_seen = np.argsort(first_seen)
+        for key, total, senior_count, managerial_count in zip(
+                unique_keys[by_first_seen].tolist(), totals[by_first_seen].tolist(),
+                senior_counts[by_first_seen].tolist(), managerial_counts[by_first_seen].tolist()):
+            pair = (names[key // n_skills], names[key % n_skills])
+            if isinstance(stats.edge_counts, SpillingEdgeCounter):
+                stats.edge_counts.add(pair, total, senior_count, managerial_count)
+                continue
+            edge = stats.edge_counts.get(pair)
+            if edge is None:
+                edge = stats.edge_counts[pair] = {"total": 0, "senior_count": 0, "managerial_count": 0}
+            edge["total"] += total
+            edge["senior_count"] += senior_count
+            edge["managerial_count"] += managerial_count
+
+    @staticmethod
+    def merge_stats(target: GraphStats, source: GraphStats, scale: float = 1) -> None:
+        """!
+        @brief Adds the counters of `source` to `target`, multiplied by `scale` (e.g. rolling time buckets up into a window).
+
+        @param target Statistics updated in place (dictionary edge counts).
+        @param source Statistics to add; left unchanged.
+        @param scale Factor applied to every counter of `source`.
+        """
+        for skill, counts in source.node_stats.items():
+            if not counts["total"]:
+                continue
+            node = target.node_stats.setdefault(skill, {"total": 0, "senior_count": 0, "managerial_count": 0})
+            for key, value in counts.items():
+                node[key] += value * scale
+
+        for pair, counts in source.edge_counts.items():
+            edge = target.edge_counts.setdefault(pair, {"total": 0, "senior_count": 0, "managerial_count": 0})
+            for key, value in counts.items():
+                edge[key] += value * scale
+
+        for level, count in source.seniority_dist.items():
+            target.seniority_dist[level] += count * scale
 
     @staticmethod
     def prepare_nodes_list(
@@ -136,7 +308,7 @@ class GraphBuilder:
 
     @staticmethod
     def filter_edges(
-        edge_counts: Dict[Tuple[str, str], Dict[str, int]], 
+        edge_counts: Union[Dict[Tuple[str, str], Dict[str, int]], SpillingEdgeCounter], 
         active_node_ids: List[str],
         threshold: int
     ) -> Dict[Tuple[str, str], Dict[str, int]]:
@@ -145,6 +317,8 @@ class GraphBuilder:
         
         @details
         Ensures strict referential integrity; an edge cannot exist if one of its nodes has been filtered out.
+        The result is ordered by (source, target) so exports are identical whether edges were counted
+        in memory or by a `SpillingEdgeCounter` (whose merged counts are exact).
         
         @param edge_counts The raw edge statistics.
         @param active_node_ids List of valid node IDs that survived filtering.
@@ -159,4 +333,4 @@ class GraphBuilder:
             if src in active_node_set and tgt in active_node_set:
                 if stats["total"] >= threshold:
                     filtered_edge_counts[(src, tgt)] = stats
-        return filtered_edge_counts
+        return dict(sorted(filtered_edge_counts.items()))
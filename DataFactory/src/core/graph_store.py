@@ -0,0 +1,159 @@
+import json
+import os
+import sqlite3
+from typing import List, Dict, Any, Optional, Iterable
+
+class GraphStore:
+    """!
+    @brief Read-only SQLite copy of a universe, for pulling focused subgraphs without loading `universe.json`.
+
+    @details
+    Layout (see `build`):
+    -   `nodes(id PRIMARY KEY, grp, val, data)`: `data` is the node object exactly as exported.
+        The `(grp, id)` index answers group lookups without touching the table.
+    -   `adjacency(src, dst, weight, data)`: every link is stored in both directions in a `WITHOUT ROWID`
+        table keyed by `(src, dst)`, so a skill's neighbors sit on consecutive B-tree pages. The
+        `(src, weight DESC)` index (which also carries `dst`) serves top-weighted edges and minimum-weight
+        filters by reading only the qualifying entries.
+    -   `meta(key, value)`: the universe `meta` entries as JSON.
+
+    Queries return `{ "nodes": [...], "links": [...] }` in the universe format, so the UI can render them as is.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE nodes (id TEXT PRIMARY KEY, grp TEXT NOT NULL, val REAL NOT NULL, data TEXT NOT NULL) WITHOUT ROWID",
+        "CREATE INDEX nodes_by_group ON nodes (grp, id)",
+        "CREATE TABLE adjacency (src TEXT NOT NULL, dst TEXT NOT NULL, weight REAL NOT NULL, data TEXT NOT NULL, PRIMARY KEY (src, dst)) WITHOUT ROWID",
+        "CREATE INDEX adjacency_by_weight ON adjacency (src, weight DESC)",
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID",
+    )
+    # SQLite's default limit on bound parameters is 999 in older builds
+    MAX_PARAMETERS = 900
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "GraphStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ---- Building
+
+    @staticmethod
+    def build(universe: Dict[str, Any], path: str) -> None:
+        """!
+        @brief Writes `universe` (as returned by `Writer.save_universe`) to a new store at `path`.
+        @details The store is built in a temporary file and renamed, so readers never see a partial store.
+        """
+        temp_path = path + ".tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        connection = sqlite3.connect(temp_path)
+        try:
+            for statement in GraphStore.SCHEMA:
+                connection.execute(statement)
+            connection.executemany(
+                "INSERT INTO nodes VALUES (?, ?, ?, ?)",
+                ((node["id"], node.get("group", "Unknown"), node.get("val", 0), json.dumps(node, separators=(",", ":"))) for node in universe.get("nodes", [])))
+
+            def both_directions(links: Iterable[Dict[str, Any]]):
+                for link in links:
+                    data = json.dumps(link, separators=(",", ":"))
+                    yield link["source"], link["target"], link["value"], data
+                    yield link["target"], link["source"], link["value"], data
+
+            connection.executemany("INSERT INTO adjacency VALUES (?, ?, ?, ?)", both_directions(universe.get("links", [])))
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", ((key, json.dumps(value)) for key, value in universe.get("meta", {}).items()))
+            connection.commit()
+            connection.execute("ANALYZE")
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+        os.replace(temp_path, path)
+
+    # ---- Queries
+
+    def _chunks(self, values: List[str]) -> Iterable[List[str]]:
+        for start in range(0, len(values), self.MAX_PARAMETERS):
+            yield values[start:start + self.MAX_PARAMETERS]
+
+    def meta(self) -> Dict[str, Any]:
+        return {key: json.loads(value) for key, value in self._connection.execute("SELECT key, value FROM meta")}
+
+    def node(self, skill: str) -> Optional[Dict[str, Any]]:
+        row = self._connection.execute("SELECT data FROM nodes WHERE id = ?", (skill,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def nodes(self, skills: List[str]) -> List[Dict[str, Any]]:
+        """Node objects of `skills` (unknown ids are skipped), ordered by id."""
+        found: List[Dict[str, Any]] = []
+        for chunk in self._chunks(sorted(set(skills))):
+            placeholders = ",".join("?" * len(chunk))
+            found.extend(json.loads(data) for (data,) in self._connection.execute(f"SELECT data FROM nodes WHERE id IN ({placeholders}) ORDER BY id", chunk))
+        return found
+
+    def top_edges(self, skill: str, limit: int = 10, min_weight: float = 0) -> List[Dict[str, Any]]:
+        """!
+        @brief The `limit` heaviest links of `skill` (ties by neighbor id), read from the weight index.
+        """
+        rows = self._connection.execute(
+            "SELECT data FROM adjacency WHERE src = ? AND weight >= ? ORDER BY weight DESC, dst LIMIT ?",
+            (skill, min_weight, limit))
+        return [json.loads(data) for (data,) in rows]
+
+    def ego_network(self, skill: str, hops: int = 1, min_weight: float = 0, max_nodes: Optional[int] = None) -> Dict[str, Any]:
+        """!
+        @brief Nodes within `hops` links of weight >= `min_weight` from `skill`, and the links among them.
+
+        @details Expanded breadth-first, one indexed range scan per frontier node. With `max_nodes`,
+        expansion stops once that many nodes are reached (frontier nodes are visited heaviest link first).
+        @return `{ "nodes", "links" }`; empty if `skill` is unknown.
+        """
+        if self.node(skill) is None:
+            return {"nodes": [], "links": []}
+
+        visited: Dict[str, int] = {skill: 0}
+        frontier = [skill]
+        for hop in range(1, hops + 1):
+            next_frontier: List[str] = []
+            for source in frontier:
+                for (neighbor,) in self._connection.execute(
+                        "SELECT dst FROM adjacency WHERE src = ? AND weight >= ? ORDER BY weight DESC, dst", (source, min_weight)):
+                    if neighbor in visited:
+                        continue
+                    if max_nodes is not None and len(visited) >= max_nodes:
+                        break
+                    visited[neighbor] = hop
+                    next_frontier.append(neighbor)
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        return self._induced_subgraph(list(visited), min_weight)
+
+    def group_subgraph(self, group: str, min_weight: float = 0) -> Dict[str, Any]:
+        """!
+        @brief All nodes of `group` and the links of weight >= `min_weight` between them.
+        """
+        members = [skill for (skill,) in self._connection.execute("SELECT id FROM nodes WHERE grp = ? ORDER BY id", (group,))]
+        return self._induced_subgraph(members, min_weight)
+
+    def _induced_subgraph(self, skills: List[str], min_weight: float) -> Dict[str, Any]:
+        """Nodes `skills` and the links among them (each link once, in `(source, target)` order)."""
+        members = set(skills)
+        links: List[Dict[str, Any]] = []
+        for chunk in self._chunks(sorted(members)):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT dst, data FROM adjacency WHERE src IN ({placeholders}) AND dst > src AND weight >= ?", chunk + [min_weight])
+            # Each link is stored in both directions; `dst > src` keeps one copy, and only links to members are decoded
+            links.extend(json.loads(data) for neighbor, data in rows if neighbor in members)
+        links.sort(key=lambda link: (link["source"], link["target"]))
+        return {"nodes": self.nodes(skills), "links": links}
@@ -0,0 +1,217 @@
+import json
+import struct
+from typing import List, Dict, Iterable, Optional
+from utils.seniority_analyzer import SeniorityAnalyzer
+
+class InvertedIndex:
+    """!
+    @brief Skill -> JD postings and per-level JD bitmaps, for boolean queries without re-extraction.
+
+    @details
+    JDs are identified by their ordinal in the input corpus. While the analysis loop runs, `add` appends
+    the ordinal to each found skill's postings list and to the list of its seniority level (level bitmaps
+    are materialized from those lists on first use rather than grown bit by bit).
+
+    On disk (see `to_bytes`), each postings list is delta-encoded (gaps between sorted ordinals) and
+    written as LEB128 varints, so dense skills cost about one byte per posting. Level bitmaps are stored
+    as little-endian bit arrays.
+
+    Queries decode the postings they need into Python int bitsets (bit i = JD ordinal i), combine them
+    with `&`, `|` and `& ~`, and cache decoded sets so repeated queries are pure big-int operations.
+    """
+
+    MAGIC = b"CNII"
+    VERSION = 1
+
+    def __init__(self):
+        self.n_docs = 0
+        self._postings: Dict[str, List[int]] = {}
+        self._encoded: Dict[str, bytes] = {}
+        self._level_postings: Dict[str, List[int]] = {level: [] for level in SeniorityAnalyzer.LEVELS}
+        self._level_bits: Dict[str, int] = {}
+        self._bitset_cache: Dict[str, int] = {}
+
+    # ---- Building
+
+    def add(self, ordinal: int, skills: Iterable[str], level: str) -> None:
+        """!
+        @brief Records one JD. Ordinals must be added in increasing order.
+        """
+        for skill in set(skills):
+            self._postings.setdefault(skill, []).append(ordinal)
+            self._encoded.pop(skill, None)
+        self._level_postings.setdefault(level, []).append(ordinal)
+        self._level_bits.pop(level, None)
+        self._bitset_cache.clear()
+        self.n_docs = max(self.n_docs, ordinal + 1)
+
+    @staticmethod
+    def encode_postings(ordinals: List[int]) -> bytes:
+        """Delta + LEB128 varint encoding of a sorted ordinal list."""
+        out = bytearray()
+        previous = 0
+        for ordinal in ordinals:
+            gap = ordinal - previous
+            previous = ordinal
+            while gap >= 0x80:
+                out.append((gap & 0x7F) | 0x80)
+                gap >>= 7
+            out.append(gap)
+        return bytes(out)
+
+    @staticmethod
+    def decode_postings(data: bytes) -> List[int]:
+        """Inverse of `encode_postings`."""
+        ordinals: List[int] = []
+        value = 0
+        shift = 0
+        previous = 0
+        for byte in data:
+            value |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            previous += value
+            ordinals.append(previous)
+            value = 0
+            shift = 0
+        return ordinals
+
+    # ---- Serialization
+
+    def to_bytes(self) -> bytes:
+        """!
+        @brief Serializes the index: magic, version, JSON header length, JSON header, postings blob, level bitmaps.
+        """
+        blob = bytearray()
+        skills: Dict[str, List[int]] = {}
+        for skill in sorted(set(self._postings) | set(self._encoded)):
+            encoded = self._encoded_postings(skill)
+            skills[skill] = [len(blob), len(encoded), self.document_frequency(skill)]
+            blob.extend(encoded)
+
+        levels: Dict[str, List[int]] = {}
+        bitmap_bytes = (self.n_docs + 7) // 8
+        for level in sorted(set(self._level_postings) | set(self._level_bits)):
+            levels[level] = [len(blob), bitmap_bytes]
+            blob.extend(self.level_bitset(level).to_bytes(bitmap_bytes, "little"))
+
+        header = json.dumps({"docs": self.n_docs, "skills": skills, "levels": levels}, separators=(",", ":")).encode("utf-8")
+        return self.MAGIC + struct.pack("<BI", self.VERSION, len(header)) + header + bytes(blob)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "InvertedIndex":
+        """!
+        @brief Loads an index written by `to_bytes`. Postings stay encoded until a query needs them.
+        @throws ValueError If the data is not an inverted index of a supported version.
+        """
+        if data[:4] != InvertedIndex.MAGIC:
+            raise ValueError("Not an inverted index file.")
+        version, header_length = struct.unpack_from("<BI", data, 4)
+        if version != InvertedIndex.VERSION:
+            raise ValueError(f"Unsupported inverted index version {version}.")
+
+        start = 4 + struct.calcsize("<BI")
+        header = json.loads(data[start:start + header_length].decode("utf-8"))
+        blob = memoryview(data)[start + header_length:]
+
+        index = InvertedIndex()
+        index.n_docs = header["docs"]
+        index._encoded = {skill: bytes(blob[offset:offset + length]) for skill, (offset, length, _) in header["skills"].items()}
+        index._level_bits = {level: int.from_bytes(blob[offset:offset + length], "little") for level, (offset, length) in header["levels"].items()}
+        return index
+
+    # ---- Queries
+
+    def _encoded_postings(self, skill: str) -> bytes:
+        if skill not in self._encoded:
+            self._encoded[skill] = self.encode_postings(self._postings.get(skill, []))
+        return self._encoded[skill]
+
+    def skills(self) -> List[str]:
+        return sorted(set(self._postings) | set(self._encoded))
+
+    def postings(self, skill: str) -> List[int]:
+        """Returns the sorted JD ordinals mentioning `skill`."""
+        if skill in self._postings:
+            return list(self._postings[skill])
+        return self.decode_postings(self._encoded.get(skill, b""))
+
+    def document_frequency(self, skill: str) -> int:
+        if skill in self._postings:
+            return len(self._postings[skill])
+        return len(self.postings(skill))
+
+    def bitset(self, skill: str) -> int:
+        """Returns the postings of `skill` as an int bitset (cached)."""
+        cached = self._bitset_cache.get(skill)
+        if cached is None:
+            cached = self.ordinals_to_bits(self.postings(skill), self.n_docs)
+            self._bitset_cache[skill] = cached
+        return cached
+
+    def level_bitset(self, level: str) -> int:
+        """Returns the JDs detected at `level` as an int bitset."""
+        if level not in self._level_bits:
+            self._level_bits[level] = self.ordinals_to_bits(self._level_postings.get(level, []), self.n_docs)
+        return self._level_bits[level]
+
+    def query_bitset(
+        self,
+        all_of: Optional[Iterable[str]] = None,
+        any_of: Optional[Iterable[str]] = None,
+        none_of: Optional[Iterable[str]] = None,
+        levels: Optional[Iterable[str]] = None
+    ) -> int:
+        """!
+        @brief Evaluates `AND(all_of) & OR(any_of) & ~OR(none_of) & OR(levels)` as an int bitset.
+
+        @details Omitted clauses do not constrain the result.
+        """
+        result = (1 << self.n_docs) - 1
+        for skill in all_of or ():
+            result &= self.bitset(skill)
+        if any_of:
+            union = 0
+            for skill in any_of:
+                union |= self.bitset(skill)
+            result &= union
+        for skill in none_of or ():
+            result &= ~self.bitset(skill)
+        if levels:
+            level_union = 0
+            for level in levels:
+                level_union |= self.level_bitset(level)
+            result &= level_union
+        return result
+
+    def query(self, **clauses) -> List[int]:
+        """!
+        @brief Returns the JD ordinals matching the clauses of `query_bitset`.
+
+        @details e.g. `index.query(all_of=["kafka", "flink"], levels=["Senior"])`.
+        """
+        return self.bits_to_ordinals(self.query_bitset(**clauses))
+
+    def count(self, **clauses) -> int:
+        """Number of JDs matching the clauses of `query_bitset`."""
+        return self.query_bitset(**clauses).bit_count()
+
+    @staticmethod
+    def ordinals_to_bits(ordinals: Iterable[int], n_docs: int) -> int:
+        """Packs ordinals into an int bitset through a bytearray (linear, unlike repeated `|= 1 << i`)."""
+        bitmap = bytearray((n_docs + 7) // 8)
+        for ordinal in ordinals:
+            bitmap[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(bitmap, "little")
+
+    @staticmethod
+    def bits_to_ordinals(bits: int) -> List[int]:
+        ordinals: List[int] = []
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        for byte_index, byte in enumerate(data):
+            while byte:
+                low = byte & -byte
+                ordinals.append(byte_index * 8 + low.bit_length() - 1)
+                byte ^= low
+        return ordinals
@@ -0,0 +1,252 @@
+from __future__ import annotations
+import os
+import json
+import hashlib
+import importlib.util
+from typing import List, Dict, Any, Iterable, Optional, Sequence
+from core.skill_matrix import SkillMatrix
+from utils.lazy_import import lazy_import
+from utils.logger import get_logger
+
+np = lazy_import("numpy")
+logger = get_logger(__name__)
+
+class JDRecordWriter:
+    """!
+    @brief Streams per-JD analysis results to a columnar dataset while the analysis loop runs.
+
+    @details
+    One record per JD: `ordinal` (position in the corpus), `hash` (first 8 bytes of the text's sha1 as uint64,
+    i.e. `TemporalStats.fingerprint` as an integer), `title`, seniority `score`, `level` (code into `levels`)
+    and `skills` (sorted interned skill ids, see `TaxonomyManager.get_skill_ids`).
+
+    Rows are buffered and written every `row_group_size` JDs as one part file of `directory`:
+    -   **parquet** (when pyarrow is installed): `part-NNNNN.parquet`, `skills` as a `list<int32>` column.
+    -   **npz** (numpy fallback): `part-NNNNN.npz`, compressed, one member per array; strings as a UTF-8 blob
+        plus offsets and `skills` in CSR form (`skills_indptr`, `skills_indices`).
+    `close` writes `manifest.json` (vocabulary, levels, part files) last; `JDRecords` reads only the columns asked for.
+
+    The writer pickles with its pending rows and the parts written so far, so it is checkpointed with the run;
+    `start` then drops the part files written after the checkpoint.
+    """
+
+    MANIFEST = "manifest.json"
+    FORMAT = "careernavigator-jd-records"
+    VERSION = 1
+    COLUMNS = ("ordinal", "hash", "title", "score", "level", "skills")
+
+    def __init__(self, directory: str, skill_index: Dict[str, int], levels: Sequence[str], row_group_size: int = 50000, fmt: str = "auto"):
+        """!
+        @param fmt "parquet", "npz" or "auto" (parquet when pyarrow is installed).
+        @throws ValueError for an unknown format, or "parquet" without pyarrow.
+        """
+        if fmt == "auto":
+            fmt = "parquet" if importlib.util.find_spec("pyarrow") is not None else "npz"
+        elif fmt == "parquet" and importlib.util.find_spec("pyarrow") is None:
+            raise ValueError("The parquet JD record format requires pyarrow.")
+        elif fmt != "npz":
+            raise ValueError(f"Unknown JD record format '{fmt}'.")
+        self.directory = directory
+        self.format = fmt
+        self.skill_index = skill_index
+        self.levels = list(levels)
+        self.row_group_size = max(1, row_group_size)
+        self.parts: List[Dict[str, Any]] = []
+        self.n_rows = 0
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        self._ordinals: List[int] = []
+        self._hashes: List[int] = []
+        self._titles: List[str] = []
+        self._scores: List[float] = []
+        self._levels: List[int] = []
+        self._skills: List[List[int]] = []
+
+    def start(self) -> None:
+        """Creates `directory` and removes the part files and manifest this writer did not write (previous or interrupted runs)."""
+        os.makedirs(self.directory, exist_ok=True)
+        kept = {part["file"] for part in self.parts}
+        for name in os.listdir(self.directory):
+            if name == self.MANIFEST or (name.startswith("part-") and name not in kept):
+                os.remove(os.path.join(self.directory, name))
+
+    def add(self, ordinal: int, jd_text: str, title: str, score: float, level: str, skills: Iterable[str]) -> None:
+        self._ordinals.append(ordinal)
+        self._hashes.append(int.from_bytes(hashlib.sha1(jd_text.encode("utf-8")).digest()[:8], "big"))
+        self._titles.append(title)
+        self._scores.append(score)
+        self._levels.append(self.levels.index(level))
+        self._skills.append(sorted({self.skill_index[skill] for skill in skills}))
+        if len(self._ordinals) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered rows as the next part file."""
+        if not self._ordinals:
+            return
+        matrix = SkillMatrix.from_rows(self._skills, [])
+        columns = {
+            "ordinal": np.asarray(self._ordinals, dtype=np.int64),
+            "hash": np.asarray(self._hashes, dtype=np.uint64),
+            "score": np.asarray(self._scores, dtype=np.float64),
+            "level": np.asarray(self._levels, dtype=np.int8)
+        }
+        name = f"part-{len(self.parts):05d}.{self.format}"
+        path = os.path.join(self.directory, name)
+        temp_path = path + ".tmp"
+        if self.format == "parquet":
+            JDRecordWriter._write_parquet(temp_path, columns, self._titles, matrix)
+        else:
+            encoded = [title.encode("utf-8") for title in self._titles]
+            with open(temp_path, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    **columns,
+                    title_offsets=np.cumsum([0] + [len(title) for title in encoded], dtype=np.int64),
+                    title_bytes=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+                    skills_indptr=matrix.indptr,
+                    skills_indices=matrix.indices)
+        os.replace(temp_path, path)
+
+        self.parts.append({"file": name, "rows": len(self._ordinals), "firstOrdinal": self._ordinals[0]})
+        self.n_rows += len(self._ordinals)
+        self._reset_buffer()
+
+    @staticmethod
+    def _write_parquet(path: str, columns: Dict[str, Any], titles: List[str], matrix: SkillMatrix) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.table({
+            "ordinal": pa.array(columns["ordinal"]),
+            "hash": pa.array(columns["hash"]),
+            "title": pa.array(titles, type=pa.string()),
+            "score": pa.array(columns["score"]),
+            "level": pa.array(columns["level"]),
+            "skills": pa.ListArray.from_arrays(pa.array(matrix.indptr, type=pa.int32()), pa.array(matrix.indices, type=pa.int32()))
+        })
+        pq.write_table(table, path, compression="zstd")
+
+    def close(self) -> str:
+        """!
+        @brief Writes the pending rows and `manifest.json`.
+        @return The manifest path.
+        """
+        self.flush()
+        manifest = {
+            "format": self.FORMAT,
+            "version": self.VERSION,
+            "storage": self.format,
+            "rows": self.n_rows,
+            "columns": list(self.COLUMNS),
+            "levels": self.levels,
+            "skillIds": sorted(self.skill_index, key=self.skill_index.get),
+            "parts": self.parts
+        }
+        path = os.path.join(self.directory, self.MANIFEST)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        logger.info(f"JD records: {self.n_rows} rows in {len(self.parts)} {self.format} parts under {self.directory}.")
+        return path
+
+class JDRecords:
+    """!
+    @brief Column-selective reader of a dataset written by `JDRecordWriter`.
+
+    @details `read(["level", "skills"])` decodes only those columns of each part (npz members and parquet
+    columns are stored separately). Columns come back as numpy arrays: `hash` uint64, `title` an object array
+    of str, `level` int8 codes into `levels`, and `skills` a `SkillMatrix` over `skill_ids`.
+    """
+
+    def __init__(self, directory: str):
+        """!
+        @throws ValueError if `directory` holds no JD record manifest of a supported version.
+        """
+        try:
+            with open(os.path.join(directory, JDRecordWriter.MANIFEST), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise ValueError(f"No JD records in {directory}: {e}")
+        if manifest.get("format") != JDRecordWriter.FORMAT or manifest.get("version") != JDRecordWriter.VERSION:
+            raise ValueError(f"Unsupported JD records in {directory}.")
+        self.directory = directory
+        self.manifest = manifest
+
+    @property
+    def n_rows(self) -> int:
+        return self.manifest["rows"]
+
+    @property
+    def levels(self) -> List[str]:
+        return self.manifest["levels"]
+
+    @property
+    def skill_ids(self) -> List[str]:
+        return self.manifest["skillIds"]
+
+    def read(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """!
+        @brief Loads `columns` (all by default) of every part, concatenated in corpus order.
+        @throws ValueError for an unknown column.
+        """
+        columns = list(columns) if columns is not None else list(JDRecordWriter.COLUMNS)
+        unknown = set(columns) - set(JDRecordWriter.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown JD record columns: {sorted(unknown)}")
+
+        chunks: Dict[str, List[Any]] = {column: [] for column in columns}
+        for part in self.manifest["parts"]:
+            path = os.path.join(self.directory, part["file"])
+            part_columns = self._read_parquet(path, columns) if self.manifest["storage"] == "parquet" else self._read_npz(path, columns)
+            for column in columns:
+                chunks[column].append(part_columns[column])
+
+        result: Dict[str, Any] = {}
+        for column in columns:
+            if column == "skills":
+                result[column] = JDRecords._concat_skills(chunks[column], self.skill_ids)
+            elif column == "title":
+                result[column] = np.concatenate(chunks[column]) if chunks[column] else np.empty(0, dtype=object)
+            else:
+                result[column] = np.concatenate(chunks[column]) if chunks[column] else np.empty(0)
+        return result
+
+    @staticmethod
+    def _concat_skills(parts: List[Any], skill_ids: List[str]) -> SkillMatrix:
+        indptr_parts = [np.zeros(1, dtype=np.int64)]
+        offset = 0
+        for indptr, _ in parts:
+            indptr_parts.append(indptr[1:].astype(np.int64) + offset)
+            offset += int(indptr[-1])
+        indices = np.concatenate([indices for _, indices in parts]).astype(np.int32) if parts else np.empty(0, dtype=np.int32)
+        return SkillMatrix(indptr=np.concatenate(indptr_parts), indices=indices, skill_ids=skill_ids)
+
+    @staticmethod
+    def _read_npz(path: str, columns: List[str]) -> Dict[str, Any]:
+        part: Dict[str, Any] = {}
+        with np.load(path) as data:
+            for column in columns:
+                if column == "skills":
+                    part[column] = (data["skills_indptr"], data["skills_indices"])
+                elif column == "title":
+                    offsets, blob = data["title_offsets"], data["title_bytes"].tobytes()
+                    part[column] = np.array([blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)], dtype=object)
+                else:
+                    part[column] = data[column]
+        return part
+
+    @staticmethod
+    def _read_parquet(path: str, columns: List[str]) -> Dict[str, Any]:
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, columns=columns)
+        part: Dict[str, Any] = {}
+        for column in columns:
+            array = table.column(column).combine_chunks()
+            if column == "skills":
+                offsets = array.offsets.to_numpy()
+                part[column] = (offsets - offsets[0], array.flatten().to_numpy())
+            elif column == "title":
+                part[column] = array.to_numpy(zero_copy_only=False).astype(object)
+            else:
+                part[column] = array.to_numpy()
+        return part
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional
+from core.adjacency import AdjacencyMatrix
+from utils.logger import get_logger
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+logger = get_logger(__name__)
+
+class ForceLayout:
+    """!
+    @brief Deterministic force-directed (Fruchterman-Reingold) 2D layout of the skill graph.
+
+    @details
+    Each iteration applies:
+    -   Attraction along every edge, `d^2 / K` scaled by the edge weight relative to the mean weight.
+    -   Repulsion between nodes, `K^2 / d`. Exact (all pairs, in row chunks) up to `exact_threshold` nodes.
+        Above it, nodes are binned into a uniform grid: each node is repelled exactly by the nodes in its
+        own cell and by every other cell as a single mass at its centroid (a one-level Barnes-Hut
+        approximation), which costs O(n x cells) instead of O(n^2).
+    -   A weak pull towards the origin so disconnected components stay in view.
+    Moves are capped by a temperature that cools linearly to zero.
+
+    Runs are deterministic for a given seed. When previous coordinates are supplied (warm start), known
+    nodes keep them, new nodes start at the centroid of their placed neighbors, and the run starts cold
+    (small temperature) so the existing picture stays stable and converges in a few iterations.
+    """
+
+    # Natural edge length in output units
+    K = 10.0
+    GRAVITY = 0.01
+
+    @staticmethod
+    def compute(
+        adjacency: AdjacencyMatrix,
+        seed: int = 42,
+        iterations: int = 300,
+        initial_positions: Optional[Dict[str, Tuple[float, float]]] = None,
+        exact_threshold: int = 2000,
+        chunk_size: int = 1024
+    ) -> np.ndarray:
+        """!
+        @brief Computes node coordinates.
+
+        @param adjacency Graph to lay out (see `AdjacencyMatrix.from_edges`).
+        @param seed Seed for the initial placement.
+        @param iterations Number of force iterations.
+        @param initial_positions Optional `{ node_id: (x, y) }` from a previous run (warm start).
+        @param exact_threshold Largest node count that uses exact all-pairs repulsion.
+        @param chunk_size Rows processed at once by the repulsion passes (bounds memory to chunk x n).
+        @return Array of shape (n, 2) aligned with `adjacency.node_ids`, centered on the origin.
+        """
+        n = adjacency.n_nodes
+        if n == 0:
+            return np.zeros((0, 2))
+
+        K = ForceLayout.K
+        rng = np.random.default_rng(seed)
+        extent = K * np.sqrt(n)
+        positions = rng.uniform(-extent / 2, extent / 2, size=(n, 2))
+        temperature = extent / 10
+
+        warm = ForceLayout._apply_warm_start(adjacency, positions, initial_positions, rng)
+        if warm:
+            temperature = K
+
+        rows = adjacency.row_ids()
+        cols = adjacency.indices
+        strength = adjacency.weights / adjacency.weights.mean() if len(adjacency.weights) else adjacency.weights
+
+        for iteration in range(iterations):
+            if n <= exact_threshold:
+                displacement = ForceLayout._repulsion_exact(positions, chunk_size)
+            else:
+                displacement = ForceLayout._repulsion_grid(positions, chunk_size)
+
+            # Attraction: every edge is stored for both endpoints, so each row pulls its own node
+            delta = positions[rows] - positions[cols]
+            distance = np.maximum(np.sqrt((delta ** 2).sum(axis=1)), 1e-3)
+            pull = (distance / K) * strength
+            displacement[:, 0] -= np.bincount(rows, delta[:, 0] * pull, n)
+            displacement[:, 1] -= np.bincount(rows, delta[:, 1] * pull, n)
+
+            displacement -= ForceLayout.GRAVITY * positions
+
+            length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+            step = np.minimum(length, temperature) / length
+            positions += displacement * step[:, None]
+            temperature *= 1 - 1 / (iterations - iteration)
+
+        return positions - positions.mean(axis=0)
+
+    @staticmethod
+    def _apply_warm_start(
+        adjacency: AdjacencyMatrix,
+        positions: np.ndarray,
+        initial_positions: Optional[Dict[str, Tuple[float, float]]],
+        rng: np.random.Generator
+    ) -> bool:
+        """Copies known coordinates in place and seeds new nodes near their placed neighbors."""
+        if not initial_positions:
+            return False
+
+        known = np.zeros(adjacency.n_nodes, dtype=bool)
+        for i, node_id in enumerate(adjacency.node_ids):
+            if node_id in initial_positions:
+                positions[i] = initial_positions[node_id]
+                known[i] = True
+        if not known.any():
+            return False
+
+        for i in np.flatnonzero(~known):
+            placed = [j for j in adjacency.neighbors(i) if known[j]]
+            if placed:
+                positions[i] = positions[placed].mean(axis=0) + rng.normal(0, ForceLayout.K / 2, 2)
+
+        logger.debug(f"Layout warm start: {int(known.sum())}/{adjacency.n_nodes} nodes reuse previous coordinates.")
+        return True
+
+    @staticmethod
+    def _repulsion_exact(positions: np.ndarray, chunk_size: int) -> np.ndarray:
+        """All-pairs `K^2 / d` repulsion, computed in row chunks."""
+        K2 = ForceLayout.K ** 2
+        displacement = np.zeros_like(positions)
+        for start in range(0, len(positions), chunk_size):
+            delta = positions[start:start + chunk_size, None, :] - positions[None, :, :]
+            distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-6)
+            displacement[start:start + chunk_size] = (delta * (K2 / distance2)[:, :, None]).sum(axis=1)
+        return displacement
+
+    @staticmethod
+    def _repulsion_grid(positions: np.ndarray, chunk_size: int) -> np.ndarray:
+        """Grid-approximated repulsion: exact within a node's cell, cell centroids for everything else."""
+        K2 = ForceLayout.K ** 2
+        n = len(positions)
+        grid = max(2, int(np.ceil(np.sqrt(2 * np.sqrt(n)))))
+
+        low = positions.min(axis=0)
+        cell_size = np.maximum((positions.max(axis=0) - low) / grid, 1e-9)
+        cell_xy = np.minimum(((positions - low) / cell_size).astype(np.int64), grid - 1)
+        cell = cell_xy[:, 0] * grid + cell_xy[:, 1]
+
+        n_cells = grid * grid
+        counts = np.bincount(cell, minlength=n_cells).astype(np.float64)
+        centroids = np.zeros((n_cells, 2))
+        occupied = counts > 0
+        centroids[occupied, 0] = np.bincount(cell, positions[:, 0], n_cells)[occupied] / counts[occupied]
+        centroids[occupied, 1] = np.bincount(cell, positions[:, 1], n_cells)[occupied] / counts[occupied]
+        occupied_cells = np.flatnonzero(occupied)
+
+        displacement = np.zeros_like(positions)
+
+        # Far field: every other occupied cell acts as one mass at its centroid
+        for start in range(0, n, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            delta = positions[chunk, None, :] - centroids[None, occupied_cells, :]
+            distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-6)
+            magnitude = counts[occupied_cells][None, :] * K2 / distance2
+            magnitude[cell[chunk, None] == occupied_cells[None, :]] = 0.0
+            displacement[chunk] = (delta * magnitude[:, :, None]).sum(axis=1)
+
+        # Near field: exact pairs inside each cell
+        order = np.argsort(cell, kind="stable")
+        boundaries = np.flatnonzero(np.diff(cell[order])) + 1
+        for members in np.split(order, boundaries):
+            if len(members) > 1:
+                displacement[members] += ForceLayout._repulsion_exact(positions[members], chunk_size)
+
+        return displacement
+
+    @staticmethod
+    def to_dict(node_ids: List[str], positions: np.ndarray) -> Dict[str, Tuple[float, float]]:
+        """Maps node ids to rounded `(x, y)` tuples for export."""
+        return {node_id: (round(float(x), 2), round(float(y), 2)) for node_id, (x, y) in zip(node_ids, positions)}
@@ -0,0 +1,70 @@
+import heapq
+from typing import List, Dict, Tuple, Any
+
+class NeighborIndex:
+    """!
+    @brief Precomputes per-skill top-k neighbor lists from the filtered edge set.
+
+    @details
+    `BridgeEngine.SuggestBridges` and `GapAnalyzer.AnalyzeGap` (C#) walk the adjacency list and sort
+    candidates on every request. The factory already holds every edge weight, so it ranks each active
+    skill's neighbors once and exports them, turning serving-time suggestions into lookups.
+
+    Every skill gets three rankings, each a list of `[neighborId, score]` pairs (best first, ties by id):
+    -   `byWeight`: raw co-occurrence count (`link.Value`).
+    -   `byLift`: `P(a, b) / (P(a) * P(b))` from `EdgeScorer.score_edges`, i.e. how much more often the
+        pair co-occurs than chance. Favors specific companions over ubiquitous skills like "git".
+    -   `byRelevance`: `link.Value`, multiplied by `SENIOR_BOOST` when the neighbor `isSenior`.
+        This mirrors the BridgeEngine boost for profiles whose level is not "Senior"
+        (for Senior profiles the boost does not apply and `byWeight` is the matching order).
+    """
+
+    # Same factor BridgeEngine applies to senior neighbors for non-senior profiles
+    SENIOR_BOOST = 1.5
+
+    @staticmethod
+    def build(
+        nodes_list: List[Dict[str, Any]],
+        edge_counts: Dict[Tuple[str, str], Dict[str, int]],
+        edge_scores: Dict[Tuple[str, str], Dict[str, float]],
+        k: int = 10
+    ) -> Dict[str, Dict[str, List[List[Any]]]]:
+        """!
+        @brief Ranks the neighbors of every active skill.
+
+        @param nodes_list Final node objects (see `GraphBuilder.prepare_nodes_list`).
+        @param edge_counts Filtered edge statistics (see `GraphBuilder.filter_edges`).
+        @param edge_scores Statistical edge scores (see `EdgeScorer.score_edges`).
+        @param k Number of neighbors kept per ranking.
+        @return `{ skill: { "byWeight": [[id, value], ...], "byLift": [...], "byRelevance": [...] } }`.
+        """
+        node_index: Dict[str, Dict[str, Any]] = {node["id"]: node for node in nodes_list}
+
+        # Adjacency: { skill: [(neighbor, value, lift, relevance), ...] }
+        adjacency: Dict[str, List[Tuple[str, int, float, float]]] = {skill: [] for skill in node_index}
+        for (src, tgt), stats in edge_counts.items():
+            if src not in node_index or tgt not in node_index:
+                continue
+            value: int = stats["total"]
+            lift: float = edge_scores[(src, tgt)]["lift"]
+            boost_tgt = NeighborIndex.SENIOR_BOOST if node_index[tgt]["isSenior"] else 1.0
+            boost_src = NeighborIndex.SENIOR_BOOST if node_index[src]["isSenior"] else 1.0
+            adjacency[src].append((tgt, value, lift, value * boost_tgt))
+            adjacency[tgt].append((src, value, lift, value * boost_src))
+
+        index: Dict[str, Dict[str, List[List[Any]]]] = {}
+        for skill, neighbors in adjacency.items():
+            if not neighbors:
+                continue
+            index[skill] = {
+                "byWeight": NeighborIndex._top_k(neighbors, 1, k),
+                "byLift": NeighborIndex._top_k(neighbors, 2, k),
+                "byRelevance": NeighborIndex._top_k(neighbors, 3, k)
+            }
+        return index
+
+    @staticmethod
+    def _top_k(neighbors: List[Tuple[str, int, float, float]], column: int, k: int) -> List[List[Any]]:
+        """Selects the k best neighbors by `column` in O(n log k), breaking ties by id."""
+        best = heapq.nsmallest(k, neighbors, key=lambda item: (-item[column], item[0]))
+        return [[item[0], item[column]] for item in best]
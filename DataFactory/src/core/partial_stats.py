@@ -0,0 +1,122 @@
+import hashlib
+from typing import List, Dict, Any
+from core.graph_engine import GraphStats
+
+class PartialStats:
+    """!
+    @brief Portable per-shard `GraphStats` documents, for splitting one corpus over several machines.
+
+    @details
+    A sharded run is a map/reduce over plain files:
+    -   **Map**: each worker keeps only the JDs whose `shard_of` equals its shard index, accumulates
+        `GraphStats` as usual, and writes them with `to_document` (gzip JSON, see `Writer.save_partial_stats`).
+    -   **Reduce**: any number of partial documents are summed into fresh `GraphStats` with `merge_into`,
+        then finalized exactly like a single-machine run.
+
+    Counters are plain sums, so the merged stats are identical to a single pass over the same input
+    whatever the shard count. Only non-zero node counters are stored; the reducer re-initializes every
+    skill from the taxonomy, which also preserves the node order of a single run.
+
+    Document layout (`version` 1):
+
+        {
+            "format": "careernavigator-partial-stats", "version": 1,
+            "shard": 0, "numShards": 4, "totalJobs": 1234,
+            "nodeStats": { skill: [total, senior_count, managerial_count] },
+            "edgeCounts": [[source, target, total, senior_count, managerial_count], ...],
+            "seniorityDist": { level: count }
+        }
+    """
+
+    FORMAT = "careernavigator-partial-stats"
+    VERSION = 1
+
+    @staticmethod
+    def shard_of(jd_text: str, num_shards: int) -> int:
+        """!
+        @brief Deterministic shard of a JD: SHA-1 of its text modulo `num_shards`.
+        @details Unlike `hash()`, the result does not depend on the interpreter's hash seed, so every worker agrees.
+        """
+        digest = hashlib.sha1(jd_text.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % num_shards
+
+    @staticmethod
+    def to_document(stats: GraphStats, total_jobs: int, shard: int = 0, num_shards: int = 1) -> Dict[str, Any]:
+        """!
+        @brief Serializes the raw counters of one shard.
+
+        @param stats The shard's accumulated statistics (a `SpillingEdgeCounter` or `ColumnarEdgeCounter` is streamed in pair order).
+        @param total_jobs Number of JDs processed by the shard.
+        @param shard Index of the shard.
+        @param num_shards Total number of shards.
+        @return The partial document.
+        """
+        edge_items = sorted(stats.edge_counts.items()) if isinstance(stats.edge_counts, dict) else stats.edge_counts.items()
+        return {
+            "format": PartialStats.FORMAT,
+            "version": PartialStats.VERSION,
+            "shard": shard,
+            "numShards": num_shards,
+            "totalJobs": total_jobs,
+            "nodeStats": {
+                skill: [counts["total"], counts["senior_count"], counts["managerial_count"]]
+                for skill, counts in stats.node_stats.items()
+                if counts["total"]
+            },
+            "edgeCounts": [
+                [source, target, counts["total"], counts["senior_count"], counts["managerial_count"]]
+                for (source, target), counts in edge_items
+            ],
+            "seniorityDist": dict(stats.seniority_dist)
+        }
+
+    @staticmethod
+    def validate(document: Dict[str, Any]) -> None:
+        """!
+        @brief Checks that `document` is a partial of a supported version.
+        @throws ValueError Otherwise.
+        """
+        if document.get("format") != PartialStats.FORMAT:
+            raise ValueError("Not a partial stats document.")
+        if document.get("version") != PartialStats.VERSION:
+            raise ValueError(f"Unsupported partial stats version {document.get('version')}.")
+
+    @staticmethod
+    def merge_into(stats: GraphStats, document: Dict[str, Any]) -> int:
+        """!
+        @brief Adds the counters of one partial document to `stats`.
+
+        @param stats Target statistics, initialized from the taxonomy (see `GraphBuilder.initialize_stats`).
+        @param document A partial written by `to_document`.
+        @return The number of JDs the partial covers.
+        @throws ValueError If the document is invalid.
+        """
+        PartialStats.validate(document)
+
+        for skill, (total, senior_count, managerial_count) in document["nodeStats"].items():
+            node = stats.node_stats.setdefault(skill, {"total": 0, "senior_count": 0, "managerial_count": 0})
+            node["total"] += total
+            node["senior_count"] += senior_count
+            node["managerial_count"] += managerial_count
+
+        if not isinstance(stats.edge_counts, dict):
+            for source, target, total, senior_count, managerial_count in document["edgeCounts"]:
+                stats.edge_counts.add((source, target), total, senior_count, managerial_count)
+        else:
+            for source, target, total, senior_count, managerial_count in document["edgeCounts"]:
+                edge = stats.edge_counts.setdefault((source, target), {"total": 0, "senior_count": 0, "managerial_count": 0})
+                edge["total"] += total
+                edge["senior_count"] += senior_count
+                edge["managerial_count"] += managerial_count
+
+        stats.seniority_dist.update(document["seniorityDist"])
+        return document["totalJobs"]
+
+    @staticmethod
+    def missing_shards(documents: List[Dict[str, Any]]) -> List[int]:
+        """!
+        @brief Lists the shard indices absent from `documents` (according to their declared `numShards`).
+        """
+        num_shards = max((document["numShards"] for document in documents), default=0)
+        present = {document["shard"] for document in documents}
+        return [shard for shard in range(num_shards) if shard not in present]
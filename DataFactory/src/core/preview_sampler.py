@@ -0,0 +1,146 @@
+import math
+import random
+from statistics import NormalDist
+from typing import List, Dict, Tuple, Iterable, TypeVar
+from collections import Counter
+from core.graph_engine import GraphStats
+from core.edge_accumulator import SpillingEdgeCounter
+
+T = TypeVar("T")
+
+class PreviewSampler:
+    """!
+    @brief Uniform JD sampling for preview runs, and scaling of the sampled counts back to corpus size.
+
+    @details
+    Both samplers make a single pass over a stream (see `Reader.iter_raw_jds`), so the corpus is never held
+    in memory and its size is learned on the way:
+    -   `reservoir` keeps exactly `size` JDs (Algorithm L: random skips instead of one draw per JD).
+    -   `bernoulli` keeps each JD independently with probability `fraction`.
+
+    Given the sample, every counter `c` out of `n` sampled JDs estimates the corpus total `c * N / n`.
+    Its confidence interval is a Wilson score interval on the proportion `c / n`, with the finite population
+    correction (the interval collapses to the exact count when the whole corpus is sampled), scaled by `N`.
+    Wilson stays well-behaved for the small counts that most edges have, unlike the normal approximation.
+    """
+
+    @staticmethod
+    def _uniform(rng: random.Random) -> float:
+        """Uniform draw in (0, 1), safe to take the log of."""
+        value = rng.random()
+        while value == 0.0:
+            value = rng.random()
+        return value
+
+    @staticmethod
+    def reservoir(stream: Iterable[T], size: int, seed: int = 42) -> Tuple[List[T], int]:
+        """!
+        @brief Draws a uniform sample of `size` items from a stream of unknown length.
+
+        @param stream Items to sample from (consumed once).
+        @param size Number of items to keep.
+        @param seed Random seed; the same seed and stream give the same sample.
+        @return `(sample, seen)`: the sampled items in stream order, and the stream length.
+        """
+        rng = random.Random(seed)
+        reservoir: List[Tuple[int, T]] = []
+        iterator = enumerate(stream)
+        seen = 0
+
+        for ordinal, item in iterator:
+            reservoir.append((ordinal, item))
+            seen = ordinal + 1
+            if len(reservoir) >= size:
+                break
+
+        if size > 0 and len(reservoir) == size:
+            weight = math.exp(math.log(PreviewSampler._uniform(rng)) / size)
+            next_pick = size + math.floor(math.log(PreviewSampler._uniform(rng)) / math.log1p(-weight))
+            for ordinal, item in iterator:
+                seen = ordinal + 1
+                if ordinal == next_pick:
+                    reservoir[rng.randrange(size)] = (ordinal, item)
+                    weight *= math.exp(math.log(PreviewSampler._uniform(rng)) / size)
+                    next_pick += math.floor(math.log(PreviewSampler._uniform(rng)) / math.log1p(-weight)) + 1
+
+        reservoir.sort(key=lambda entry: entry[0])
+        return [item for _, item in reservoir], seen
+
+    @staticmethod
+    def bernoulli(stream: Iterable[T], fraction: float, seed: int = 42) -> Tuple[List[T], int]:
+        """!
+        @brief Keeps each item of a stream independently with probability `fraction`.
+        @return `(sample, seen)`: the sampled items in stream order, and the stream length.
+        """
+        rng = random.Random(seed)
+        sample: List[T] = []
+        seen = 0
+        for item in stream:
+            seen += 1
+            if rng.random() < fraction:
+                sample.append(item)
+        return sample, seen
+
+    @staticmethod
+    def interval(count: int, sample_size: int, corpus_size: int, confidence: float = 0.95) -> Tuple[int, int]:
+        """!
+        @brief Confidence interval on the corpus-wide count of something seen `count` times in the sample.
+
+        @details Wilson score interval on `count / sample_size`, with the finite population correction
+        applied to the effective sample size, scaled to `corpus_size` and widened to whole JDs.
+        """
+        if sample_size <= 0:
+            return 0, corpus_size
+        if sample_size >= corpus_size:
+            return count, count
+
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        n_eff = sample_size * (corpus_size - 1) / (corpus_size - sample_size)
+        p = count / sample_size
+        denominator = 1 + z * z / n_eff
+        center = (p + z * z / (2 * n_eff)) / denominator
+        half_width = z * math.sqrt(p * (1 - p) / n_eff + z * z / (4 * n_eff * n_eff)) / denominator
+
+        low = max(count, math.floor(max(0.0, center - half_width) * corpus_size))
+        high = min(corpus_size - (sample_size - count), math.ceil(min(1.0, center + half_width) * corpus_size))
+        return low, max(low, high)
+
+    @staticmethod
+    def scale_stats(
+        stats: GraphStats,
+        sample_size: int,
+        corpus_size: int,
+        confidence: float = 0.95
+    ) -> Dict[str, Dict]:
+        """!
+        @brief Scales sampled `GraphStats` to corpus size in place and returns the intervals of the totals.
+
+        @details Every counter (total, senior and managerial counts of nodes and edges, and the seniority
+        distribution) is multiplied by `corpus_size / sample_size` and rounded, so thresholds and scores
+        downstream behave as on a full run. A `SpillingEdgeCounter` is materialized into a dictionary.
+
+        @return `{ "nodes": { skill: (low, high) }, "edges": { pair: (low, high) } }` for every non-zero total.
+        """
+        scale = corpus_size / sample_size if sample_size else 0.0
+
+        def scaled(counts: Dict[str, int]) -> Dict[str, int]:
+            return {key: int(round(value * scale)) for key, value in counts.items()}
+
+        intervals: Dict[str, Dict] = {"nodes": {}, "edges": {}}
+        for skill, counts in stats.node_stats.items():
+            if counts["total"]:
+                intervals["nodes"][skill] = PreviewSampler.interval(counts["total"], sample_size, corpus_size, confidence)
+            stats.node_stats[skill] = scaled(counts)
+
+        edge_items = list(stats.edge_counts.items())
+        if isinstance(stats.edge_counts, SpillingEdgeCounter):
+            stats.edge_counts.close()
+
+        edge_counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for pair, counts in edge_items:
+            intervals["edges"][pair] = PreviewSampler.interval(counts["total"], sample_size, corpus_size, confidence)
+            edge_counts[pair] = scaled(counts)
+        stats.edge_counts = edge_counts
+
+        stats.seniority_dist = Counter(scaled(stats.seniority_dist))
+        return intervals
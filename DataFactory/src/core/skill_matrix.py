@@ -0,0 +1,60 @@
+from __future__ import annotations
+from typing import List, Optional
+from dataclasses import dataclass
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+@dataclass
+class SkillMatrix:
+    """!
+    @brief Batch of per-JD skill sets in CSR (Compressed Sparse Row) layout over interned skill ids.
+
+    @details
+    Row `i` (one JD) holds the skill ids `indices[indptr[i]:indptr[i + 1]]`, sorted ascending.
+    Ids index into `skill_ids` (see `TaxonomyManager.get_skill_ids`).
+    `levels`, when present, holds one seniority code per row (index into `SeniorityAnalyzer.LEVELS`).
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    skill_ids: List[str]
+    levels: Optional[np.ndarray] = None
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def n_skills(self) -> int:
+        return len(self.skill_ids)
+
+    def row(self, i: int) -> np.ndarray:
+        """Returns the skill ids of row `i`."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def row_ids(self) -> np.ndarray:
+        """Returns the row number of every stored entry (the COO row array)."""
+        return np.repeat(np.arange(self.n_rows, dtype=np.int64), np.diff(self.indptr))
+
+    def row_names(self, i: int) -> List[str]:
+        """Returns the canonical names of row `i` (for interop with string-keyed code)."""
+        return [self.skill_ids[skill_id] for skill_id in self.row(i)]
+
+    @staticmethod
+    def from_rows(rows: List[List[int]], skill_ids: List[str], levels: Optional[List[int]] = None) -> "SkillMatrix":
+        """!
+        @brief Packs Python lists of skill ids into CSR arrays (rows are de-duplicated and sorted).
+        """
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        packed: List[int] = []
+        for i, row in enumerate(rows):
+            unique_row = sorted(set(row))
+            packed.extend(unique_row)
+            indptr[i + 1] = indptr[i] + len(unique_row)
+
+        return SkillMatrix(
+            indptr=indptr,
+            indices=np.asarray(packed, dtype=np.int32),
+            skill_ids=skill_ids,
+            levels=np.asarray(levels, dtype=np.int8) if levels is not None else None
+        )
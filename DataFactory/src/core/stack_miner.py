@@ -0,0 +1,121 @@
+import heapq
+import math
+import time
+from typing import List, Dict, Tuple, Any, Optional
+from core.inverted_index import InvertedIndex
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class StackMiner:
+    """!
+    @brief Frequent skill-set ("stack") mining with a depth-first Eclat over JD bitsets.
+
+    @details
+    The pairwise graph cannot tell that spark + kafka + airflow appear *together*; enumerating k-combinations
+    per JD the way `GraphBuilder` does for pairs explodes combinatorially. Eclat instead works on the
+    vertical layout already held by `InvertedIndex`: the support of an itemset is the popcount of the AND
+    of its skills' JD bitsets.
+
+    -   Items are frequent skills ordered by ascending support (rare items first keeps intersections small).
+    -   The search is depth-first and materializes only the prefix bitset of each level, so memory is
+        O(max_size x JDs / 8) on top of the per-skill bitsets, regardless of how many itemsets exist.
+    -   Results are kept in one bounded heap per itemset size (`top_n` each). Once a heap is full, its
+        smallest support becomes that size's threshold, and since support only shrinks as an itemset grows,
+        branches that cannot beat any larger size's threshold are pruned.
+    -   `time_budget_s` stops the search early (with a warning) to bound run time on very large corpora.
+    """
+
+    @staticmethod
+    def mine(
+        index: InvertedIndex,
+        min_support: float = 0.02,
+        max_size: int = 4,
+        top_n: int = 50,
+        min_size: int = 2,
+        senior_levels: Tuple[str, ...] = ("Senior", "Managerial"),
+        time_budget_s: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """!
+        @brief Finds the most frequent skill stacks of each size.
+
+        @param index Inverted index over the corpus (see `InvertedIndex.add`).
+        @param min_support Minimum support, as a fraction of JDs (< 1) or an absolute JD count (>= 1).
+        @param max_size Largest stack size mined.
+        @param top_n Stacks kept per size.
+        @param min_size Smallest stack size reported.
+        @param senior_levels Levels counted towards `seniorityRatio` (same as `GraphBuilder.update_metrics`).
+        @param time_budget_s Optional wall-clock limit for the search.
+        @return List of `{ skills, size, support, supportRatio, seniorityRatio }`, ordered by size, then support descending.
+        """
+        n_docs = index.n_docs
+        if n_docs == 0:
+            return []
+
+        min_count = max(1, math.ceil(min_support * n_docs) if min_support < 1 else int(min_support))
+        senior_bits = 0
+        for level in senior_levels:
+            senior_bits |= index.level_bitset(level)
+
+        items: List[Tuple[int, str, int]] = []
+        for skill in index.skills():
+            bits = index.bitset(skill)
+            support = bits.bit_count()
+            if support >= min_count:
+                items.append((support, skill, bits))
+        items.sort()
+
+        # One min-heap per size: (support, insertion order, skills tuple, senior support)
+        heaps: Dict[int, List[Tuple[int, int, Tuple[str, ...], int]]] = {size: [] for size in range(min_size, max_size + 1)}
+        counter = [0]
+        deadline = time.perf_counter() + time_budget_s if time_budget_s else None
+        timed_out = [False]
+
+        def threshold(size: int) -> int:
+            heap = heaps.get(size)
+            if heap is None:
+                return min_count
+            return max(min_count, heap[0][0]) if len(heap) >= top_n else min_count
+
+        def record(stack: Tuple[str, ...], support: int, bits: int) -> None:
+            heap = heaps[len(stack)]
+            entry = (support, -counter[0], stack, (bits & senior_bits).bit_count())
+            counter[0] += 1
+            if len(heap) < top_n:
+                heapq.heappush(heap, entry)
+            elif support > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+        def extend(prefix: Tuple[str, ...], prefix_bits: int, start: int) -> None:
+            size = len(prefix) + 1
+            for position in range(start, len(items)):
+                if deadline is not None and time.perf_counter() > deadline:
+                    timed_out[0] = True
+                    return
+                _, skill, bits = items[position]
+                candidate_bits = prefix_bits & bits
+                support = candidate_bits.bit_count()
+                if support < min_count:
+                    continue
+
+                stack = prefix + (skill,)
+                if size >= min_size and support >= threshold(size):
+                    record(stack, support, candidate_bits)
+                if size < max_size and support >= min(threshold(s) for s in range(size + 1, max_size + 1)):
+                    extend(stack, candidate_bits, position + 1)
+
+        extend((), (1 << n_docs) - 1, 0)
+        if timed_out[0]:
+            logger.warning(f"Stack mining stopped after {time_budget_s}s; results cover the itemsets explored so far.")
+
+        stacks: List[Dict[str, Any]] = []
+        for size in range(min_size, max_size + 1):
+            for support, _, stack, senior_support in sorted(heaps[size], key=lambda entry: (-entry[0], entry[2])):
+                stacks.append({
+                    "skills": sorted(stack),
+                    "size": size,
+                    "support": support,
+                    "supportRatio": round(support / n_docs, 4),
+                    "seniorityRatio": round(senior_support / support, 2)
+                })
+        return stacks
@@ -1,97 +1,134 @@
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
 from config import cfg
 
 class TaxonomyManager:
     """!
     @brief Manages the valid set of skills (taxonomy) taking into account Aliases and Groups.
+
+    @details
+    Every getter takes an optional `path` so several taxonomy files can be used side by side
+    (e.g. comparing two versions of `alias_data.json`). Caches are keyed by the resolved path;
+    omitting it uses `paths.alias_json`.
     """
-    
-    # Static cache
-    _TAXONOMY_CACHE = None
-    _ALIAS_MAP_CACHE = None
-    _GROUP_MAP_CACHE = None
+
+    # Static caches, keyed by taxonomy path
+    _TAXONOMY_CACHE: Dict[str, Dict] = {}
+    _ALIAS_MAP_CACHE: Dict[str, Dict[str, str]] = {}
+    _GROUP_MAP_CACHE: Dict[str, Dict[str, str]] = {}
+    _SKILL_INDEX_CACHE: Dict[str, Dict[str, int]] = {}
 
     @staticmethod
-    def _load_taxonomy() -> Dict:
+    def _resolve_path(path: Optional[str]) -> str:
+        return path if path is not None else cfg.get_abs_path("paths.alias_json")
+
+    @staticmethod
+    def _load_taxonomy(path: Optional[str] = None) -> Dict:
         """Helper to load the JSON only once."""
-        if TaxonomyManager._TAXONOMY_CACHE is None:
-            path = cfg.get_abs_path("paths.alias_json")
+        path = TaxonomyManager._resolve_path(path)
+        if path not in TaxonomyManager._TAXONOMY_CACHE:
             try:
                 with open(path, 'r', encoding='utf-8') as f:
-                    TaxonomyManager._TAXONOMY_CACHE = json.load(f)
+                    TaxonomyManager._TAXONOMY_CACHE[path] = json.load(f)
             except FileNotFoundError:
                 print(f"❌ Error: Taxonomy file not found at {path}")
-                TaxonomyManager._TAXONOMY_CACHE = {}
-        return TaxonomyManager._TAXONOMY_CACHE
+                TaxonomyManager._TAXONOMY_CACHE[path] = {}
+        return TaxonomyManager._TAXONOMY_CACHE[path]
 
     @staticmethod
-    def get_alias_map() -> Dict[str, str]:
+    def get_alias_map(path: Optional[str] = None) -> Dict[str, str]:
         """!
         @brief Builds the Master Lookup Table for Data Normalization.
         Mappings: 'term' -> 'canonical_id'.
         It flattens the taxonomy so you can look up any variant and get the ID immediately.
         """
-        if TaxonomyManager._ALIAS_MAP_CACHE is not None:
-            return TaxonomyManager._ALIAS_MAP_CACHE
+        path = TaxonomyManager._resolve_path(path)
+        if path in TaxonomyManager._ALIAS_MAP_CACHE:
+            return TaxonomyManager._ALIAS_MAP_CACHE[path]
 
-        taxonomy = TaxonomyManager._load_taxonomy()
+        taxonomy = TaxonomyManager._load_taxonomy(path)
         alias_map = {}
-        
+
         for group, skills in taxonomy.items():
             for canonical, aliases in skills.items():
                 norm_canonical = canonical.lower()
                 alias_map[norm_canonical] = norm_canonical
-                
+
                 for alias in aliases:
                     norm_alias = alias.lower()
                     alias_map[norm_alias] = norm_canonical
-        
-        TaxonomyManager._ALIAS_MAP_CACHE = alias_map
+
+        TaxonomyManager._ALIAS_MAP_CACHE[path] = alias_map
         return alias_map
 
     @staticmethod
-    def get_skill_to_group_map() -> Dict[str, str]:
+    def get_skill_to_group_map(path: Optional[str] = None) -> Dict[str, str]:
         """!
-        @brief Maps every valid term (Canonical + Alias) to its Group. 
+        @brief Maps every valid term (Canonical + Alias) to its Group.
         It flattens the taxonomy so you can look up any variant and get the Group immediately.
         """
-        if TaxonomyManager._GROUP_MAP_CACHE is not None:
-            return TaxonomyManager._GROUP_MAP_CACHE
+        path = TaxonomyManager._resolve_path(path)
+        if path in TaxonomyManager._GROUP_MAP_CACHE:
+            return TaxonomyManager._GROUP_MAP_CACHE[path]
 
-        taxonomy = TaxonomyManager._load_taxonomy()
+        taxonomy = TaxonomyManager._load_taxonomy(path)
         group_map = {}
-        
+
         for group, skills in taxonomy.items():
             for canonical, aliases in skills.items():
                 group_map[canonical.lower()] = group
                 for alias in aliases:
                     group_map[alias.lower()] = group
 
-           
-        TaxonomyManager._GROUP_MAP_CACHE = group_map
+
+        TaxonomyManager._GROUP_MAP_CACHE[path] = group_map
         return group_map
 
     @staticmethod
-    def get_all_skills() -> List[str]:
+    def get_all_skills(path: Optional[str] = None) -> List[str]:
         """!
         @brief Returns only CANONICAL skills (for stats/reporting).
         """
-        taxonomy = TaxonomyManager._load_taxonomy()
+        taxonomy = TaxonomyManager._load_taxonomy(path)
         canons = []
 
         for group_dict in taxonomy.values():
             canons.extend(group_dict.keys())
-        
+
         return canons
 
     @staticmethod
-    def get_matchable_terms() -> List[str]:
+    def get_matchable_terms(path: Optional[str] = None) -> List[str]:
         """!
         @brief Returns ALL terms (Canonical + Aliases) sorted by Length DESC.
         """
-        am = TaxonomyManager.get_alias_map()
+        am = TaxonomyManager.get_alias_map(path)
         terms = list(am.keys())
         # Sort by length descending, then alphabetical for stability
         terms.sort(key=lambda x: (-len(x), x))
         return terms
+
+    @staticmethod
+    def get_skill_ids(path: Optional[str] = None) -> List[str]:
+        """!
+        @brief Returns the interned skill vocabulary: position `i` holds the canonical id of skill `i`.
+        Canonicals listed under several groups are interned once, in first-seen order.
+        """
+        return list(TaxonomyManager.get_skill_index(path).keys())
+
+    @staticmethod
+    def get_skill_index(path: Optional[str] = None) -> Dict[str, int]:
+        """!
+        @brief Maps every canonical skill to its interned integer id (see `get_skill_ids`).
+        Used by array-backed consumers (`SkillMatrix`, batch analytics) instead of string keys.
+        """
+        path = TaxonomyManager._resolve_path(path)
+        if path in TaxonomyManager._SKILL_INDEX_CACHE:
+            return TaxonomyManager._SKILL_INDEX_CACHE[path]
+
+        skill_index: Dict[str, int] = {}
+        for canonical in TaxonomyManager.get_all_skills(path):
+            skill_index.setdefault(canonical.lower(), len(skill_index))
+
+        TaxonomyManager._SKILL_INDEX_CACHE[path] = skill_index
+        return skill_index
@@ -0,0 +1,219 @@
+import hashlib
+from datetime import date, timedelta
+from typing import List, Dict, Tuple, Any, Optional
+from core.graph_engine import GraphBuilder, GraphStats
+from core.partial_stats import PartialStats
+
+class TemporalStats:
+    """!
+    @brief Time-aware graph statistics: per-bucket counters and an exponentially decayed view, maintained incrementally.
+
+    @details
+    Each JD is added once, with its posting date (see `TextProcessor.extract_posting_date`):
+    -   **Buckets**: the JD is counted in the `GraphStats` of its bucket (`bucket_days` long, aligned on Mondays).
+        A window such as "the last 90 days" is the sum of the buckets it covers, so it never needs a rescan
+        of the corpus. Windows are resolved at bucket granularity.
+    -   **Decayed view**: a JD posted at `t` should weigh `2^(-(as_of - t) / half_life_days)`. Rather than
+        re-weighting every counter when time moves on, counters hold *forward-decayed* weights
+        `2^((t - landmark) / half_life_days)` relative to a fixed landmark date, and the view divides
+        by `2^((as_of - landmark) / half_life_days)` when it is read. Adding a JD is therefore O(its edges),
+        late JDs are handled naturally, and the landmark is moved forward (one rescale of the decayed
+        counters) only before the weights overflow.
+
+    JDs are identified by a fingerprint of their text, so feeding the same corpus again only adds the new JDs.
+    Pruned buckets forget their fingerprints, so JDs falling before the last pruning cutoff (`pruned_before`)
+    are ignored instead of being counted again.
+    The whole state round-trips through `to_document` / `from_document` (see `Writer.save_temporal_state`);
+    bucket and decayed counters use the `PartialStats` layout.
+    """
+
+    FORMAT = "careernavigator-temporal-state"
+    VERSION = 1
+    # Monday; bucket boundaries are multiples of `bucket_days` after it
+    EPOCH = date(1970, 1, 5)
+    # Decay exponent (in half-lives) above which the landmark is moved forward
+    MAX_EXPONENT = 256
+
+    def __init__(self, all_skills: List[str], bucket_days: int = 7, half_life_days: float = 30.0):
+        self.all_skills = list(all_skills)
+        self.bucket_days = bucket_days
+        self.half_life_days = half_life_days
+        self.buckets: Dict[date, GraphStats] = {}
+        self.bucket_jobs: Dict[date, int] = {}
+        self.decayed: GraphStats = GraphBuilder.initialize_stats(self.all_skills)
+        self.decayed_jobs = 0.0
+        self.landmark: Optional[date] = None
+        self.latest: Optional[date] = None
+        # Buckets ending on or before this date were pruned; their JDs are not added again
+        self.pruned_before: Optional[date] = None
+        self._fingerprints: Dict[str, date] = {}
+
+    @staticmethod
+    def fingerprint(jd_text: str) -> str:
+        return hashlib.sha1(jd_text.encode("utf-8")).hexdigest()[:16]
+
+    def bucket_start(self, posted: date) -> date:
+        offset = (posted - self.EPOCH).days
+        return self.EPOCH + timedelta(days=offset - offset % self.bucket_days)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._fingerprints
+
+    # ---- Updates
+
+    def add(self, fingerprint: str, found_skills: List[str], level: str, posted: date) -> bool:
+        """!
+        @brief Counts one JD in its bucket and in the decayed view.
+        @return False (and counts nothing) if a JD with this fingerprint was already added, or its bucket was pruned.
+        """
+        if fingerprint in self._fingerprints:
+            return False
+
+        bucket = self.bucket_start(posted)
+        if self.pruned_before is not None and bucket + timedelta(days=self.bucket_days) <= self.pruned_before:
+            return False
+        self._fingerprints[fingerprint] = bucket
+        if bucket not in self.buckets:
+            self.buckets[bucket] = GraphBuilder.initialize_stats(self.all_skills)
+            self.bucket_jobs[bucket] = 0
+        self.buckets[bucket].seniority_dist[level] += 1
+        GraphBuilder.update_metrics(self.buckets[bucket], found_skills, level)
+        self.bucket_jobs[bucket] += 1
+
+        if self.landmark is None:
+            self.landmark = posted
+        exponent = (posted - self.landmark).days / self.half_life_days
+        if exponent > self.MAX_EXPONENT:
+            self._move_landmark(posted)
+            exponent = 0.0
+        weight = 2.0 ** exponent
+        self.decayed.seniority_dist[level] += weight
+        GraphBuilder.update_metrics(self.decayed, found_skills, level, weight=weight)
+        self.decayed_jobs += weight
+
+        self.latest = posted if self.latest is None else max(self.latest, posted)
+        return True
+
+    def _move_landmark(self, landmark: date) -> None:
+        """Rescales the forward-decayed counters to a later landmark."""
+        scale = 2.0 ** (-(landmark - self.landmark).days / self.half_life_days)
+        rescaled = GraphBuilder.initialize_stats(self.all_skills)
+        GraphBuilder.merge_stats(rescaled, self.decayed, scale)
+        self.decayed = rescaled
+        self.decayed_jobs *= scale
+        self.landmark = landmark
+
+    def prune(self, retention_days: int, as_of: Optional[date] = None) -> int:
+        """!
+        @brief Drops buckets that ended more than `retention_days` before `as_of` (the decayed view is unaffected).
+        @details JDs that would fall in a dropped bucket are ignored by later `add` calls.
+        @return Number of buckets dropped.
+        """
+        as_of = as_of or self.latest
+        if as_of is None:
+            return 0
+        cutoff = as_of - timedelta(days=retention_days)
+        self.pruned_before = cutoff if self.pruned_before is None else max(self.pruned_before, cutoff)
+        expired = [bucket for bucket in self.buckets if bucket + timedelta(days=self.bucket_days) <= cutoff]
+        for bucket in expired:
+            del self.buckets[bucket]
+            del self.bucket_jobs[bucket]
+        if expired:
+            expired_set = set(expired)
+            self._fingerprints = {fp: bucket for fp, bucket in self._fingerprints.items() if bucket not in expired_set}
+        return len(expired)
+
+    # ---- Views
+
+    def window(self, days: int, as_of: Optional[date] = None) -> Tuple[GraphStats, int]:
+        """!
+        @brief Sums the buckets overlapping the `days` days up to `as_of` (default: latest posting date).
+        @return `(stats, total_jobs)` of the window.
+        """
+        stats = GraphBuilder.initialize_stats(self.all_skills)
+        as_of = as_of or self.latest
+        if as_of is None:
+            return stats, 0
+
+        start = as_of - timedelta(days=days)
+        total_jobs = 0
+        for bucket in sorted(self.buckets):
+            if bucket + timedelta(days=self.bucket_days) > start and bucket <= as_of:
+                GraphBuilder.merge_stats(stats, self.buckets[bucket])
+                total_jobs += self.bucket_jobs[bucket]
+        stats.edge_counts = dict(sorted(stats.edge_counts.items()))
+        return stats, total_jobs
+
+    def decayed_view(self, as_of: Optional[date] = None, precision: int = 4) -> Tuple[GraphStats, float]:
+        """!
+        @brief The decayed counters as seen at `as_of` (default: latest posting date), rounded to `precision` decimals.
+        @return `(stats, decayed_job_count)`.
+        """
+        stats = GraphBuilder.initialize_stats(self.all_skills)
+        as_of = as_of or self.latest
+        if as_of is None:
+            return stats, 0.0
+
+        scale = 2.0 ** (-(as_of - self.landmark).days / self.half_life_days)
+        GraphBuilder.merge_stats(stats, self.decayed, scale)
+        for counts in list(stats.node_stats.values()) + list(stats.edge_counts.values()):
+            for key, value in counts.items():
+                counts[key] = round(value, precision)
+        for level, weight in stats.seniority_dist.items():
+            stats.seniority_dist[level] = round(weight, precision)
+        stats.edge_counts = dict(sorted(stats.edge_counts.items()))
+        return stats, round(self.decayed_jobs * scale, precision)
+
+    # ---- Serialization
+
+    def to_document(self) -> Dict[str, Any]:
+        fingerprints_by_bucket: Dict[date, List[str]] = {bucket: [] for bucket in self.buckets}
+        for fingerprint, bucket in self._fingerprints.items():
+            fingerprints_by_bucket[bucket].append(fingerprint)
+
+        return {
+            "format": self.FORMAT,
+            "version": self.VERSION,
+            "bucketDays": self.bucket_days,
+            "halfLifeDays": self.half_life_days,
+            "landmark": self.landmark.isoformat() if self.landmark else None,
+            "latest": self.latest.isoformat() if self.latest else None,
+            "prunedBefore": self.pruned_before.isoformat() if self.pruned_before else None,
+            "buckets": {
+                bucket.isoformat(): {
+                    "stats": PartialStats.to_document(self.buckets[bucket], self.bucket_jobs[bucket]),
+                    "fingerprints": sorted(fingerprints_by_bucket[bucket])
+                }
+                for bucket in sorted(self.buckets)
+            },
+            "decayed": PartialStats.to_document(self.decayed, self.decayed_jobs)
+        }
+
+    @staticmethod
+    def from_document(document: Dict[str, Any], all_skills: List[str], bucket_days: int = 7, half_life_days: float = 30.0) -> "TemporalStats":
+        """!
+        @brief Restores a state written by `to_document`; an empty document gives an empty state.
+        @throws ValueError If the document is not a supported state, or was built with other bucket or half-life settings.
+        """
+        temporal = TemporalStats(all_skills, bucket_days, half_life_days)
+        if not document:
+            return temporal
+
+        if document.get("format") != TemporalStats.FORMAT or document.get("version") != TemporalStats.VERSION:
+            raise ValueError("Not a supported temporal state document.")
+        if document["bucketDays"] != bucket_days or document["halfLifeDays"] != half_life_days:
+            raise ValueError(
+                f"Temporal state uses {document['bucketDays']}-day buckets and a {document['halfLifeDays']}-day half-life; "
+                f"delete it to rebuild with {bucket_days} and {half_life_days}.")
+
+        temporal.landmark = date.fromisoformat(document["landmark"]) if document["landmark"] else None
+        temporal.latest = date.fromisoformat(document["latest"]) if document["latest"] else None
+        temporal.pruned_before = date.fromisoformat(document["prunedBefore"]) if document.get("prunedBefore") else None
+        for key, entry in document["buckets"].items():
+            bucket = date.fromisoformat(key)
+            temporal.buckets[bucket] = GraphBuilder.initialize_stats(all_skills)
+            temporal.bucket_jobs[bucket] = PartialStats.merge_into(temporal.buckets[bucket], entry["stats"])
+            for fingerprint in entry["fingerprints"]:
+                temporal._fingerprints[fingerprint] = bucket
+        temporal.decayed_jobs = PartialStats.merge_into(temporal.decayed, document["decayed"])
+        return temporal
@@ -0,0 +1,139 @@
+from typing import List, Dict, Tuple, Any
+
+class UniverseDelta:
+    """!
+    @brief Computes and applies patches between two generations of `universe.json`.
+
+    @details
+    Nodes are keyed by `id` and links by `(source, target)`. An object is *changed* when one of its count
+    fields (`NODE_FIELDS` / `LINK_FIELDS`: ids, group, `val` / `value` and the seniority scores) differs;
+    added and changed objects are listed in full (so consumers can replace them without merging fields) and
+    removed ones by key only.
+
+    Every other field is a derived metric (centralities, community, layout position, lift/PMI/...) that moves
+    a little on every run as the corpus grows. For the remaining objects, only the metrics that moved by more than
+    the relative `tolerance` are sent, under `metrics` (a `null` value removes the field):
+
+        {
+            "generation": 8, "baseGeneration": 7, "tolerance": 0.01,
+            "nodes": { "added": [node, ...], "removed": [id, ...], "changed": [node, ...] },
+            "links": { "added": [link, ...], "removed": [[source, target], ...], "changed": [link, ...] },
+            "metrics": { "nodes": [{"id": ..., "pageRank": ...}, ...], "links": [{"source": ..., "target": ..., "lift": ...}, ...] },
+            "meta": { ... }
+        }
+
+    Deltas are computed against the universe a consumer holds (the last snapshot with the later deltas applied,
+    see `replay`), not the previous export, so replayed metrics stay within `tolerance` of the exported ones
+    instead of drifting. `meta` is always sent whole since it carries the generation number and corpus-wide distributions.
+    """
+
+    NODE_FIELDS = ("id", "group", "val", "seniorityScore", "managerialScore", "isSenior", "isManagerial")
+    LINK_FIELDS = ("source", "target", "value", "seniorityScore", "managerialScore", "isSenior", "isManagerial")
+
+    @staticmethod
+    def _moved(previous: Any, current: Any, tolerance: float) -> bool:
+        numeric = (int, float)
+        if isinstance(previous, numeric) and isinstance(current, numeric) and not isinstance(previous, bool) and not isinstance(current, bool):
+            return abs(current - previous) > tolerance * max(abs(previous), abs(current))
+        return previous != current
+
+    @staticmethod
+    def _diff(previous: List[Dict[str, Any]], current: List[Dict[str, Any]], key_of, key_fields: Tuple[str, ...], fields: Tuple[str, ...], tolerance: float) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """Added / removed / changed objects, and the derived metrics that moved on the other common objects."""
+        previous_by_key: Dict[Any, Dict[str, Any]] = {key_of(item): item for item in previous}
+        current_by_key: Dict[Any, Dict[str, Any]] = {key_of(item): item for item in current}
+
+        added, changed, metrics = [], [], []
+        for key, item in current_by_key.items():
+            before = previous_by_key.get(key)
+            if before is None:
+                added.append(item)
+            elif any(before.get(field) != item.get(field) for field in fields):
+                changed.append(item)
+            else:
+                moved = {
+                    field: item.get(field)
+                    for field in sorted(set(before) | set(item))
+                    if field not in fields and (field not in item or field not in before or UniverseDelta._moved(before[field], item[field], tolerance))
+                }
+                if moved:
+                    metrics.append({**{field: item[field] for field in key_fields}, **moved})
+        removed = [key for key in previous_by_key if key not in current_by_key]
+        return {"added": added, "removed": removed, "changed": changed}, metrics
+
+    @staticmethod
+    def _node_key(node: Dict[str, Any]) -> str:
+        return node["id"]
+
+    @staticmethod
+    def _link_key(link: Dict[str, Any]) -> Tuple[str, str]:
+        return (link["source"], link["target"])
+
+    @staticmethod
+    def compute(previous: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.01) -> Dict[str, Any]:
+        """!
+        @brief Diffs two universes.
+
+        @param previous The universe the consumers hold (may be empty).
+        @param current The universe about to be exported; `meta.generation` must be set.
+        @param tolerance Relative change below which a derived metric is not sent (0 sends every change).
+        @return The delta document.
+        """
+        node_diff, node_metrics = UniverseDelta._diff(previous.get("nodes", []), current.get("nodes", []), UniverseDelta._node_key, ("id",), UniverseDelta.NODE_FIELDS, tolerance)
+        link_diff, link_metrics = UniverseDelta._diff(previous.get("links", []), current.get("links", []), UniverseDelta._link_key, ("source", "target"), UniverseDelta.LINK_FIELDS, tolerance)
+        link_diff["removed"] = [list(key) for key in link_diff["removed"]]
+
+        return {
+            "generation": current["meta"]["generation"],
+            "baseGeneration": previous.get("meta", {}).get("generation", 0),
+            "tolerance": tolerance,
+            "nodes": node_diff,
+            "links": link_diff,
+            "metrics": {"nodes": node_metrics, "links": link_metrics},
+            "meta": current["meta"]
+        }
+
+    @staticmethod
+    def apply(universe: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+        """!
+        @brief Applies a delta to the universe of its base generation (as a serving process would).
+
+        @details Surviving objects keep their order; added ones are appended.
+        @throws ValueError If the universe is not the delta's base generation.
+        """
+        generation = universe.get("meta", {}).get("generation", 0)
+        if generation != delta["baseGeneration"]:
+            raise ValueError(f"Delta {delta['generation']} applies to generation {delta['baseGeneration']}, not {generation}.")
+
+        def patch(items: List[Dict[str, Any]], diff: Dict[str, List[Any]], metrics: List[Dict[str, Any]], key_of) -> List[Dict[str, Any]]:
+            removed = {tuple(key) if isinstance(key, list) else key for key in diff["removed"]}
+            changed = {key_of(item): item for item in diff["changed"]}
+            moved = {key_of(entry): entry for entry in metrics}
+            patched: List[Dict[str, Any]] = []
+            for item in items:
+                key = key_of(item)
+                if key in removed:
+                    continue
+                if key in moved:
+                    item = {**item, **moved[key]}
+                    item = {field: value for field, value in item.items() if value is not None}
+                patched.append(changed.get(key, item))
+            return patched + list(diff["added"])
+
+        metrics = delta.get("metrics", {})
+        return {
+            "meta": delta["meta"],
+            "nodes": patch(universe.get("nodes", []), delta["nodes"], metrics.get("nodes", []), UniverseDelta._node_key),
+            "links": patch(universe.get("links", []), delta["links"], metrics.get("links", []), UniverseDelta._link_key)
+        }
+
+    @staticmethod
+    def replay(snapshot: Dict[str, Any], deltas: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """!
+        @brief Applies `deltas` (in generation order) to a snapshot: the universe a consumer that followed them holds.
+        @throws ValueError If a delta does not apply to the generation reached so far.
+        """
+        universe = snapshot
+        for delta in deltas:
+            universe = UniverseDelta.apply(universe, delta)
+        return universe
@@ -0,0 +1,149 @@
+import re
+from typing import List, Dict, Tuple, Any, Optional
+
+class UniverseLOD:
+    """!
+    @brief Splits a universe into a level-of-detail hierarchy, so clients load a small overview and fetch detail on zoom.
+
+    @details
+    -   **Overview** (coarse level): one node per taxonomy group and one link per pair of groups.
+        A group node sums the `val` of its skills and carries the value of the links inside it
+        (`internalValue`, `internalLinks`), its most frequent skills (`topSkills`) and, when the universe has
+        a layout, the value-weighted centroid of its skills (`x`, `y`). A group link sums the `value` of every
+        skill link between the two groups (`links` counts them).
+    -   **Tiles** (fine level): one per group, holding its skill nodes as exported, the links among them and
+        its cross-group links. A cross-group link is stored in the tiles of both groups; `external` maps
+        its far endpoint to that endpoint's group, i.e. the tile to fetch to draw it.
+    -   **Index**: the overview path and, per group, the tile path, counts and (with a layout) the bounding box
+        of its skills, so a client only requests the tiles intersecting its viewport.
+
+    `universe.json` stays the complete export; the hierarchy is derived from it.
+    """
+
+    FORMAT = "careernavigator-lod"
+    VERSION = 1
+    TOP_SKILLS = 5
+    # Bulky entries left to universe.json (per-community member lists)
+    OVERVIEW_META_EXCLUDED = ("communities",)
+
+    @staticmethod
+    def tile_names(groups: List[str]) -> Dict[str, str]:
+        """File-system safe, unique tile file names for `groups`."""
+        names: Dict[str, str] = {}
+        used: set = set()
+        for group in sorted(groups):
+            base = re.sub(r"[^A-Za-z0-9_.-]", "_", group) or "group"
+            name, suffix = base, 1
+            while name.lower() in used:
+                suffix += 1
+                name = f"{base}_{suffix}"
+            used.add(name.lower())
+            names[group] = f"{name}.json"
+        return names
+
+    @staticmethod
+    def _group_of(nodes: List[Dict[str, Any]]) -> Dict[str, str]:
+        return {node["id"]: node.get("group", "Unknown") for node in nodes}
+
+    @staticmethod
+    def overview(universe: Dict[str, Any]) -> Dict[str, Any]:
+        """!
+        @brief The group x group rollup graph, in the universe format.
+        """
+        nodes: List[Dict[str, Any]] = universe.get("nodes", [])
+        group_of = UniverseLOD._group_of(nodes)
+
+        members: Dict[str, List[Dict[str, Any]]] = {}
+        for node in nodes:
+            members.setdefault(group_of[node["id"]], []).append(node)
+
+        internal: Dict[str, List[float]] = {group: [0, 0] for group in members}
+        between: Dict[Tuple[str, str], List[float]] = {}
+        for link in universe.get("links", []):
+            source_group, target_group = group_of.get(link["source"]), group_of.get(link["target"])
+            if source_group is None or target_group is None:
+                continue
+            if source_group == target_group:
+                internal[source_group][0] += link["value"]
+                internal[source_group][1] += 1
+            else:
+                totals = between.setdefault(tuple(sorted((source_group, target_group))), [0, 0])
+                totals[0] += link["value"]
+                totals[1] += 1
+
+        group_nodes: List[Dict[str, Any]] = []
+        for group in sorted(members):
+            skills = members[group]
+            total = sum(node.get("val", 0) for node in skills)
+            group_node: Dict[str, Any] = {
+                "id": group,
+                "group": group,
+                "val": total,
+                "skills": len(skills),
+                "seniorityScore": round(sum(node.get("val", 0) * node.get("seniorityScore", 0) for node in skills) / total, 2) if total else 0.0,
+                "internalValue": internal[group][0],
+                "internalLinks": internal[group][1],
+                "topSkills": [node["id"] for node in sorted(skills, key=lambda node: (-node.get("val", 0), node["id"]))[:UniverseLOD.TOP_SKILLS]]
+            }
+            placed = [node for node in skills if "x" in node and "y" in node]
+            if placed:
+                weights = [max(node.get("val", 0), 1e-9) for node in placed]
+                group_node["x"] = round(sum(node["x"] * weight for node, weight in zip(placed, weights)) / sum(weights), 2)
+                group_node["y"] = round(sum(node["y"] * weight for node, weight in zip(placed, weights)) / sum(weights), 2)
+            group_nodes.append(group_node)
+
+        group_links = [
+            {"source": source, "target": target, "value": totals[0], "links": totals[1]}
+            for (source, target), totals in sorted(between.items())
+        ]
+        meta = {key: value for key, value in universe.get("meta", {}).items() if key not in UniverseLOD.OVERVIEW_META_EXCLUDED}
+        return {"meta": meta, "nodes": group_nodes, "links": group_links}
+
+    @staticmethod
+    def tiles(universe: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """!
+        @brief One tile per group: `{ group, nodes, links, crossLinks, external }`.
+        """
+        nodes: List[Dict[str, Any]] = universe.get("nodes", [])
+        group_of = UniverseLOD._group_of(nodes)
+
+        tiles: Dict[str, Dict[str, Any]] = {}
+        for node in nodes:
+            group = group_of[node["id"]]
+            tiles.setdefault(group, {"group": group, "nodes": [], "links": [], "crossLinks": [], "external": {}})["nodes"].append(node)
+
+        for link in universe.get("links", []):
+            source_group, target_group = group_of.get(link["source"]), group_of.get(link["target"])
+            if source_group is None or target_group is None:
+                continue
+            if source_group == target_group:
+                tiles[source_group]["links"].append(link)
+                continue
+            for group, far_end, far_group in ((source_group, link["target"], target_group), (target_group, link["source"], source_group)):
+                tiles[group]["crossLinks"].append(link)
+                tiles[group]["external"][far_end] = far_group
+        return tiles
+
+    @staticmethod
+    def bounding_box(nodes: List[Dict[str, Any]]) -> Optional[List[float]]:
+        """`[min_x, min_y, max_x, max_y]` of the laid out `nodes`, None without a layout."""
+        placed = [node for node in nodes if "x" in node and "y" in node]
+        if not placed:
+            return None
+        xs = [node["x"] for node in placed]
+        ys = [node["y"] for node in placed]
+        return [min(xs), min(ys), max(xs), max(ys)]
+
+    @staticmethod
+    def index_entry(tile: Dict[str, Any], path: str) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "path": path,
+            "nodes": len(tile["nodes"]),
+            "links": len(tile["links"]),
+            "crossLinks": len(tile["crossLinks"]),
+            "val": sum(node.get("val", 0) for node in tile["nodes"])
+        }
+        bbox = UniverseLOD.bounding_box(tile["nodes"])
+        if bbox is not None:
+            entry["bbox"] = bbox
+        return entry
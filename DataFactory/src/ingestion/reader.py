@@ -1,4 +1,7 @@
-from typing import List
+import gzip
+import json
+from typing import List, Dict, Tuple, Any, Iterator
+from core.inverted_index import InvertedIndex
 
 class Reader:
     """!
@@ -14,18 +17,102 @@ class Reader:
         @param delimiter The string marker used to separate distinct JDs.
         @return A list of strings, where each string is one full job description.
         """
+        return list(Reader.iter_raw_jds(file_path, delimiter))
+
+    @staticmethod
+    def iter_raw_jds(file_path: str = "data/input/raw_jds.txt", delimiter: str = "###END###", chunk_size: int = 1 << 20) -> Iterator[str]:
+        """!
+        @brief Streams the job descriptions of a raw file without loading it whole (same segmentation as `load_raw_jds`).
+        
+        @param file_path Path to the raw text file.
+        @param delimiter The string marker used to separate distinct JDs.
+        @param chunk_size Number of characters read at a time.
+        @return An iterator over the stripped, non-empty JDs.
+        """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content: str = f.read()
-                raw_segments: List[str] = content.split(delimiter)
-                jds: List[str] = []
-                for segment in raw_segments:
-                    cleaned_segment: str = segment.strip()
-                    if cleaned_segment:
-                        jds.append(cleaned_segment)
-
-                return jds
-                
+                buffer: str = ""
+                while True:
+                    chunk: str = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    buffer += chunk
+                    raw_segments: List[str] = buffer.split(delimiter)
+                    # The last segment may continue in the next chunk
+                    buffer = raw_segments.pop()
+                    for segment in raw_segments:
+                        cleaned_segment: str = segment.strip()
+                        if cleaned_segment:
+                            yield cleaned_segment
+
+                cleaned_segment = buffer.strip()
+                if cleaned_segment:
+                    yield cleaned_segment
+
         except FileNotFoundError:
             print(f"❌ Error: {file_path} not found!")
-            return []
+
+    @staticmethod
+    def load_json(file_path: str) -> Dict[str, Any]:
+        """!
+        @brief Loads a previously exported JSON document (e.g. `universe.json`, `manifest.json`).
+        
+        @param file_path Path to the JSON file.
+        @return The parsed document; empty if the file is missing or unreadable.
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def load_node_positions(universe_path: str) -> Dict[str, Tuple[float, float]]:
+        """!
+        @brief Loads node coordinates from a previously exported `universe.json` (layout warm start).
+        
+        @param universe_path Path to the previous `universe.json`.
+        @return `{ node_id: (x, y) }` for every node that carries coordinates; empty if the file is missing or unreadable.
+        """
+        universe = Reader.load_json(universe_path)
+        return {
+            node["id"]: (float(node["x"]), float(node["y"]))
+            for node in universe.get("nodes", [])
+            if "x" in node and "y" in node
+        }
+
+    @staticmethod
+    def load_inverted_index(file_path: str) -> InvertedIndex:
+        """!
+        @brief Loads an `inverted_index.bin` written by `Writer.save_inverted_index`.
+        
+        @param file_path Path to the index file.
+        @return The index, ready for `query` / `count`.
+        """
+        with open(file_path, "rb") as f:
+            return InvertedIndex.from_bytes(f.read())
+
+    @staticmethod
+    def load_partial_stats(file_path: str) -> Dict[str, Any]:
+        """!
+        @brief Loads a shard's partial stats file written by `Writer.save_partial_stats`.
+        
+        @param file_path Path to the `.json.gz` partial.
+        @return The partial document (validate it with `PartialStats.validate`).
+        """
+        with gzip.open(file_path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def load_temporal_state(file_path: str) -> Dict[str, Any]:
+        """!
+        @brief Loads the time-bucketed statistics written by `Writer.save_temporal_state`.
+        
+        @param file_path Path to the `.json.gz` state.
+        @return The state document; empty if there is no state yet.
+        """
+        try:
+            with gzip.open(file_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
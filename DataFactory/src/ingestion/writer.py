@@ -1,7 +1,13 @@
 import json
 import csv
+import gzip
 import os
 from typing import List, Dict, Any, Tuple
+from ingestion.reader import Reader
+from core.universe_delta import UniverseDelta
+from core.inverted_index import InvertedIndex
+from core.graph_store import GraphStore
+from core.universe_lod import UniverseLOD
 
 class Writer:
     """!
@@ -14,9 +20,11 @@ class Writer:
             os.makedirs(output_dir)
 
     @staticmethod
-    def save_universe(nodes_list: List[Dict[str, Any]], edge_counts: Dict[Tuple[str, str], Dict[str, int]], meta: Dict[str, Any] = None, output_dir: str = "data/output") -> None:
+    def save_universe(nodes_list: List[Dict[str, Any]], edge_counts: Dict[Tuple[str, str], Dict[str, int]], meta: Dict[str, Any] = None, output_dir: str = "data/output", edge_scores: Dict[Tuple[str, str], Dict[str, float]] = None) -> Dict[str, Any]:
         """!
         @brief Serializes the graph data into the canonical `universe.json` format.
+        @details If `edge_scores` is given (see `EdgeScorer.score_edges`), each link also carries its `lift`, `pmi`, `npmi` and `disparity`.
+        @return The universe document that was written.
         """
         Writer.ensure_output_dir(output_dir)
         
@@ -26,7 +34,7 @@ class Writer:
                 seniority_score: float = round(stats["senior_count"] / stats["total"], 2)
                 managerial_score: float = round(stats["managerial_count"] / stats["total"], 2)
 
-                links_list.append({
+                link: Dict[str, Any] = {
                     "source": src,
                     "target": tgt,
                     "value": stats["total"],
@@ -34,7 +42,10 @@ class Writer:
                     "managerialScore": managerial_score,
                     "isSenior": seniority_score > 0.6,
                     "isManagerial": managerial_score > 0.4
-                })
+                }
+                if edge_scores and (src, tgt) in edge_scores:
+                    link.update(edge_scores[(src, tgt)])
+                links_list.append(link)
 
         universe_json: Dict[str, Any] = {
             "meta": meta if meta else {},
@@ -46,12 +57,249 @@ class Writer:
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(universe_json, f, indent=4)
         print(f"✅ Created {output_path}")
+        return universe_json
+
+    @staticmethod
+    def save_generation(
+        universe: Dict[str, Any],
+        previous_universe: Dict[str, Any],
+        output_dir: str = "data/output",
+        snapshot_every: int = 7,
+        keep_snapshots: int = 3,
+        tolerance: float = 0.01
+    ) -> Dict[str, Any]:
+        """!
+        @brief Writes the delta against the previous generation, periodic full snapshots and `manifest.json`.
+
+        @details
+        -   `deltas/delta_<generation>.json`: patch from the previous generation (see `UniverseDelta`), computed
+            against the universe consumers hold (newest snapshot plus the later deltas). When the delta would be
+            at least as large as the universe itself, a snapshot is written instead.
+        -   `snapshots/universe_<generation>.json`: full copy on the first run and every `snapshot_every`
+            generations (0: only on the first run and in place of oversized deltas).
+        -   `manifest.json`: current generation plus the available snapshots and deltas, so a consumer can
+            catch up from its own generation or reload the nearest snapshot.
+        Only the newest `keep_snapshots` snapshots are kept, along with the deltas that build on them.
+
+        @param universe The universe just written (`meta.generation` set).
+        @param previous_universe The universe of the previous run (empty on the first run).
+        @param tolerance Relative change below which derived metrics are left out of deltas.
+        @return The manifest that was written.
+        """
+        generation: int = universe["meta"]["generation"]
+        manifest_path: str = os.path.join(output_dir, "manifest.json")
+        manifest: Dict[str, Any] = Reader.load_json(manifest_path)
+        snapshots: List[Dict[str, Any]] = manifest.get("snapshots", [])
+        deltas: List[Dict[str, Any]] = manifest.get("deltas", [])
+
+        snapshot_due = not snapshots or (snapshot_every > 0 and generation % snapshot_every == 0)
+        if previous_universe.get("nodes"):
+            delta = UniverseDelta.compute(Writer._consumer_universe(output_dir, snapshots, deltas, previous_universe), universe, tolerance)
+            delta_data = json.dumps(delta, separators=(",", ":"))
+            if len(delta_data) < len(json.dumps(universe, separators=(",", ":"))):
+                delta_file: str = os.path.join("deltas", f"delta_{generation:06d}.json")
+                Writer.ensure_output_dir(os.path.join(output_dir, "deltas"))
+                with open(os.path.join(output_dir, delta_file), "w", encoding="utf-8") as f:
+                    f.write(delta_data)
+                deltas.append({"generation": generation, "baseGeneration": delta["baseGeneration"], "file": delta_file})
+                print(f"✅ Created {os.path.join(output_dir, delta_file)}")
+            else:
+                snapshot_due = True
+
+        if snapshot_due:
+            snapshot_file: str = os.path.join("snapshots", f"universe_{generation:06d}.json")
+            Writer.ensure_output_dir(os.path.join(output_dir, "snapshots"))
+            with open(os.path.join(output_dir, snapshot_file), "w", encoding="utf-8") as f:
+                json.dump(universe, f, separators=(",", ":"))
+            snapshots.append({"generation": generation, "file": snapshot_file})
+            print(f"✅ Created {os.path.join(output_dir, snapshot_file)}")
+
+        # Retention: drop old snapshots and the deltas no retained snapshot needs
+        expired = snapshots[:-keep_snapshots] if keep_snapshots > 0 else []
+        snapshots = snapshots[len(expired):]
+        oldest = snapshots[0]["generation"] if snapshots else generation
+        expired += [entry for entry in deltas if entry["generation"] <= oldest]
+        deltas = [entry for entry in deltas if entry["generation"] > oldest]
+        for entry in expired:
+            expired_path = os.path.join(output_dir, entry["file"])
+            if os.path.exists(expired_path):
+                os.remove(expired_path)
+
+        manifest = {
+            "generation": generation,
+            "latest": "universe.json",
+            "snapshotEvery": snapshot_every,
+            "snapshots": snapshots,
+            "deltas": deltas
+        }
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4)
+        print(f"✅ Created {manifest_path}")
+        return manifest
+
+    @staticmethod
+    def _consumer_universe(output_dir: str, snapshots: List[Dict[str, Any]], deltas: List[Dict[str, Any]], previous_universe: Dict[str, Any]) -> Dict[str, Any]:
+        """The previous generation as consumers rebuild it (newest snapshot + later deltas); `previous_universe` if that chain is broken."""
+        previous_generation = previous_universe.get("meta", {}).get("generation", 0)
+        if snapshots:
+            base = snapshots[-1]["generation"]
+            chain = [entry for entry in deltas if entry["generation"] > base]
+            if [entry["generation"] for entry in chain] == list(range(base + 1, previous_generation + 1)):
+                try:
+                    return UniverseDelta.replay(
+                        Reader.load_json(os.path.join(output_dir, snapshots[-1]["file"])),
+                        [Reader.load_json(os.path.join(output_dir, entry["file"])) for entry in chain])
+                except (KeyError, ValueError):
+                    pass
+        return previous_universe
+
+    @staticmethod
+    def save_neighbor_index(index: Dict[str, Dict[str, List[List[Any]]]], meta: Dict[str, Any] = None, output_dir: str = "data/output") -> None:
+        """!
+        @brief Serializes the per-skill top-k neighbor lists into `neighbors.json` (compact, no indentation).
+        """
+        Writer.ensure_output_dir(output_dir)
+
+        neighbors_json: Dict[str, Any] = {
+            "meta": meta if meta else {},
+            "index": index
+        }
+
+        output_path: str = os.path.join(output_dir, "neighbors.json")
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(neighbors_json, f, separators=(",", ":"))
+        print(f"✅ Created {output_path}")
+
+    @staticmethod
+    def save_stacks(stacks: List[Dict[str, Any]], meta: Dict[str, Any] = None, output_dir: str = "data/output") -> None:
+        """!
+        @brief Serializes the frequent skill stacks (see `StackMiner.mine`) into `stacks.json`.
+        """
+        Writer.ensure_output_dir(output_dir)
+
+        output_path: str = os.path.join(output_dir, "stacks.json")
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta if meta else {}, "stacks": stacks}, f, indent=4)
+        print(f"✅ Created {output_path}")
+
+    @staticmethod
+    def save_taxonomy_diff(diff: Dict[str, Any], output_dir: str = "data/output") -> None:
+        """!
+        @brief Serializes the multi-taxonomy comparison (see `AnalyticsEngine.compare_taxonomy_runs`) into `taxonomy_diff.json`.
+        """
+        Writer.ensure_output_dir(output_dir)
+
+        output_path: str = os.path.join(output_dir, "taxonomy_diff.json")
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(diff, f, indent=4)
+        print(f"✅ Created {output_path}")
+
+    @staticmethod
+    def save_inverted_index(index: InvertedIndex, output_dir: str = "data/output") -> None:
+        """!
+        @brief Serializes the skill -> JD inverted index into `inverted_index.bin` (see `InvertedIndex.to_bytes`).
+        """
+        Writer.ensure_output_dir(output_dir)
+
+        output_path: str = os.path.join(output_dir, "inverted_index.bin")
+        with open(output_path, "wb") as f:
+            f.write(index.to_bytes())
+        print(f"✅ Created {output_path}")
+
+
+    @staticmethod
+    def save_graph_store(universe: Dict[str, Any], output_dir: str = "data/output") -> None:
+        """!
+        @brief Persists the universe to the indexed SQLite store `graph.sqlite` (see `GraphStore`).
+        """
+        Writer.ensure_output_dir(output_dir)
+
+        output_path: str = os.path.join(output_dir, "graph.sqlite")
+        GraphStore.build(universe, output_path)
+        print(f"✅ Created {output_path}")
+
+    @staticmethod
+    def save_lod(universe: Dict[str, Any], output_dir: str = "data/output", subdir: str = "lod") -> Dict[str, Any]:
+        """!
+        @brief Writes the level-of-detail hierarchy of `universe` (see `UniverseLOD`) to `<output_dir>/<subdir>/`.
+
+        @details
+        -   `overview.json`: the group x group rollup graph.
+        -   `tiles/<group>.json`: one tile per taxonomy group.
+        -   `index.json`: overview and tile paths (relative to the index) with sizes, counts and bounding boxes.
+        Every file is written to a temporary name and renamed, the index is written after the tiles, and tiles of
+        groups that disappeared are removed only once the new index is in place, so a client reading either index
+        never follows a dangling path or reads a half-written tile.
+        @return The index that was written.
+        """
+        lod_dir: str = os.path.join(output_dir, subdir)
+        tiles_dir: str = os.path.join(lod_dir, "tiles")
+        Writer.ensure_output_dir(tiles_dir)
+
+        def write_compact(document: Dict[str, Any], path: str) -> int:
+            data = json.dumps(document, separators=(",", ":")).encode("utf-8")
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+            return len(data)
+
+        overview = UniverseLOD.overview(universe)
+        index: Dict[str, Any] = {
+            "format": UniverseLOD.FORMAT,
+            "version": UniverseLOD.VERSION,
+            "overview": {"path": "overview.json", "bytes": write_compact(overview, os.path.join(lod_dir, "overview.json"))},
+            "tiles": {}
+        }
+        if "generation" in universe.get("meta", {}):
+            index["generation"] = universe["meta"]["generation"]
+
+        tiles = UniverseLOD.tiles(universe)
+        names = UniverseLOD.tile_names(list(tiles))
+        for group in sorted(tiles):
+            entry = UniverseLOD.index_entry(tiles[group], f"tiles/{names[group]}")
+            entry["bytes"] = write_compact(tiles[group], os.path.join(tiles_dir, names[group]))
+            index["tiles"][group] = entry
+
+        index_path: str = os.path.join(lod_dir, "index.json")
+        write_compact(index, index_path)
+
+        for stale_name in set(os.listdir(tiles_dir)) - set(names.values()):
+            os.remove(os.path.join(tiles_dir, stale_name))
+        print(f"✅ Created {index_path} ({len(tiles)} tiles)")
+        return index
+
+    @staticmethod
+    def save_partial_stats(document: Dict[str, Any], output_path: str) -> None:
+        """!
+        @brief Writes a shard's partial stats document (see `PartialStats.to_document`) as gzip-compressed JSON.
+        """
+        Writer.ensure_output_dir(os.path.dirname(output_path) or ".")
+
+        with gzip.open(output_path, "wt", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"))
+        print(f"✅ Created {output_path}")
+
+
+    @staticmethod
+    def save_temporal_state(document: Dict[str, Any], output_path: str) -> None:
+        """!
+        @brief Writes the time-bucketed statistics (see `TemporalStats.to_document`) as gzip-compressed JSON.
+        @details The file is written next to its destination and then renamed, so an interrupted run keeps the previous state.
+        """
+        Writer.ensure_output_dir(os.path.dirname(output_path) or ".")
+
+        temp_path = output_path + ".tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"))
+        os.replace(temp_path, output_path)
+        print(f"✅ Created {output_path}")
 
 
     @staticmethod
-    def save_cosmograph_files(node_stats: Dict[str, Dict[str, int]], edge_counts: Dict[Tuple[str, str], Dict[str, int]], skill_to_group: Dict[str, str], output_dir: str = "data/output") -> None:
+    def save_cosmograph_files(node_stats: Dict[str, Dict[str, int]], edge_counts: Dict[Tuple[str, str], Dict[str, int]], skill_to_group: Dict[str, str], output_dir: str = "data/output", positions: Dict[str, Tuple[float, float]] = None) -> None:
         """!
         @brief Exports graph data to CSV format optimized for Cosmograph.app.
+        @details If `positions` is given (see `ForceLayout`), nodes.csv gains `x` and `y` columns so the layout is not recomputed in the browser.
         """
         Writer.ensure_output_dir(output_dir)
 
@@ -59,10 +307,13 @@ class Writer:
         nodes_path: str = os.path.join(output_dir, "nodes.csv")
         with open(nodes_path, "w", encoding="utf-8", newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(["id", "group", "val"]) # Header
+            writer.writerow(["id", "group", "val"] + (["x", "y"] if positions else [])) # Header
             for skill, stats in node_stats.items():
                 if stats["total"] > 0:
-                    writer.writerow([skill, skill_to_group.get(skill, "Unknown"), stats["total"]])
+                    row: List[Any] = [skill, skill_to_group.get(skill, "Unknown"), stats["total"]]
+                    if positions:
+                        row.extend(positions.get(skill, ("", "")))
+                    writer.writerow(row)
         print(f"✅ Created {nodes_path}")
 
         # Edges CSV
@@ -3,7 +3,12 @@
 @brief The Main Entry Point for the CareerNavigator DataFactory Pipeline.
 """
 
-from typing import List, Dict, Tuple, Any
+import argparse
+import hashlib
+import os
+import time
+from datetime import date
+from typing import List, Dict, Tuple, Any, Optional
 from collections import Counter
 
 # Internal Modules
@@ -12,7 +17,22 @@ from ingestion.reader import Reader
 from ingestion.writer import Writer
 from core.taxonomy import TaxonomyManager
 from core.graph_engine import GraphBuilder, GraphStats
+from core.edge_accumulator import SpillingEdgeCounter
+from core.neighbor_index import NeighborIndex
+from core.edge_scoring import EdgeScorer
+from core.adjacency import AdjacencyMatrix
+from core.community import CommunityDetector
+from core.layout import ForceLayout
+from core.inverted_index import InvertedIndex
+from core.stack_miner import StackMiner
+from core.partial_stats import PartialStats
+from core.preview_sampler import PreviewSampler
+from core.temporal_stats import TemporalStats
+from core.checkpoint import Checkpoint, CheckpointWriter
+from core.jd_records import JDRecordWriter
 from utils.text_processor import TextProcessor
+from utils.fuzzy_matcher import FuzzySkillIndex
+from utils.ngram_matcher import NgramSkillMatcher
 from utils.seniority_analyzer import SeniorityAnalyzer
 from utils.analytics import AnalyticsEngine
 from utils.logger import get_logger
@@ -23,18 +43,36 @@ logger = get_logger(__name__)
 def analyze_jd_content(
     jd_text: str,
     matchable_terms: List[str],
-    alias_map: Dict[str, str]) -> Tuple[List[str], bool, str]:
+    alias_map: Dict[str, str],
+    fuzzy_index: Optional[FuzzySkillIndex] = None,
+    ngram_matcher: Optional[NgramSkillMatcher] = None) -> Tuple[List[str], bool, str]:
     """!
     @brief Analyzes a single Job Description to extract skills and determine seniority.
+    @details Uses the n-gram extractor when an `ngram_matcher` is supplied, the regex extractor otherwise.
+    """
+    found_skills, _, seniority_info = analyze_jd_record(jd_text, matchable_terms, alias_map, fuzzy_index, ngram_matcher)
+    return found_skills, seniority_info['is_senior'], seniority_info['level']
+
+def analyze_jd_record(
+    jd_text: str,
+    matchable_terms: List[str],
+    alias_map: Dict[str, str],
+    fuzzy_index: Optional[FuzzySkillIndex] = None,
+    ngram_matcher: Optional[NgramSkillMatcher] = None) -> Tuple[List[str], str, Dict[str, Any]]:
+    """!
+    @brief `analyze_jd_content` keeping the intermediate results: found skills, title candidate and the full seniority info (score, level).
     """
     # 1. Detect Seniority
     title: str = TextProcessor.extract_title_candidate(jd_text)
     seniority_info: Dict[str, Any] = SeniorityAnalyzer.detect_seniority(title, jd_text)
     
     # 2. Extract Skills (Using Greedy Longest-Match Strategy)
-    found_skills: List[str] = TextProcessor.extract_skills(jd_text, matchable_terms, alias_map)
+    if ngram_matcher is not None:
+        found_skills: List[str] = TextProcessor.extract_skills_ngram(jd_text, ngram_matcher, fuzzy_index)
+    else:
+        found_skills = TextProcessor.extract_skills(jd_text, matchable_terms, alias_map, fuzzy_index)
     
-    return found_skills, seniority_info['is_senior'], seniority_info['level']
+    return found_skills, title, seniority_info
 
 def print_execution_summary(jds_count: int, nodes_count: int, edges_count: int, seniority_dist: Counter) -> None:
     logger.info(f"✨ Done! Processed {jds_count} JDs.")
@@ -70,62 +108,592 @@ def init_data() -> Tuple[List[str], GraphStats, List[str], Dict[str, str], Dict[
 
     logger.info(f"Taxonomy loaded: {len(all_skills)} canonical skills, {len(matchable_terms)} matchable terms, {len(alias_map)} alias mappings.")
 
-    stats = GraphBuilder.initialize_stats(all_skills)
+    edge_memory_budget_mb = cfg.get("pipeline.edge_memory_budget_mb", 0)
+    stats = GraphBuilder.initialize_stats(all_skills, edge_memory_budget_mb=edge_memory_budget_mb)
     logger.info("Graph statistics initialized.")
+    if edge_memory_budget_mb > 0:
+        logger.info(f"Edge counting bounded to ~{edge_memory_budget_mb} MB (long tail spills to disk).")
     
     return jds, stats, matchable_terms, alias_map, skill_to_group, threshold
 
-def process_data() -> None:
+def build_fuzzy_index(alias_map: Dict[str, str]) -> Optional[FuzzySkillIndex]:
+    """!
+    @brief Builds the typo-tolerant skill index when `matching.fuzzy` is enabled.
+    """
+    if not cfg.get("matching.fuzzy", False):
+        return None
+
+    fuzzy_index = FuzzySkillIndex(
+        alias_map,
+        max_edit_distance=cfg.get("matching.fuzzy_max_edit_distance", 1),
+        min_term_length=cfg.get("matching.fuzzy_min_term_length", 7)
+    )
+    logger.info(f"Fuzzy matching enabled (max edit distance: {fuzzy_index.max_edit_distance}).")
+    return fuzzy_index
+
+def build_ngram_matcher(alias_map: Dict[str, str]) -> Optional[NgramSkillMatcher]:
+    """!
+    @brief Builds the n-gram hash matcher when `matching.mode` is "ngram".
+    """
+    mode = cfg.get("matching.mode", "regex")
+    if mode != "ngram":
+        return None
+
+    ngram_matcher = NgramSkillMatcher(alias_map)
+    logger.info(f"N-gram extraction enabled (max term length: {ngram_matcher.max_term_tokens} tokens).")
+    return ngram_matcher
+
+def finalize_and_export(
+    total_jobs: int,
+    stats: GraphStats,
+    skill_to_group: Dict[str, str],
+    threshold: int,
+    output_dir: str,
+    inverted_index: Optional[InvertedIndex] = None,
+    preview: Optional[Dict[str, Any]] = None) -> None:
+    """!
+    @brief Turns accumulated `GraphStats` into the final graph and writes every export to `output_dir`.
+    @details Shared by the single-taxonomy run and each taxonomy of a multi-taxonomy run.
+    For preview runs, `preview` carries the sampling summary (stored in `meta.preview`) and the intervals
+    returned by `PreviewSampler.scale_stats`, exported as `valCI` on nodes and `valueCI` on links.
+    """
+    # 4. Final Transformation
+    logger.info("Performing final graph transformations and filtering...")
+    final_nodes_list, active_node_ids, seniority_scores = GraphBuilder.prepare_nodes_list(stats.node_stats, skill_to_group, threshold)
+    logger.info(f"Nodes prepared: {len(final_nodes_list)} active nodes (Threshold: {threshold}).")
+    
+    filtered_edge_counts = GraphBuilder.filter_edges(stats.edge_counts, active_node_ids, threshold)
+    logger.info(f"Edges filtered: {len(filtered_edge_counts)} edges remaining.")
+    if isinstance(stats.edge_counts, SpillingEdgeCounter):
+        logger.info(f"Merged {stats.edge_counts.run_count} spilled edge runs.")
+        stats.edge_counts.close()
+
+    edge_scores = EdgeScorer.score_edges(filtered_edge_counts, stats.node_stats, total_jobs)
+    filtered_edge_counts = EdgeScorer.prune_edges(
+        filtered_edge_counts,
+        edge_scores,
+        mode=cfg.get("pipeline.edge_pruning", "none"),
+        alpha=cfg.get("pipeline.edge_pruning_alpha", 0.05),
+        top_k=cfg.get("pipeline.edge_pruning_top_k", 10),
+        min_npmi=cfg.get("pipeline.edge_pruning_min_npmi", 0.0))
+    
+    meta = AnalyticsEngine.calculate_seniority_distribution(seniority_scores, len(final_nodes_list))
+    logger.info("Seniority distribution calculated.")
+
+    link_fields = edge_scores
+    if preview is not None:
+        meta["preview"] = preview["summary"]
+        for node in final_nodes_list:
+            node["valCI"] = list(preview["intervals"]["nodes"].get(node["id"], (0, 0)))
+        link_fields = {
+            pair: {**edge_scores.get(pair, {}), "valueCI": list(preview["intervals"]["edges"][pair])}
+            for pair in filtered_edge_counts
+        }
+
+    if cfg.get("analytics.graph_metrics", True):
+        metrics = AnalyticsEngine.calculate_graph_metrics(
+            active_node_ids,
+            filtered_edge_counts,
+            damping=cfg.get("analytics.pagerank_damping", 0.85),
+            max_iter=cfg.get("analytics.max_iter", 100),
+            tol=cfg.get("analytics.tolerance", 1e-8))
+        meta["graphMetrics"] = AnalyticsEngine.attach_graph_metrics(final_nodes_list, active_node_ids, metrics)
+        logger.info("Graph metrics (degree, PageRank, eigenvector centrality, clustering) calculated.")
+
+    if cfg.get("analytics.communities", True):
+        adjacency = AdjacencyMatrix.from_edges(active_node_ids, filtered_edge_counts)
+        resolution = cfg.get("analytics.community_resolution", 1.0)
+        labels = CommunityDetector.detect(adjacency, resolution=resolution, seed=cfg.get("analytics.community_seed", 42))
+        meta["communities"] = CommunityDetector.summarize(final_nodes_list, active_node_ids, labels, adjacency)
+        meta["modularity"] = round(CommunityDetector.modularity(adjacency, labels, resolution), 4)
+        logger.info(f"Community detection: {len(meta['communities'])} communities (modularity {meta['modularity']}).")
+
+    # 5. Export
+
+    positions = None
+    if cfg.get("layout.enabled", False):
+        previous_positions = Reader.load_node_positions(os.path.join(output_dir, "universe.json")) if cfg.get("layout.warm_start", True) else {}
+        layout_positions = ForceLayout.compute(
+            AdjacencyMatrix.from_edges(active_node_ids, filtered_edge_counts),
+            seed=cfg.get("layout.seed", 42),
+            iterations=cfg.get("layout.warm_iterations", 50) if previous_positions else cfg.get("layout.iterations", 300),
+            initial_positions=previous_positions,
+            exact_threshold=cfg.get("layout.exact_threshold", 2000))
+        positions = ForceLayout.to_dict(active_node_ids, layout_positions)
+        for node in final_nodes_list:
+            node["x"], node["y"] = positions[node["id"]]
+        logger.info(f"Layout computed for {len(positions)} nodes ({'warm start' if previous_positions else 'cold start'}).")
+
+    delta_export = cfg.get("export.delta", False)
+    if delta_export:
+        previous_universe = Reader.load_json(os.path.join(output_dir, "universe.json"))
+        meta["generation"] = previous_universe.get("meta", {}).get("generation", 0) + 1
+
+    logger.info(f"Exporting data to {output_dir}...")
+    universe = Writer.save_universe(final_nodes_list, filtered_edge_counts, meta=meta, output_dir=output_dir, edge_scores=link_fields)
+
+    if delta_export:
+        manifest = Writer.save_generation(
+            universe,
+            previous_universe,
+            output_dir=output_dir,
+            snapshot_every=cfg.get("export.snapshot_every", 7),
+            keep_snapshots=cfg.get("export.keep_snapshots", 3),
+            tolerance=cfg.get("export.delta_tolerance", 0.01))
+        logger.info(f"Generation {meta['generation']} exported ({len(manifest['deltas'])} deltas, {len(manifest['snapshots'])} snapshots retained).")
+
+    if cfg.get("export.graph_store", False):
+        Writer.save_graph_store(universe, output_dir=output_dir)
+        logger.info("Graph store written (ego network, group subgraph and top-edge queries via `GraphStore`).")
+
+    if cfg.get("export.lod", False):
+        lod_index = Writer.save_lod(universe, output_dir=output_dir, subdir=cfg.get("export.lod_subdir", "lod"))
+        logger.info(f"Level-of-detail export: overview ({lod_index['overview']['bytes']} bytes) and {len(lod_index['tiles'])} group tiles.")
+
+    neighbor_top_k = cfg.get("export.neighbor_top_k", 10)
+    neighbor_index = NeighborIndex.build(final_nodes_list, filtered_edge_counts, edge_scores, k=neighbor_top_k)
+    Writer.save_neighbor_index(neighbor_index, meta={"k": neighbor_top_k, "totalJobs": total_jobs, "seniorBoost": NeighborIndex.SENIOR_BOOST}, output_dir=output_dir)
+    logger.info(f"Neighbor index built for {len(neighbor_index)} skills (top {neighbor_top_k}).")
+    
+    if cfg.get("export.inverted_index", False) and inverted_index is not None:
+        Writer.save_inverted_index(inverted_index, output_dir=output_dir)
+        logger.info(f"Inverted index written: {len(inverted_index.skills())} skills over {inverted_index.n_docs} JDs.")
+
+    if cfg.get("mining.enabled", False) and inverted_index is not None:
+        mining_settings = {
+            "minSupport": cfg.get("mining.min_support", 0.02),
+            "maxSize": cfg.get("mining.max_size", 4),
+            "topN": cfg.get("mining.top_n", 50)
+        }
+        stacks = StackMiner.mine(
+            inverted_index,
+            min_support=mining_settings["minSupport"],
+            max_size=mining_settings["maxSize"],
+            top_n=mining_settings["topN"],
+            time_budget_s=cfg.get("mining.time_budget_seconds", 60))
+        Writer.save_stacks(stacks, meta={**mining_settings, "totalJobs": inverted_index.n_docs}, output_dir=output_dir)
+        logger.info(f"Stack mining: {len(stacks)} frequent stacks exported.")
+
+    # 6. Cosmograph Export
+    logger.info("Exporting Cosmograph files...")
+    filtered_node_stats = {k: v for k, v in stats.node_stats.items() if k in active_node_ids}
+    Writer.save_cosmograph_files(filtered_node_stats, filtered_edge_counts, skill_to_group, output_dir=output_dir, positions=positions)
+
+    # 7. Summary
+    print_execution_summary(total_jobs, len(final_nodes_list), len(filtered_edge_counts), stats.seniority_dist)
+
+def process_taxonomies(taxonomies: Dict[str, str]) -> None:
+    """!
+    @brief Builds one universe per taxonomy file from a single pass over the corpus.
+
+    @details
+    The corpus is read once, and title/seniority detection, text cleaning and tokenization run once per JD
+    (see `TextProcessor.extract_skills_multi`); only the n-gram matching is repeated per taxonomy.
+    Each taxonomy gets its own `GraphStats` and output directory (`<output_dir>/<name>/`), and
+    `taxonomy_diff.json` lists which skills gained or lost hits against the first taxonomy.
+
+    @param taxonomies `{ name: alias_json path }` (relative paths resolve against the project root).
+    """
+    threshold = cfg.get("pipeline.threshold", 1)
+    input_path = cfg.get_abs_path("paths.test_input")
+    output_root = cfg.get_abs_path("paths.output_dir")
+
+    logger.info(f"Scanning raw data from {input_path}...")
+    jds: List[str] = Reader.load_raw_jds(file_path=input_path)
+    if not jds:
+        logger.error("No JDs found. Exiting.")
+        return
+
+    names: List[str] = list(taxonomies.keys())
+    stats_by_name: Dict[str, GraphStats] = {}
+    groups_by_name: Dict[str, Dict[str, str]] = {}
+    matchers: List[NgramSkillMatcher] = []
+    fuzzy_indexes: List[Optional[FuzzySkillIndex]] = []
+    inverted_indexes: Dict[str, Optional[InvertedIndex]] = {}
+    collect_index = cfg.get("export.inverted_index", False) or cfg.get("mining.enabled", False)
+
+    for name in names:
+        path = taxonomies[name]
+        if not os.path.isabs(path):
+            path = os.path.join(cfg.project_root, path)
+        alias_map = TaxonomyManager.get_alias_map(path)
+        all_skills = TaxonomyManager.get_all_skills(path)
+        logger.info(f"Taxonomy '{name}' loaded from {path}: {len(all_skills)} canonical skills, {len(alias_map)} alias mappings.")
+
+        stats_by_name[name] = GraphBuilder.initialize_stats(all_skills, edge_memory_budget_mb=cfg.get("pipeline.edge_memory_budget_mb", 0))
+        groups_by_name[name] = TaxonomyManager.get_skill_to_group_map(path)
+        matchers.append(NgramSkillMatcher(alias_map))
+        fuzzy_indexes.append(build_fuzzy_index(alias_map))
+        inverted_indexes[name] = InvertedIndex() if collect_index else None
+
+    logger.info(f"Analyzing {len(jds)} Job Descriptions against {len(names)} taxonomies...")
+    for idx, jd in enumerate(jds):
+        title: str = TextProcessor.extract_title_candidate(jd)
+        level: str = SeniorityAnalyzer.detect_seniority(title, jd)["level"]
+        per_taxonomy = TextProcessor.extract_skills_multi(jd, matchers, fuzzy_indexes)
+
+        for name, found_skills in zip(names, per_taxonomy):
+            stats = stats_by_name[name]
+            stats.seniority_dist[level] += 1
+            GraphBuilder.update_metrics(stats, found_skills, level)
+            if inverted_indexes[name] is not None:
+                inverted_indexes[name].add(idx, found_skills, level)
+
+        if (idx + 1) % 100 == 0:
+            logger.info(f"Processed {idx + 1}/{len(jds)} JDs...")
+
+    for name in names:
+        logger.info(f"Finalizing taxonomy '{name}'...")
+        finalize_and_export(len(jds), stats_by_name[name], groups_by_name[name], threshold, os.path.join(output_root, name), inverted_indexes[name])
+
+    diff = AnalyticsEngine.compare_taxonomy_runs({name: stats_by_name[name].node_stats for name in names}, baseline=names[0])
+    Writer.save_taxonomy_diff(diff, output_dir=output_root)
+    for name, comparison in diff["comparisons"].items():
+        logger.info(f"📊 '{name}' vs '{names[0]}': {comparison['totalHits']['candidate']} vs {comparison['totalHits']['baseline']} skill hits, "
+                    f"{len(comparison['gained'])} skills gained, {len(comparison['lost'])} lost.")
+        for change in (comparison["gained"] + comparison["lost"])[:10]:
+            logger.info(f"  - {change['skill']}: {change['baseline']} -> {change['candidate']} ({change['delta']:+d})")
+
+def load_temporal_stats() -> TemporalStats:
+    """!
+    @brief Restores the time-bucketed statistics of previous runs from `temporal.state_file` (empty on the first run).
+    """
+    temporal = TemporalStats.from_document(
+        Reader.load_temporal_state(cfg.get_abs_path("temporal.state_file")),
+        TaxonomyManager.get_all_skills(),
+        bucket_days=cfg.get("temporal.bucket_days", 7),
+        half_life_days=cfg.get("temporal.half_life_days", 30))
+    logger.info(f"Temporal state loaded: {len(temporal.buckets)} buckets (latest posting: {temporal.latest}).")
+    return temporal
+
+def export_temporal_views(temporal: TemporalStats, skill_to_group: Dict[str, str], threshold: int, output_dir: str) -> None:
+    """!
+    @brief Persists the temporal state and exports the "last `window_days`" and decayed universes.
+    @details They go to `<output_dir>/recent/` and `<output_dir>/decayed/`, as of the latest posting date.
+    """
+    dropped = temporal.prune(cfg.get("temporal.retention_days", 365))
+    if dropped:
+        logger.info(f"Dropped {dropped} buckets older than the retention period.")
+    Writer.save_temporal_state(temporal.to_document(), cfg.get_abs_path("temporal.state_file"))
+
+    window_days = cfg.get("temporal.window_days", 90)
+    window_stats, window_jobs = temporal.window(window_days)
+    logger.info(f"Exporting the last {window_days} days up to {temporal.latest} ({window_jobs} JDs)...")
+    finalize_and_export(window_jobs, window_stats, skill_to_group, threshold, os.path.join(output_dir, "recent"))
+
+    decayed_stats, decayed_jobs = temporal.decayed_view()
+    logger.info(f"Exporting the decayed universe (half-life {temporal.half_life_days} days, {decayed_jobs} effective JDs)...")
+    finalize_and_export(decayed_jobs, decayed_stats, skill_to_group, cfg.get("temporal.decayed_threshold", threshold), os.path.join(output_dir, "decayed"))
+
+def default_partial_path(shard: int, num_shards: int) -> str:
+    return os.path.join(cfg.get_abs_path("paths.output_dir"), "partials", f"partial_{shard:04d}_of_{num_shards:04d}.json.gz")
+
+def checkpoint_directory(shard: Optional[int] = None, num_shards: int = 1) -> str:
+    """!
+    @brief The checkpoint directory of one run: `<checkpoint.directory>/shard_NNNN_of_NNNN` for a shard, `.../single` otherwise.
+    @details Shards of a sharded run may run concurrently on the same checkpoint directory, so each keeps (and clears)
+    its own checkpoints and edge runs.
+    """
+    name = f"shard_{shard:04d}_of_{num_shards:04d}" if shard is not None else "single"
+    return os.path.join(cfg.get_abs_path("checkpoint.directory"), name)
+
+def build_checkpoint_writer(resume: bool, shard: Optional[int] = None, num_shards: int = 1) -> Optional[CheckpointWriter]:
+    """!
+    @brief Builds the checkpoint writer of this run (see `checkpoint_directory`) when `checkpoint.enabled` is set (or a run is resumed).
+    @details A run that does not resume first removes the checkpoints and edge runs of earlier runs of the same
+    shard, which would otherwise outrank its own checkpoints and share their edge run file names.
+    """
+    if not (cfg.get("checkpoint.enabled", False) or resume):
+        return None
+    writer = CheckpointWriter(
+        checkpoint_directory(shard, num_shards),
+        every_jds=cfg.get("checkpoint.every_jds", 10000),
+        every_seconds=cfg.get("checkpoint.every_seconds", 300),
+        keep=cfg.get("checkpoint.keep", 2))
+    if not resume:
+        if Checkpoint.paths(writer.directory):
+            logger.warning(f"Removing the checkpoints of an earlier run in {writer.directory} (use --resume to continue it).")
+        writer.clear()
+    return writer
+
+def build_jd_record_writer(output_dir: str) -> JDRecordWriter:
+    """!
+    @brief Builds the per-JD record writer of `export.jd_records` (in `<output_dir>/jd_records/`).
+    """
+    return JDRecordWriter(
+        os.path.join(output_dir, "jd_records"),
+        TaxonomyManager.get_skill_index(),
+        SeniorityAnalyzer.LEVELS,
+        row_group_size=cfg.get("export.jd_records_row_group", 50000),
+        fmt=cfg.get("export.jd_records_format", "auto"))
+
+def digest_jds(digest: Any, jds: List[str]) -> None:
+    """Feeds JD texts to the running digest that ties a checkpoint to the input it was taken on."""
+    for jd in jds:
+        digest.update(jd.encode("utf-8"))
+        digest.update(b"\0")
+
+def process_data(shard: Optional[int] = None, num_shards: int = 1, partial_out: Optional[str] = None, resume: bool = False) -> None:
     """!
     @brief The main orchestrator function.
+    @details Runs `process_taxonomies` instead when `taxonomies` lists several taxonomy files.
+    When `shard` is given, runs as the map step of a sharded run: only the JDs with
+    `PartialStats.shard_of(jd, num_shards) == shard` are analyzed, and the raw `GraphStats` are written
+    to `partial_out` for `reduce_partials` instead of being exported.
+
+    With `checkpoint.enabled`, the loop state (stats, inverted index, time buckets, pending JD records, position in the corpus)
+    is checkpointed periodically (see `CheckpointWriter`). With `resume`, the run continues from the newest
+    valid checkpoint and exports exactly what an uninterrupted run would. Checkpoints are deleted once
+    the run completes.
+    @throws ValueError if the checkpoint was taken on a different corpus or shard.
     """
     logger.info("🚀 Starting Data Factory...")
 
+    taxonomies: Dict[str, str] = cfg.get("taxonomies", {})
+    if taxonomies and shard is None:
+        if resume or cfg.get("checkpoint.enabled", False):
+            logger.warning("Checkpoints are not supported for multi-taxonomy runs; processing from the first JD.")
+        if cfg.get("export.jd_records", False):
+            logger.warning("JD records are not supported for multi-taxonomy runs.")
+        if cfg.get("temporal.enabled", False):
+            logger.warning("Temporal trends are not supported for multi-taxonomy runs; the time buckets are left unchanged.")
+        process_taxonomies(taxonomies)
+        return
+
     jds, stats, matchable_terms, alias_map, skill_to_group, threshold = init_data()
     
     if not jds:
         logger.error("No JDs found. Exiting.")
         return
 
+    if shard is not None:
+        if taxonomies:
+            logger.warning("Sharded runs use `paths.alias_json` only; `taxonomies` is ignored.")
+        jds = [jd for jd in jds if PartialStats.shard_of(jd, num_shards) == shard]
+        logger.info(f"Shard {shard}/{num_shards}: {len(jds)} Job Descriptions assigned.")
+
+    fuzzy_index = build_fuzzy_index(alias_map)
+    ngram_matcher = build_ngram_matcher(alias_map)
+
+    # Stack mining runs on the inverted index, so it is collected for either feature.
+    # JD ordinals are corpus-wide, so sharded runs do not build it.
+    collect_index = cfg.get("export.inverted_index", False) or cfg.get("mining.enabled", False)
+    if collect_index and shard is not None:
+        logger.warning("The inverted index and stack mining are skipped in sharded runs.")
+    inverted_index = InvertedIndex() if collect_index and shard is None else None
+
+    # Posting dates feed the time buckets and decayed view; undated JDs count as posted today
+    temporal = load_temporal_stats() if cfg.get("temporal.enabled", False) and shard is None else None
+    undated_jds = 0
+
+    # Per-JD results (title, score, level, skill ids), streamed as the loop runs; ordinals are corpus-wide too
+    collect_records = cfg.get("export.jd_records", False)
+    if collect_records and shard is not None:
+        logger.warning("JD records are skipped in sharded runs.")
+    jd_records = build_jd_record_writer(cfg.get_abs_path("paths.output_dir")) if collect_records and shard is None else None
+
+    checkpoints = build_checkpoint_writer(resume, shard, num_shards)
+    digest = hashlib.sha1()
+    start = 0
+    if resume:
+        state = Checkpoint.latest(checkpoints.directory)
+        if state is None:
+            logger.warning(f"No valid checkpoint in {checkpoints.directory}; processing from the first JD.")
+        else:
+            start = state["position"]
+            digest_jds(digest, jds[:start])
+            if (state["shard"], state["numShards"]) != (shard, num_shards) or start > len(jds) or digest.hexdigest() != state["digest"]:
+                raise ValueError(f"The checkpoint in {checkpoints.directory} was taken on a different corpus or shard; remove it to start over.")
+            stats, inverted_index, temporal, undated_jds = state["stats"], state["invertedIndex"], state["temporal"], state["undatedJds"]
+            if jd_records is not None:
+                if state.get("jdRecords") is None:
+                    logger.warning("The checkpoint holds no JD records; they are not written for this run.")
+                jd_records = state.get("jdRecords")
+            logger.info(f"Resuming after JD {start}/{len(jds)}.")
+    if checkpoints is not None:
+        checkpoints.start(start, time.monotonic())
+    if jd_records is not None:
+        jd_records.start()
+
     # 3. ---- Main Processing Loop
     logger.info("Starting analysis of Job Descriptions...")
     total_jds = len(jds)
     
-    for idx, jd in enumerate(jds):
-        found_skills, is_senior, level = analyze_jd_content(jd, matchable_terms, alias_map)
+    for idx in range(start, total_jds):
+        jd = jds[idx]
+        found_skills, title, seniority_info = analyze_jd_record(jd, matchable_terms, alias_map, fuzzy_index, ngram_matcher)
+        level = seniority_info['level']
         
         stats.seniority_dist[level] += 1
         GraphBuilder.update_metrics(stats, found_skills, level)
+        if inverted_index is not None:
+            inverted_index.add(idx, found_skills, level)
+        if jd_records is not None:
+            jd_records.add(idx, jd, title, seniority_info['score'], level, found_skills)
+        if temporal is not None:
+            posted = TextProcessor.extract_posting_date(jd)
+            if posted is None:
+                undated_jds += 1
+            temporal.add(TemporalStats.fingerprint(jd), found_skills, level, posted or date.today())
         
         # Log progress every 100 JDs
         if (idx + 1) % 100 == 0:
             logger.info(f"Processed {idx + 1}/{total_jds} JDs...")
 
+        if checkpoints is not None:
+            digest_jds(digest, [jd])
+            if idx + 1 < total_jds and checkpoints.due(idx + 1, time.monotonic()):
+                checkpoints.save({
+                    "position": idx + 1,
+                    "digest": digest.hexdigest(),
+                    "shard": shard,
+                    "numShards": num_shards,
+                    "stats": stats,
+                    "invertedIndex": inverted_index,
+                    "temporal": temporal,
+                    "undatedJds": undated_jds,
+                    "jdRecords": jd_records
+                }, time.monotonic())
+
     logger.info("JD Analysis complete.")
+    if checkpoints is not None:
+        checkpoints.wait()
 
-    # 4. Final Transformation
-    logger.info("Performing final graph transformations and filtering...")
-    final_nodes_list, active_node_ids, seniority_scores = GraphBuilder.prepare_nodes_list(stats.node_stats, skill_to_group, threshold)
-    logger.info(f"Nodes prepared: {len(final_nodes_list)} active nodes (Threshold: {threshold}).")
-    
-    filtered_edge_counts = GraphBuilder.filter_edges(stats.edge_counts, active_node_ids, threshold)
-    logger.info(f"Edges filtered: {len(filtered_edge_counts)} edges remaining.")
-    
-    meta = AnalyticsEngine.calculate_seniority_distribution(seniority_scores, len(final_nodes_list))
-    logger.info("Seniority distribution calculated.")
+    if shard is not None:
+        partial_path = partial_out or default_partial_path(shard, num_shards)
+        Writer.save_partial_stats(PartialStats.to_document(stats, len(jds), shard, num_shards), partial_path)
+        if isinstance(stats.edge_counts, SpillingEdgeCounter):
+            stats.edge_counts.close()
+        if checkpoints is not None:
+            checkpoints.clear()
+        return
 
-    # 5. Export
-    output_dir = cfg.get_abs_path("paths.output_dir")
-    logger.info(f"Exporting data to {output_dir}...")
-    Writer.save_universe(final_nodes_list, filtered_edge_counts, meta=meta, output_dir=output_dir)
-    
-    # 6. Cosmograph Export
-    logger.info("Exporting Cosmograph files...")
-    filtered_node_stats = {k: v for k, v in stats.node_stats.items() if k in active_node_ids}
-    Writer.save_cosmograph_files(filtered_node_stats, filtered_edge_counts, skill_to_group, output_dir=output_dir)
+    finalize_and_export(len(jds), stats, skill_to_group, threshold, cfg.get_abs_path("paths.output_dir"), inverted_index)
+    if jd_records is not None:
+        jd_records.close()
 
-    # 7. Summary
-    print_execution_summary(len(jds), len(final_nodes_list), len(filtered_edge_counts), stats.seniority_dist)
+    if temporal is not None:
+        if undated_jds:
+            logger.warning(f"{undated_jds} JDs have no posting date and were bucketed as posted today.")
+        export_temporal_views(temporal, skill_to_group, threshold, cfg.get_abs_path("paths.output_dir"))
+
+    if checkpoints is not None:
+        checkpoints.clear()
+
+def preview_data() -> None:
+    """!
+    @brief Builds a preview universe from a uniform sample of the corpus, in `<output_dir>/<preview.output_subdir>/`.
+
+    @details
+    The corpus is streamed once (`Reader.iter_raw_jds`) and sampled with `PreviewSampler`: a Bernoulli sample
+    when `preview.sample_fraction` is set, otherwise a reservoir of `preview.sample_size` JDs. Only the sample
+    is analyzed; its counts are scaled to the corpus size before the usual finalization, and every node and
+    link carries the `preview.confidence` interval of its corpus-wide count.
+    """
+    logger.info("🚀 Starting Data Factory (preview)...")
+    threshold = cfg.get("pipeline.threshold", 1)
+    input_path = cfg.get_abs_path("paths.test_input")
+    seed = cfg.get("preview.seed", 42)
+    fraction = cfg.get("preview.sample_fraction", 0.0)
+    confidence = cfg.get("preview.confidence", 0.95)
+
+    logger.info(f"Sampling raw data from {input_path}...")
+    if fraction > 0:
+        jds, corpus_size = PreviewSampler.bernoulli(Reader.iter_raw_jds(file_path=input_path), fraction, seed=seed)
+        method = "bernoulli"
+    else:
+        jds, corpus_size = PreviewSampler.reservoir(Reader.iter_raw_jds(file_path=input_path), cfg.get("preview.sample_size", 1000), seed=seed)
+        method = "reservoir"
+    if not jds:
+        logger.error("No JDs sampled. Exiting.")
+        return
+    logger.info(f"📖 Sampled {len(jds)} of {corpus_size} Job Descriptions ({method}). Analyzing...")
+
+    alias_map = TaxonomyManager.get_alias_map()
+    matchable_terms = TaxonomyManager.get_matchable_terms()
+    skill_to_group = TaxonomyManager.get_skill_to_group_map()
+    stats = GraphBuilder.initialize_stats(TaxonomyManager.get_all_skills())
+    fuzzy_index = build_fuzzy_index(alias_map)
+    ngram_matcher = build_ngram_matcher(alias_map)
+
+    for jd in jds:
+        found_skills, is_senior, level = analyze_jd_content(jd, matchable_terms, alias_map, fuzzy_index, ngram_matcher)
+        stats.seniority_dist[level] += 1
+        GraphBuilder.update_metrics(stats, found_skills, level)
+
+    intervals = PreviewSampler.scale_stats(stats, len(jds), corpus_size, confidence)
+    summary = {
+        "method": method,
+        "sampledJobs": len(jds),
+        "corpusJobs": corpus_size,
+        "scale": round(corpus_size / len(jds), 4),
+        "confidence": confidence,
+        "seed": seed
+    }
+    logger.info(f"Counts scaled x{summary['scale']} to the corpus size; intervals at {confidence:.0%} confidence.")
+
+    output_dir = os.path.join(cfg.get_abs_path("paths.output_dir"), cfg.get("preview.output_subdir", "preview"))
+    finalize_and_export(corpus_size, stats, skill_to_group, threshold, output_dir, preview={"summary": summary, "intervals": intervals})
+
+def reduce_partials(partial_paths: List[str]) -> None:
+    """!
+    @brief The reduce step of a sharded run: merges partial stats files, then finalizes and exports.
+
+    @details The merged counters are identical to a single-machine run over the same corpus,
+    so the exports are too (except for the inverted index and stack mining, which need the corpus itself).
+
+    @param partial_paths Files written by `process_data(shard=...)`.
+    @throws ValueError If a file is not a supported partial, the files come from different shard counts,
+    or the same shard is given twice.
+    """
+    logger.info(f"🚀 Merging {len(partial_paths)} partial stats files...")
+    threshold = cfg.get("pipeline.threshold", 1)
+    skill_to_group = TaxonomyManager.get_skill_to_group_map()
+    stats = GraphBuilder.initialize_stats(TaxonomyManager.get_all_skills(), edge_memory_budget_mb=cfg.get("pipeline.edge_memory_budget_mb", 0))
+
+    documents: List[Dict[str, Any]] = []
+    seen_shards = set()
+    total_jobs = 0
+    for path in partial_paths:
+        document = Reader.load_partial_stats(path)
+        PartialStats.validate(document)
+        # Shards of different shard counts overlap, so their JDs would be counted twice
+        if documents and document["numShards"] != documents[0]["numShards"]:
+            raise ValueError(f"{path} is shard {document['shard']}/{document['numShards']}, but the first partial is from a {documents[0]['numShards']}-shard run.")
+        if document["shard"] in seen_shards:
+            raise ValueError(f"Shard {document['shard']}/{document['numShards']} is given twice ({path}).")
+        seen_shards.add(document["shard"])
+
+        total_jobs += PartialStats.merge_into(stats, document)
+        documents.append({"shard": document["shard"], "numShards": document["numShards"]})
+        logger.info(f"Merged shard {document['shard']}/{document['numShards']} ({document['totalJobs']} JDs) from {path}.")
+
+    missing = PartialStats.missing_shards(documents)
+    if missing:
+        logger.warning(f"Shards {missing} are missing; the export covers only the merged shards.")
+
+    finalize_and_export(total_jobs, stats, skill_to_group, threshold, cfg.get_abs_path("paths.output_dir"))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="CareerNavigator DataFactory pipeline.")
+    parser.add_argument("--shard", type=int, help="Run as the map step of a sharded run, analyzing only this shard.")
+    parser.add_argument("--num-shards", type=int, default=1, help="Total number of shards (with --shard).")
+    parser.add_argument("--partial-out", help="Where the shard writes its partial stats (default: <output_dir>/partials/).")
+    parser.add_argument("--preview", action="store_true", help="Build a quick preview universe from a sample of the corpus (see `preview` in settings.yaml).")
+    parser.add_argument("--reduce", nargs="+", metavar="PARTIAL", help="Merge these partial stats files, then finalize and export.")
+    parser.add_argument("--resume", action="store_true", help="Continue from the newest valid checkpoint (see `checkpoint` in settings.yaml).")
+    args = parser.parse_args(argv)
+
+    if args.reduce:
+        reduce_partials(args.reduce)
+    elif args.preview:
+        preview_data()
+    elif args.shard is not None:
+        if not 0 <= args.shard < args.num_shards:
+            parser.error("--shard must be in [0, --num-shards).")
+        process_data(shard=args.shard, num_shards=args.num_shards, partial_out=args.partial_out, resume=args.resume)
+    else:
+        process_data(resume=args.resume)
 
 if __name__ == "__main__":
-    process_data()
\ No newline at end of file
+    main()
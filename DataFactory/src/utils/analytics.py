@@ -1,4 +1,9 @@
-from typing import List, Dict, Any
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any
+from core.adjacency import AdjacencyMatrix
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
 
 class AnalyticsEngine:
     """!
@@ -22,16 +27,209 @@ class AnalyticsEngine:
         @param total_skills The total count of skills analyzed.
         @return A dictionary containing the histogram bucket map and total count.
         """
-        distribution: Dict[str, int] = {f"{i/10:.1f}-{(i+1)/10:.1f}": 0 for i in range(10)}
-        
-        for score in seniority_scores:
-            # Clamp score to 0.99 for bucket calculation to avoid index 10 error
-            bucket_index: int = min(int(score * 10), 9)
-            bucket_key: str = f"{bucket_index/10:.1f}-{(bucket_index+1)/10:.1f}"
-            distribution[bucket_key] += 1
+        # Clamp score to 0.99 for bucket calculation to avoid index 10 error
+        bucket_indices = np.minimum(np.floor(np.asarray(seniority_scores, dtype=np.float64) * 10).astype(np.int64), 9)
+        bucket_counts = np.bincount(bucket_indices, minlength=10)
+        distribution: Dict[str, int] = {f"{i/10:.1f}-{(i+1)/10:.1f}": int(bucket_counts[i]) for i in range(10)}
 
         meta: Dict[str, Any] = {
             "seniorityDistribution": distribution,
             "totalSkills": total_skills
         }
         return meta
+
+    @staticmethod
+    def calculate_graph_metrics(
+        node_ids: List[str],
+        edge_counts: Dict[Tuple[str, str], Dict[str, int]],
+        damping: float = 0.85,
+        max_iter: int = 100,
+        tol: float = 1e-8,
+        wedge_chunk_size: int = 1_000_000
+    ) -> Dict[str, np.ndarray]:
+        """!
+        @brief Computes per-node importance and structure metrics over the filtered co-occurrence graph.
+
+        @details
+        The graph is packed once into a CSR `AdjacencyMatrix` (edge weight = co-occurrence count) and every
+        metric is a vectorized pass over it:
+        -   `degree` / `weightedDegree`: neighbor count and sum of incident edge weights.
+        -   `pageRank`: weighted power iteration with damping; dangling mass is spread uniformly.
+        -   `eigenvectorCentrality`: power iteration on `W + I` (the shift guarantees convergence on
+            bipartite components), L2-normalized.
+        -   `clustering`: unweighted local clustering coefficient (closed wedges / wedges).
+
+        @param node_ids Active node ids; output arrays follow this order.
+        @param edge_counts Filtered edge statistics.
+        @param damping PageRank damping factor.
+        @param max_iter Iteration cap for both power iterations.
+        @param tol L1 convergence tolerance for both power iterations.
+        @param wedge_chunk_size Maximum wedges materialized at once by the clustering pass.
+        @return `{ metric_name: array aligned with node_ids }`.
+        """
+        adjacency = AdjacencyMatrix.from_edges(node_ids, edge_counts)
+        rows = adjacency.row_ids()
+        strength = adjacency.strength()
+
+        return {
+            "degree": adjacency.degree(),
+            "weightedDegree": strength,
+            "pageRank": AnalyticsEngine._pagerank(adjacency, rows, strength, damping, max_iter, tol),
+            "eigenvectorCentrality": AnalyticsEngine._eigenvector_centrality(adjacency, rows, max_iter, tol),
+            "clustering": AnalyticsEngine._clustering(adjacency, wedge_chunk_size)
+        }
+
+    @staticmethod
+    def _pagerank(adjacency: AdjacencyMatrix, rows: np.ndarray, strength: np.ndarray, damping: float, max_iter: int, tol: float) -> np.ndarray:
+        n = adjacency.n_nodes
+        if n == 0:
+            return np.zeros(0)
+
+        dangling = strength == 0
+        # Transition probability of every stored entry (row -> column), normalized by the row's strength
+        transition = adjacency.weights / strength[rows]
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            # Mass flowing into each column from its neighbors
+            inflow = np.bincount(adjacency.indices, transition * rank[rows], n)
+            updated = damping * (inflow + rank[dangling].sum() / n) + (1.0 - damping) / n
+            converged = np.abs(updated - rank).sum() < tol
+            rank = updated
+            if converged:
+                break
+        return rank
+
+    @staticmethod
+    def _eigenvector_centrality(adjacency: AdjacencyMatrix, rows: np.ndarray, max_iter: int, tol: float) -> np.ndarray:
+        n = adjacency.n_nodes
+        if n == 0:
+            return np.zeros(0)
+
+        x = np.full(n, 1.0 / np.sqrt(n))
+        for _ in range(max_iter):
+            updated = x + np.bincount(rows, adjacency.weights * x[adjacency.indices], n)
+            norm = np.linalg.norm(updated)
+            if norm == 0:
+                return updated
+            updated /= norm
+            converged = np.abs(updated - x).sum() < n * tol
+            x = updated
+            if converged:
+                break
+        return x
+
+    @staticmethod
+    def _clustering(adjacency: AdjacencyMatrix, wedge_chunk_size: int) -> np.ndarray:
+        """!
+        @brief Local clustering coefficient by wedge checking, in bounded-size chunks.
+
+        @details
+        Every wedge (u - v - w, u < w) centered at v is closed if (u, w) is an edge. Edges are encoded as
+        sorted `u * n + w` keys so closure is a vectorized `searchsorted`. Centers are processed in chunks
+        of at most `wedge_chunk_size` wedges, bounding memory on hub-heavy graphs.
+        """
+        n = adjacency.n_nodes
+        degree = adjacency.degree().astype(np.int64)
+        wedges = degree * (degree - 1) // 2
+        closed = np.zeros(n, dtype=np.int64)
+
+        edge_keys = np.sort(adjacency.row_ids() * n + adjacency.indices)
+
+        centers = np.flatnonzero(wedges)
+        start = 0
+        while start < len(centers):
+            # Grow the chunk until it would exceed the wedge budget (always at least one center)
+            end = start + 1
+            budget = wedges[centers[start]]
+            while end < len(centers) and budget + wedges[centers[end]] <= wedge_chunk_size:
+                budget += wedges[centers[end]]
+                end += 1
+
+            chunk_centers: List[np.ndarray] = []
+            chunk_keys: List[np.ndarray] = []
+            for center in centers[start:end]:
+                neighbors = adjacency.neighbors(center).astype(np.int64)
+                first, second = np.triu_indices(len(neighbors), 1)
+                chunk_keys.append(neighbors[first] * n + neighbors[second])
+                chunk_centers.append(np.full(len(first), center, dtype=np.int64))
+
+            keys = np.concatenate(chunk_keys)
+            positions = np.minimum(np.searchsorted(edge_keys, keys), len(edge_keys) - 1)
+            is_closed = edge_keys[positions] == keys
+            closed += np.bincount(np.concatenate(chunk_centers)[is_closed], minlength=n)
+            start = end
+
+        return np.divide(closed, wedges, out=np.zeros(n), where=wedges > 0)
+
+    @staticmethod
+    def summarize_distribution(values: np.ndarray) -> Dict[str, float]:
+        """!
+        @brief Summarizes a metric as min / mean / percentiles / max for the `meta` block.
+        """
+        if len(values) == 0:
+            return {}
+        percentiles = np.percentile(values, [50, 90, 99])
+        return {
+            "min": round(float(np.min(values)), 6),
+            "mean": round(float(np.mean(values)), 6),
+            "p50": round(float(percentiles[0]), 6),
+            "p90": round(float(percentiles[1]), 6),
+            "p99": round(float(percentiles[2]), 6),
+            "max": round(float(np.max(values)), 6)
+        }
+
+    @staticmethod
+    def attach_graph_metrics(nodes_list: List[Dict[str, Any]], node_ids: List[str], metrics: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """!
+        @brief Writes each metric onto its node object and returns the per-metric distributions for `meta`.
+
+        @param nodes_list Final node objects (modified in place).
+        @param node_ids The order `metrics` arrays follow.
+        @param metrics Output of `calculate_graph_metrics`.
+        @return `{ metric_name: summary }` (see `summarize_distribution`).
+        """
+        position: Dict[str, int] = {node: i for i, node in enumerate(node_ids)}
+        for node in nodes_list:
+            i = position.get(node["id"])
+            if i is None:
+                continue
+            for name, values in metrics.items():
+                value = values[i]
+                node[name] = int(value) if name == "degree" else round(float(value), 6)
+
+        return {name: AnalyticsEngine.summarize_distribution(values) for name, values in metrics.items()}
+
+    @staticmethod
+    def compare_taxonomy_runs(node_stats_by_taxonomy: Dict[str, Dict[str, Dict[str, int]]], baseline: str) -> Dict[str, Any]:
+        """!
+        @brief Diffs per-skill hit counts of several taxonomies against a baseline taxonomy over the same corpus.
+
+        @param node_stats_by_taxonomy `{ taxonomy_name: GraphStats.node_stats }`.
+        @param baseline Name of the reference taxonomy.
+        @return `{ baseline, comparisons: { name: { totalHits, gained, lost } } }` where `gained` / `lost` list
+            `{ skill, baseline, candidate, delta }` sorted by the size of the change.
+        """
+        def hits(node_stats: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+            return {skill: stats["total"] for skill, stats in node_stats.items() if stats["total"] > 0}
+
+        baseline_hits = hits(node_stats_by_taxonomy[baseline])
+        comparisons: Dict[str, Any] = {}
+        for name, node_stats in node_stats_by_taxonomy.items():
+            if name == baseline:
+                continue
+            candidate_hits = hits(node_stats)
+
+            changes: List[Dict[str, Any]] = []
+            for skill in set(baseline_hits) | set(candidate_hits):
+                before, after = baseline_hits.get(skill, 0), candidate_hits.get(skill, 0)
+                if before != after:
+                    changes.append({"skill": skill, "baseline": before, "candidate": after, "delta": after - before})
+            changes.sort(key=lambda change: (-abs(change["delta"]), change["skill"]))
+
+            comparisons[name] = {
+                "totalHits": {"baseline": sum(baseline_hits.values()), "candidate": sum(candidate_hits.values())},
+                "gained": [change for change in changes if change["delta"] > 0],
+                "lost": [change for change in changes if change["delta"] < 0]
+            }
+
+        return {"baseline": baseline, "comparisons": comparisons}
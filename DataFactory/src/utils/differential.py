@@ -0,0 +1,268 @@
+import re
+import random
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Any, Callable, Sequence
+
+# Analysis result of one JD: (sorted skills, seniority level)
+JDResult = Tuple[Tuple[str, ...], str]
+
+@dataclass
+class Engine:
+    """!
+    @brief A named implementation of one pipeline stage, run side by side with the reference by `DifferentialRunner`.
+
+    @details `run` maps a batch of inputs to one output per input for analysis engines (JD texts to `JDResult`s),
+    or to a single aggregate for aggregation engines (`JDResult`s to `GraphStats`).
+    Engines must not keep state between calls: `DifferentialRunner.minimize` re-runs them on fragments.
+    """
+    name: str
+    run: Callable[[List[Any]], Any]
+
+class DifferentialRunner:
+    """!
+    @brief Differential testing of alternative engines (extractors, seniority detection, aggregators) against the reference.
+
+    @details
+    -   `compare_analysis` runs both analysis engines over a corpus and reports every JD whose skills or
+        level differ, with a minimized repro text (`minimize`) and the timings of both engines.
+    -   `compare_aggregation` folds the reference results with both aggregation engines, builds a universe from
+        each and reports the differing nodes, links and `meta` entries.
+    -   `synthetic_corpus` generates JDs dense in taxonomy terms, casing and punctuation variants
+        and seniority signals, for boundary cases a real corpus rarely hits.
+
+    Speedups are reported as reference seconds / alternative seconds (best of `repeat` timed runs, after one
+    warm-up call so lazily built tables are not charged to whichever engine runs first).
+    """
+
+    def __init__(self, repeat: int = 1, max_repro_checks: int = 400, max_repros: int = 20, max_differences: int = 50):
+        """!
+        @param repeat Timed runs per engine.
+        @param max_repro_checks Engine runs allowed per minimized repro.
+        @param max_repros Mismatching JDs that get a minimized repro (the rest are only listed).
+        @param max_differences Universe differences listed per section.
+        """
+        self.repeat = repeat
+        self.max_repro_checks = max_repro_checks
+        self.max_repros = max_repros
+        self.max_differences = max_differences
+
+    # ---- Timing
+
+    def _timed(self, engine: Engine, inputs: List[Any]) -> Tuple[Any, float]:
+        engine.run(inputs[:1])
+        best = float("inf")
+        output = None
+        for _ in range(max(self.repeat, 1)):
+            start = time.perf_counter()
+            output = engine.run(inputs)
+            best = min(best, time.perf_counter() - start)
+        return output, best
+
+    @staticmethod
+    def _timing(reference: Engine, alternative: Engine, reference_seconds: float, alternative_seconds: float) -> Dict[str, Any]:
+        return {
+            "reference": reference.name,
+            "alternative": alternative.name,
+            "referenceSeconds": round(reference_seconds, 4),
+            "alternativeSeconds": round(alternative_seconds, 4),
+            "speedup": round(reference_seconds / alternative_seconds, 2) if alternative_seconds else None
+        }
+
+    # ---- Analysis (per JD)
+
+    @staticmethod
+    def _differing_fields(expected: JDResult, actual: JDResult) -> List[str]:
+        return [field for field, position in (("skills", 0), ("level", 1)) if expected[position] != actual[position]]
+
+    def compare_analysis(self, reference: Engine, alternative: Engine, jds: List[str]) -> Dict[str, Any]:
+        """!
+        @brief Runs two analysis engines over `jds` and reports per-JD mismatches.
+
+        @return `{ jds, identical, mismatches: [...], timing }`. Each mismatch lists the skills found by only one
+        engine, both levels, and (for the first `max_repros`) a `repro` with the minimized text and both outputs on it.
+        """
+        expected, reference_seconds = self._timed(reference, jds)
+        actual, alternative_seconds = self._timed(alternative, jds)
+
+        mismatches: List[Dict[str, Any]] = []
+        for idx, (jd, expected_result, actual_result) in enumerate(zip(jds, expected, actual)):
+            fields = self._differing_fields(expected_result, actual_result)
+            if not fields:
+                continue
+            mismatch: Dict[str, Any] = {
+                "jd": idx,
+                "fields": fields,
+                "onlyReference": sorted(set(expected_result[0]) - set(actual_result[0])),
+                "onlyAlternative": sorted(set(actual_result[0]) - set(expected_result[0])),
+                "referenceLevel": expected_result[1],
+                "alternativeLevel": actual_result[1]
+            }
+            if len(mismatches) < self.max_repros:
+                mismatch["repro"] = self._repro(reference, alternative, jd, fields)
+            mismatches.append(mismatch)
+
+        return {
+            "jds": len(jds),
+            "identical": len(jds) - len(mismatches),
+            "mismatches": mismatches,
+            "timing": self._timing(reference, alternative, reference_seconds, alternative_seconds)
+        }
+
+    def _repro(self, reference: Engine, alternative: Engine, jd: str, fields: List[str]) -> Dict[str, Any]:
+        def still_differs(text: str) -> bool:
+            return any(field in fields for field in self._differing_fields(reference.run([text])[0], alternative.run([text])[0]))
+
+        text = self.minimize(jd, still_differs, self.max_repro_checks)
+        expected, actual = reference.run([text])[0], alternative.run([text])[0]
+        return {
+            "text": text,
+            "reference": {"skills": list(expected[0]), "level": expected[1]},
+            "alternative": {"skills": list(actual[0]), "level": actual[1]}
+        }
+
+    # ---- Minimization
+
+    @staticmethod
+    def _ddmin(units: List[str], fails: Callable[[List[str]], bool], budget: List[int]) -> List[str]:
+        """Zeller's delta debugging: a 1-minimal sublist of `units` (in order) for which `fails` holds, within `budget[0]` checks."""
+        granularity = 2
+        while len(units) >= 2 and budget[0] > 0:
+            size = -(-len(units) // granularity)
+            chunks = [units[start:start + size] for start in range(0, len(units), size)]
+            reduced = False
+            for i in range(len(chunks)):
+                # Try each chunk alone, then everything but the chunk
+                for candidate, next_granularity in ((chunks[i], 2), ([unit for chunk in chunks[:i] + chunks[i + 1:] for unit in chunk], max(granularity - 1, 2))):
+                    if budget[0] <= 0:
+                        return units
+                    budget[0] -= 1
+                    if candidate and fails(candidate):
+                        units, granularity, reduced = candidate, next_granularity, True
+                        break
+                if reduced:
+                    break
+            if not reduced:
+                if granularity >= len(units):
+                    break
+                granularity = min(granularity * 2, len(units))
+        return units
+
+    @staticmethod
+    def minimize(text: str, fails: Callable[[str], bool], max_checks: int = 400) -> str:
+        """!
+        @brief Shrinks `text` while `fails(text)` holds: first whole lines, then words (each keeping its trailing whitespace).
+        @return The smallest failing text found; `text` itself if it does not fail.
+        """
+        if not fails(text):
+            return text
+        budget = [max_checks]
+        lines = DifferentialRunner._ddmin(text.splitlines(keepends=True), lambda units: fails("".join(units)), budget)
+        words = DifferentialRunner._ddmin(re.findall(r"\S+\s*|\s+", "".join(lines)), lambda units: fails("".join(units)), budget)
+        return "".join(words)
+
+    # ---- Aggregation (universe)
+
+    def compare_aggregation(
+        self,
+        reference: Engine,
+        alternative: Engine,
+        results: List[JDResult],
+        to_universe: Callable[[Any], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """!
+        @brief Aggregates the same per-JD `results` with two engines and diffs the universes built from them.
+
+        @param to_universe Turns an engine's aggregate (e.g. `GraphStats`) into the universe document; not timed.
+        @return `{ identical, differences: { meta, nodes, links }, timing }` (see `diff_universes`).
+        """
+        expected, reference_seconds = self._timed(reference, results)
+        actual, alternative_seconds = self._timed(alternative, results)
+        expected_universe, actual_universe = to_universe(expected), to_universe(actual)
+        return {
+            "identical": expected_universe == actual_universe,
+            "differences": self.diff_universes(expected_universe, actual_universe, self.max_differences),
+            "timing": self._timing(reference, alternative, reference_seconds, alternative_seconds)
+        }
+
+    @staticmethod
+    def _diff_values(expected: Any, actual: Any, path: str, out: List[str], limit: int) -> None:
+        if len(out) >= limit or expected == actual:
+            return
+        if isinstance(expected, dict) and isinstance(actual, dict):
+            for key in sorted(set(expected) | set(actual), key=str):
+                DifferentialRunner._diff_values(expected.get(key), actual.get(key), f"{path}.{key}" if path else str(key), out, limit)
+        elif isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+            for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+                DifferentialRunner._diff_values(expected_item, actual_item, f"{path}[{i}]", out, limit)
+        else:
+            out.append(f"{path}: {expected!r} != {actual!r}")
+
+    @staticmethod
+    def _diff_keyed(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]], key: Callable[[Dict[str, Any]], str], limit: int) -> Dict[str, Any]:
+        expected_by_key = {key(item): item for item in expected}
+        actual_by_key = {key(item): item for item in actual}
+        changed: List[str] = []
+        for item_key in expected_by_key.keys() & actual_by_key.keys():
+            DifferentialRunner._diff_values(expected_by_key[item_key], actual_by_key[item_key], item_key, changed, limit)
+        return {
+            "onlyReference": sorted(expected_by_key.keys() - actual_by_key.keys())[:limit],
+            "onlyAlternative": sorted(actual_by_key.keys() - expected_by_key.keys())[:limit],
+            "changed": sorted(changed),
+            # Same entries in a different order still change the exported file
+            "sameOrder": [key(item) for item in expected] == [key(item) for item in actual]
+        }
+
+    @staticmethod
+    def diff_universes(expected: Dict[str, Any], actual: Dict[str, Any], limit: int = 50) -> Dict[str, Any]:
+        """!
+        @brief Field-level differences between two universe documents.
+        @details Nodes are matched by id and links by `source|target`, so one extra entry does not shift every later one.
+        """
+        meta: List[str] = []
+        DifferentialRunner._diff_values(expected.get("meta", {}), actual.get("meta", {}), "", meta, limit)
+        return {
+            "meta": meta,
+            "nodes": DifferentialRunner._diff_keyed(expected.get("nodes", []), actual.get("nodes", []), lambda node: node["id"], limit),
+            "links": DifferentialRunner._diff_keyed(expected.get("links", []), actual.get("links", []), lambda link: f"{link['source']}|{link['target']}", limit)
+        }
+
+    # ---- Synthetic corpus
+
+    SEPARATORS = (" ", ", ", "; ", " / ", " and ", "\n- ", " (", ") ", ". ")
+    EXPERIENCE_PHRASES = ("", "1 year of experience", "3 years experience", "4 yrs", "5+ years of experience", "10 years")
+
+    @staticmethod
+    def synthetic_corpus(
+        terms: Sequence[str],
+        n_jds: int,
+        seed: int = 42,
+        title_words: Sequence[str] = (),
+        filler_words: Sequence[str] = (),
+        terms_per_jd: Tuple[int, int] = (3, 25)
+    ) -> List[str]:
+        """!
+        @brief Generates JDs made of taxonomy terms in random casing, separated by punctuation, with seniority signals.
+
+        @param terms Matchable terms (e.g. `TaxonomyManager.get_matchable_terms()`).
+        @param title_words Seniority/title words for the first line (e.g. `SeniorityAnalyzer.get_title_keywords()`).
+        @param filler_words Other words mixed in (e.g. seniority keywords, so scores cross the level thresholds).
+        @param terms_per_jd Inclusive range of terms drawn per JD.
+        """
+        rng = random.Random(seed)
+        terms = list(terms)
+        titles = list(title_words) or ["Engineer"]
+        fillers = list(filler_words)
+        jds: List[str] = []
+        for _ in range(n_jds):
+            title = " ".join(rng.sample(titles, k=min(len(titles), rng.randint(0, 2))) + [rng.choice(["Engineer", "Developer", "Analyst", "Manager"])])
+            parts: List[str] = []
+            for _ in range(rng.randint(*terms_per_jd)):
+                if fillers and rng.random() < 0.3:
+                    parts.append(rng.choice(fillers))
+                term = rng.choice(terms) if terms else "python"
+                casing = rng.random()
+                parts.append(term.upper() if casing < 0.1 else term.title() if casing < 0.3 else term)
+            body = "".join(part + rng.choice(DifferentialRunner.SEPARATORS) for part in parts)
+            jds.append(f"Job Title: {title.title()}\n\n{body}\n{rng.choice(DifferentialRunner.EXPERIENCE_PHRASES)}\n")
+        return jds
@@ -0,0 +1,221 @@
+import re
+from typing import List, Dict, Set, Tuple, Optional
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class FuzzySkillIndex:
+    """!
+    @brief Typo- and variant-tolerant skill lookup backed by a Symmetric Deletion (SymSpell-style) index.
+
+    @details
+    Every taxonomy term is expanded once into all strings reachable by deleting up to `d` characters
+    from its first `prefix_length` characters, and each of those "delete variants" points back to the
+    terms that produced it. At query time the phrase is expanded the same way, so candidates are found
+    with a handful of dictionary lookups instead of comparing against the whole taxonomy.
+    Candidates are then verified with a bounded Damerau-Levenshtein (OSA) distance on the full strings.
+
+    The allowed distance scales with term length to keep short, ambiguous terms exact:
+    -   `len < min_term_length` -> 0 (never fuzzy matched, e.g. "java", "scala")
+    -   `len < 2 * min_term_length - 2` -> 1
+    -   otherwise -> `max_edit_distance`
+
+    Separators (space, '_', '-', '/') are normalized before comparison, so "code reviews",
+    "code-reviews" and "code_reviews" are the same variant at distance 0. Other punctuation is an
+    ordinary character, so "node js" -> "node.js" and "kuber netes" -> "kubernetes" are single edits.
+    """
+
+    # Tokens the fuzzy pass considers. Anything else (',', '(', '@', ...) breaks a phrase.
+    _TOKEN_PATTERN = re.compile(r"[\w+#./-]+")
+    _SEPARATOR_PATTERN = re.compile(r"[\s_/-]+")
+
+    def __init__(
+        self,
+        alias_map: Dict[str, str],
+        max_edit_distance: int = 1,
+        min_term_length: int = 7,
+        prefix_length: int = 7):
+        """!
+        @brief Builds the deletion index over all matchable terms.
+
+        @param alias_map Mapping of every matchable term to its canonical id (see `TaxonomyManager.get_alias_map`).
+        @param max_edit_distance Upper bound on the edit distance tolerated for any term.
+        @param min_term_length Terms shorter than this are only ever matched exactly.
+        @param prefix_length Number of leading characters indexed per term (bounds index size and query cost).
+        """
+        self.alias_map = alias_map
+        self.max_edit_distance = max(0, int(max_edit_distance))
+        self.min_term_length = max(1, int(min_term_length))
+        self.prefix_length = max(self.max_edit_distance + 1, int(prefix_length))
+
+        # Separator Variants: { "code reviews": "code_reviews", ... }
+        self._variants: Dict[str, str] = {}
+        # Delete Index over normalized terms: { "kubrne": ["kubernetes", ...], ... }
+        self._deletes: Dict[str, List[str]] = {}
+        # Longest indexed term per token count, used to skip phrases that cannot match anything
+        self._max_length_by_tokens: Dict[int, int] = {}
+
+        for term in sorted(alias_map):
+            normalized = self._normalize(term)
+            self._variants.setdefault(normalized, term)
+            token_count = len(normalized.split())
+            self._max_length_by_tokens[token_count] = max(self._max_length_by_tokens.get(token_count, 0), len(normalized))
+
+            distance = self.allowed_distance(normalized)
+            if distance == 0:
+                continue
+            for variant in self._generate_deletes(normalized[:self.prefix_length], distance):
+                self._deletes.setdefault(variant, []).append(normalized)
+
+        # A phrase may carry one token more or less than the term it matches ("kuber netes", "node js")
+        self._max_phrase_tokens = max(self._max_length_by_tokens, default=0) + 1
+
+        logger.debug(f"Fuzzy index built: {len(self._deletes)} delete variants (max distance={self.max_edit_distance}).")
+
+    @staticmethod
+    def _normalize(phrase: str) -> str:
+        """Collapses separator runs (space, '_', '-', '/') into single spaces."""
+        return FuzzySkillIndex._SEPARATOR_PATTERN.sub(" ", phrase).strip()
+
+    def allowed_distance(self, term: str) -> int:
+        """Returns the maximum edit distance tolerated for a term of this length."""
+        length = len(term)
+        if length < self.min_term_length:
+            return 0
+        if length < 2 * self.min_term_length - 2:
+            return min(1, self.max_edit_distance)
+        return self.max_edit_distance
+
+    @staticmethod
+    def _generate_deletes(word: str, max_distance: int) -> Set[str]:
+        """Generates every string reachable by deleting up to `max_distance` characters (including the word itself)."""
+        variants: Set[str] = {word}
+        frontier: Set[str] = {word}
+        for _ in range(max_distance):
+            next_frontier: Set[str] = set()
+            for candidate in frontier:
+                for i in range(len(candidate)):
+                    next_frontier.add(candidate[:i] + candidate[i + 1:])
+            variants |= next_frontier
+            frontier = next_frontier
+        return variants
+
+    @staticmethod
+    def _edit_distance(a: str, b: str, max_distance: int) -> int:
+        """!
+        @brief Optimal String Alignment distance with early exit.
+        @return The distance, or `max_distance + 1` once it is known to exceed the bound.
+        """
+        if abs(len(a) - len(b)) > max_distance:
+            return max_distance + 1
+
+        previous_previous: List[int] = []
+        previous: List[int] = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            current = [i] + [0] * len(b)
+            row_min = current[0]
+            for j in range(1, len(b) + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else 1
+                current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+                if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                    current[j] = min(current[j], previous_previous[j - 2] + 1)
+                row_min = min(row_min, current[j])
+            if row_min > max_distance:
+                return max_distance + 1
+            previous_previous, previous = previous, current
+        return previous[-1]
+
+    def _max_length_for(self, token_count: int) -> int:
+        """Longest term a phrase of `token_count` tokens could still reach within the edit budget."""
+        longest = max(self._max_length_by_tokens.get(n, 0) for n in (token_count - 1, token_count, token_count + 1))
+        return longest + self.max_edit_distance if longest else 0
+
+    def lookup(self, phrase: str) -> Optional[str]:
+        """!
+        @brief Finds the closest matchable term for a misspelled or variant phrase.
+
+        @details
+        Exact terms are left to the exact matcher, so only separator variants and typos are returned.
+        Candidates must share the first character with the phrase (typos rarely hit the first letter),
+        and a phrase that is a truncation of a term ("container" vs "containerd") is rejected since
+        that is usually a different word rather than a typo.
+        Ties are broken by distance, then by length difference, then alphabetically for stability.
+
+        @param phrase Lowercase phrase taken from cleaned text.
+        @return The matched term (a key of `alias_map`), or None.
+        """
+        if phrase in self.alias_map:
+            return None
+
+        normalized = self._normalize(phrase)
+        if normalized in self._variants:
+            return self._variants[normalized]
+        if self.max_edit_distance == 0 or len(normalized) < self.min_term_length - self.max_edit_distance:
+            return None
+
+        best: Optional[Tuple[int, int, str]] = None
+        seen: Set[str] = set()
+        for variant in self._generate_deletes(normalized[:self.prefix_length], self.max_edit_distance):
+            for term in self._deletes.get(variant, ()):
+                if term in seen:
+                    continue
+                seen.add(term)
+                if term[0] != normalized[0] or term.startswith(normalized):
+                    continue
+                allowed = self.allowed_distance(term)
+                distance = self._edit_distance(normalized, term, allowed)
+                if distance > allowed:
+                    continue
+                rank = (distance, abs(len(term) - len(normalized)), term)
+                if best is None or rank < best:
+                    best = rank
+
+        return self._variants[best[2]] if best else None
+
+    def match_text(self, work_text: str) -> Set[str]:
+        """!
+        @brief Scans cleaned text for fuzzy skill mentions.
+
+        @details
+        Phrases of 1..k consecutive tokens are probed longest-first and left-to-right.
+        Tokens consumed by a match are masked so they cannot contribute to a second match.
+        Phrases never span a gap containing anything but whitespace, so punctuation
+        and the ' @@@ ' masks left by the exact pass act as barriers.
+
+        @param work_text Lowercase text, typically the residue of `TextProcessor.extract_skills`'s exact pass.
+        @return Set of canonical ids found.
+        """
+        tokens: List[Tuple[int, int, str]] = []
+        for match in self._TOKEN_PATTERN.finditer(work_text):
+            token = match.group(0).rstrip(".")
+            if token:
+                tokens.append((match.start(), match.start() + len(token), token))
+
+        found_ids: Set[str] = set()
+        consumed = [False] * len(tokens)
+
+        for size in range(min(self._max_phrase_tokens, len(tokens)), 0, -1):
+            max_length = self._max_length_for(size)
+            if max_length == 0:
+                continue
+            for start in range(len(tokens) - size + 1):
+                window = range(start, start + size)
+                if any(consumed[i] for i in window):
+                    continue
+                if tokens[start + size - 1][1] - tokens[start][0] > max_length:
+                    continue
+                # Only join tokens separated purely by whitespace
+                if any(not work_text[tokens[i - 1][1]:tokens[i][0]].isspace() for i in range(start + 1, start + size)):
+                    continue
+
+                phrase = " ".join(tokens[i][2] for i in window)
+                term = self.lookup(phrase)
+                if term is None:
+                    continue
+
+                found_ids.add(self.alias_map[term])
+                for i in window:
+                    consumed[i] = True
+                logger.debug(f"Fuzzy match: '{phrase}' -> '{term}' ({self.alias_map[term]})")
+
+        return found_ids
@@ -0,0 +1,27 @@
+import sys
+import importlib.util
+from types import ModuleType
+
+def lazy_import(name: str) -> ModuleType:
+    """!
+    @brief Returns module `name`, deferring its execution to the first attribute access.
+
+    @details
+    Used for heavy dependencies (numpy) that modules on the CLI's import path only need once real work
+    starts. The placeholder is registered in `sys.modules`, so every module asking for `name` here shares it;
+    a plain `import name` elsewhere simply loads it. Annotations that mention the module must not be
+    evaluated at import (`from __future__ import annotations`).
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -86,11 +86,27 @@ def setup_logging():
 
     _setup_done = True
 
-def get_logger(name: str) -> logging.Logger:
+class _LazyLogger(logging.LoggerAdapter):
     """
-    Returns a logger instance with the given name.
-    Ensures logging is set up.
+    Logger handle that runs `setup_logging` on its first logging call rather than at import,
+    so importing a module neither reads the configuration nor opens the log file.
     """
-    if not _setup_done:
-        setup_logging()
-    return logging.getLogger(name)
+
+    def __init__(self, name: str):
+        super().__init__(logging.getLogger(name), {})
+
+    def isEnabledFor(self, level: int) -> bool:
+        # Every logging call (debug, info, ..., exception) goes through this check first
+        if not _setup_done:
+            setup_logging()
+        return self.logger.isEnabledFor(level)
+
+    def process(self, msg, kwargs):
+        return msg, kwargs
+
+def get_logger(name: str) -> logging.LoggerAdapter:
+    """
+    Returns a logger with the given name.
+    Logging is set up on the first message logged through it.
+    """
+    return _LazyLogger(name)
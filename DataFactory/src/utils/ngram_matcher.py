@@ -0,0 +1,114 @@
+import re
+from typing import List, Dict, Tuple
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class NgramSkillMatcher:
+    """!
+    @brief Hash-lookup skill extraction over token n-grams.
+
+    @details
+    The regex extractor tests every taxonomy term against the text, so its cost grows with the taxonomy.
+    This matcher instead tokenizes the cleaned text once and probes every run of 1..k tokens
+    (k = longest term in tokens) against a hash map of terms, which costs O(tokens x k) regardless of
+    taxonomy size.
+
+    Tokens are word runs (`\\w+`) and single punctuation characters. N-gram keys are taken as raw
+    substrings of the cleaned text rather than re-joined tokens, so "c++", "c#", ".net" and "node.js"
+    stay intact (and "node . js" does not match "node.js").
+
+    Overlaps are resolved with the same priority as the regex extractor's Greedy Longest-Match + Masking:
+    longer terms first (then alphabetical), each claiming all its non-overlapping occurrences left to right.
+    A character covered by an earlier (higher priority) match counts as a word boundary, exactly like
+    the ' @@@ ' mask does for the regex extractor.
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+    _WORD_CHAR = re.compile(r"\w")
+
+    def __init__(self, alias_map: Dict[str, str]):
+        """!
+        @brief Builds the term hash map and priority ranks.
+
+        @param alias_map Mapping of every matchable term to its canonical id (see `TaxonomyManager.get_alias_map`).
+        """
+        self.alias_map = alias_map
+
+        # Priority Rank: position in `TaxonomyManager.get_matchable_terms()` order (-len, term)
+        ordered_terms: List[str] = sorted(alias_map.keys(), key=lambda x: (-len(x), x))
+        self._rank: Dict[str, int] = {term: rank for rank, term in enumerate(ordered_terms)}
+
+        self.max_term_tokens: int = max((len(self.TOKEN_PATTERN.findall(term)) for term in ordered_terms), default=0)
+        logger.debug(f"N-gram matcher built: {len(self._rank)} terms, max {self.max_term_tokens} tokens per term.")
+
+    @staticmethod
+    def tokenize(clean_text: str) -> List[Tuple[int, int]]:
+        """!
+        @brief Splits cleaned text into token spans.
+        @return List of (start, end) character offsets.
+        """
+        return [match.span() for match in NgramSkillMatcher.TOKEN_PATTERN.finditer(clean_text)]
+
+    def _is_boundary(self, clean_text: str, index: int, owner: List[int], rank: int) -> bool:
+        """True if the character at `index` may sit next to a match of priority `rank`."""
+        if index < 0 or index >= len(clean_text):
+            return True
+        # Masked by a higher priority term (owner stores rank + 1). Occurrences of the same term
+        # do not count, since re.sub checks its boundaries against the text of the current pass.
+        if owner[index] and owner[index] - 1 < rank:
+            return True
+        return not self._WORD_CHAR.match(clean_text[index])
+
+    def find_matches(self, clean_text: str, spans: List[Tuple[int, int]] = None) -> List[Tuple[int, int, str]]:
+        """!
+        @brief Finds all accepted term occurrences in cleaned text.
+
+        @param clean_text Output of `TextProcessor.clean_text`.
+        @param spans Optional precomputed token spans (see `tokenize`), to share tokenization across matchers.
+        @return List of (start, end, term) in acceptance order.
+        """
+        if spans is None:
+            spans = self.tokenize(clean_text)
+
+        # 1. Probe every 1..k token n-gram (O(tokens x k) hash lookups)
+        candidates: List[Tuple[int, int, int]] = []
+        token_count = len(spans)
+        for i in range(token_count):
+            start = spans[i][0]
+            for j in range(i, min(token_count, i + self.max_term_tokens)):
+                end = spans[j][1]
+                rank = self._rank.get(clean_text[start:end])
+                if rank is not None:
+                    candidates.append((rank, start, end))
+
+        # 2. Resolve overlaps in priority order, masking accepted spans
+        candidates.sort()
+        owner: List[int] = [0] * len(clean_text)
+        matches: List[Tuple[int, int, str]] = []
+        for rank, start, end in candidates:
+            if any(owner[start:end]):
+                continue
+            if not self._is_boundary(clean_text, start - 1, owner, rank):
+                continue
+            if not self._is_boundary(clean_text, end, owner, rank):
+                continue
+            for position in range(start, end):
+                owner[position] = rank + 1
+            matches.append((start, end, clean_text[start:end]))
+
+        return matches
+
+    @staticmethod
+    def mask(clean_text: str, matches: List[Tuple[int, int, str]]) -> str:
+        """!
+        @brief Rebuilds the regex extractor's masked residue (' @@@ ' in place of each match).
+        """
+        pieces: List[str] = []
+        cursor = 0
+        for start, end, _ in sorted(matches):
+            pieces.append(clean_text[cursor:start])
+            pieces.append(" @@@ ")
+            cursor = end
+        pieces.append(clean_text[cursor:])
+        return "".join(pieces)
@@ -1,21 +1,13 @@
+from __future__ import annotations
 import re
 import json
-import sys
 import os
 from typing import List, Dict, Any, Tuple
+from config import cfg
 from utils.logger import get_logger
+from utils.lazy_import import lazy_import
 
-# Try to import cfg. Dependending on run location (root vs src), path varies.
-try:
-    from config import cfg
-except ImportError:
-    # If running from root, src.config might work
-    try:
-        from src.config import cfg
-    except ImportError:
-        # Last resort: append src to path
-        sys.path.append(os.path.join(os.path.dirname(__file__), '../../src')) # Assuming src/utils/
-        from config import cfg
+np = lazy_import("numpy")
 
 logger = get_logger(__name__)
 
@@ -28,6 +20,21 @@ class SeniorityAnalyzer:
     Analyzes Titles, Experience metrics, and Keyword density.
     """
     
+    # Level codes used by array-backed outputs (e.g. `SkillMatrix.levels`)
+    LEVELS = ("Junior", "Mid", "Senior", "Managerial")
+
+    # Keyword categories scored as min(max_cap, hits * multiplier), in scoring order
+    KEYWORD_WEIGHTS: Tuple[Tuple[str, float, float], ...] = (
+        ("action_verbs", 0.4, 2.0),         # 3. Action Verbs (Max 2.0)
+        ("scope_keywords", 0.5, 1.5),       # 4. Scope of Impact (Max 1.5)
+        ("leadership_keywords", 0.5, 1.5),  # 5. Mentorship and Leadership (Max 1.5)
+        ("nfr_keywords", 0.5, 1.0),         # 6. Non-Functional Requirements (Max 1.0)
+        ("paradigm_keywords", 0.5, 1.0),    # 7. Tooling Paradigms (Max 1.0)
+    )
+
+    SENIOR_EXPERIENCE_PATTERN = re.compile(r"(5\+|[5-9]|1[0-9])\s*(years|yrs|year)")
+    MID_EXPERIENCE_PATTERN = re.compile(r"(3|4)\s*(years|yrs|year)")
+
     _SENIORITY_KEYWORDS_CACHE = None
 
     @staticmethod
@@ -106,12 +113,9 @@ class SeniorityAnalyzer:
     @staticmethod
     def _analyze_experience(desc_lower: str) -> float:
         """Calculates score based on years of experience regex."""
-        senior_exp_pattern = r"(5\+|[5-9]|1[0-9])\s*(years|yrs|year)"
-        mid_exp_pattern = r"(3|4)\s*(years|yrs|year)"
-        
-        if re.search(senior_exp_pattern, desc_lower):
+        if SeniorityAnalyzer.SENIOR_EXPERIENCE_PATTERN.search(desc_lower):
             return 5.0
-        elif re.search(mid_exp_pattern, desc_lower):
+        elif SeniorityAnalyzer.MID_EXPERIENCE_PATTERN.search(desc_lower):
             return 2.5
         return 0.0
 
@@ -138,29 +142,10 @@ class SeniorityAnalyzer:
         # 2. Base Score: Years of Experience (Max 5.0)
         experience_score = SeniorityAnalyzer._analyze_experience(desc_lower)
         
-        # 3. Action Verbs (Max 2.0)
-        verb_score = SeniorityAnalyzer._calculate_keyword_score(
-            desc_lower, keywords["action_verbs"], multiplier=0.4, max_cap=2.0
-        )
-
-        # 4. Scope of Impact (Max 1.5)
-        scope_score = SeniorityAnalyzer._calculate_keyword_score(
-            desc_lower, keywords["scope_keywords"], multiplier=0.5, max_cap=1.5
-        )
-
-        # 5. Mentorship and Leadership (Max 1.5)
-        leadership_score = SeniorityAnalyzer._calculate_keyword_score(
-            desc_lower, keywords["leadership_keywords"], multiplier=0.5, max_cap=1.5
-        )
-
-        # 6. Non-Functional Requirements (Max 1.0)
-        nfr_score = SeniorityAnalyzer._calculate_keyword_score(
-            desc_lower, keywords["nfr_keywords"], multiplier=0.5, max_cap=1.0
-        )
-
-        # 7. Tooling Paradigms (Max 1.0)
-        paradigm_score = SeniorityAnalyzer._calculate_keyword_score(
-            desc_lower, keywords["paradigm_keywords"], multiplier=0.5, max_cap=1.0
+        # 3-7. Keyword Categories: Action Verbs, Scope, Leadership, NFRs, Paradigms (see KEYWORD_WEIGHTS)
+        verb_score, scope_score, leadership_score, nfr_score, paradigm_score = (
+            SeniorityAnalyzer._calculate_keyword_score(desc_lower, keywords[category], multiplier=multiplier, max_cap=max_cap)
+            for category, multiplier, max_cap in SeniorityAnalyzer.KEYWORD_WEIGHTS
         )
 
         total_score = (
@@ -182,3 +167,155 @@ class SeniorityAnalyzer:
             "level": level,
             "is_senior": total_score >= 9.0 or has_managerial_title
         }
+
+    @staticmethod
+    def _extract_features(title_lower: str, desc_lower: str, keywords: Dict[str, Any]) -> List[int]:
+        """!
+        @brief Builds the title and experience columns of one row of the batch feature matrix.
+        @return [has_managerial, has_senior, has_junior, experience_bucket (0/1/2)]
+        """
+        titles = keywords["titles"]
+        row = [
+            int(any(word in title_lower for word in titles["managerial"])),
+            int(any(word in title_lower for word in titles["senior"])),
+            int(any(word in title_lower for word in titles["junior"])),
+            SeniorityAnalyzer._experience_bucket(desc_lower),
+        ]
+        return row
+
+    @staticmethod
+    def _experience_bucket(desc_lower: str) -> int:
+        """!
+        @brief `_analyze_experience` as a bucket (2: senior, 1: mid, 0: none), without scanning the whole text with the patterns.
+
+        @details Both patterns end in `\\s*(years|yrs|year)` after a number of at most two characters, so any match
+        starts one or two characters before the whitespace run preceding an occurrence of "year" or "yrs".
+        The patterns are only tried at those positions.
+        """
+        starts = []
+        for unit in ("year", "yrs"):
+            position = desc_lower.find(unit)
+            while position != -1:
+                end = position
+                while end > 0 and desc_lower[end - 1].isspace():
+                    end -= 1
+                starts.extend(start for start in (end - 2, end - 1) if start >= 0)
+                position = desc_lower.find(unit, position + 1)
+
+        if any(SeniorityAnalyzer.SENIOR_EXPERIENCE_PATTERN.match(desc_lower, start) for start in starts):
+            return 2
+        if any(SeniorityAnalyzer.MID_EXPERIENCE_PATTERN.match(desc_lower, start) for start in starts):
+            return 1
+        return 0
+
+    @staticmethod
+    def _count_keyword_hits(descs_lower: List[str], keywords: Dict[str, Any]) -> "np.ndarray":
+        """!
+        @brief Keyword hits per JD and `KEYWORD_WEIGHTS` category: how many of the category's keywords occur in each text.
+
+        @details
+        Same substring semantics as `_calculate_keyword_score`, but one pass over the whole batch instead of one
+        `in` scan per keyword and JD. The texts are joined into one NUL-separated UTF-8 buffer and every keyword is
+        anchored on its rarest byte pair (frequencies sampled from the buffer). One table lookup over the buffer
+        finds the positions holding an anchor pair; each keyword's candidates are then confirmed byte by byte with
+        vectorized comparisons and mapped back to their JD. UTF-8 is self-synchronizing, so byte matches are
+        exactly substring matches.
+
+        @return int64 array of shape (len(descs_lower), len(KEYWORD_WEIGHTS)).
+        """
+        hits = np.zeros((len(descs_lower), len(SeniorityAnalyzer.KEYWORD_WEIGHTS)), dtype=np.int64)
+        if not descs_lower:
+            return hits
+
+        blob = ("\x00".join(descs_lower) + "\x00").encode("utf-8")
+        buffer = np.frombuffer(blob, dtype=np.uint8)
+        lengths = np.fromiter((len(d) if d.isascii() else len(d.encode("utf-8")) for d in descs_lower), dtype=np.int64, count=len(descs_lower))
+        starts = np.concatenate(([0], np.cumsum(lengths + 1)))
+        # Byte pairs at even and odd offsets, as big-endian uint16 views of the buffer
+        pairs = (np.frombuffer(blob, dtype=">u2", count=len(blob) // 2),
+                 np.frombuffer(blob, dtype=">u2", count=(len(blob) - 1) // 2, offset=1))
+        frequency = np.bincount(pairs[0][:1 << 20], minlength=1 << 16)
+
+        anchored: List[Tuple[int, bytes, int, int]] = []
+        for column, (category, _, _) in enumerate(SeniorityAnalyzer.KEYWORD_WEIGHTS):
+            for word in keywords[category]:
+                encoded = word.encode("utf-8")
+                if len(encoded) < 2:
+                    # No byte pair to anchor on
+                    hits[:, column] += [int(word in desc) for desc in descs_lower]
+                    continue
+                offset = min(range(len(encoded) - 1), key=lambda i: frequency[(encoded[i] << 8) | encoded[i + 1]])
+                anchored.append((column, encoded, (encoded[offset] << 8) | encoded[offset + 1], offset))
+        if not anchored:
+            return hits
+
+        is_anchor = np.zeros(1 << 16, dtype=bool)
+        is_anchor[[pair for _, _, pair, _ in anchored]] = True
+        candidates = np.concatenate((np.flatnonzero(is_anchor[pairs[0]]) * 2, np.flatnonzero(is_anchor[pairs[1]]) * 2 + 1))
+        candidate_pairs = (buffer[candidates].astype(np.uint16) << 8) | buffer[candidates + 1]
+
+        for column, encoded, pair, offset in anchored:
+            positions = candidates[candidate_pairs == pair] - offset
+            positions = positions[(positions >= 0) & (positions + len(encoded) <= len(buffer))]
+            for i, byte in enumerate(encoded):
+                if i != offset and i != offset + 1:
+                    positions = positions[buffer[positions + i] == byte]
+            hits[np.unique(np.searchsorted(starts, positions, side="right") - 1), column] += 1
+        return hits
+
+    @staticmethod
+    def detect_seniority_batch(titles: List[str], descriptions: List[str]) -> Dict[str, Any]:
+        """!
+        @brief Scores many Job Descriptions at once; results are identical to `detect_seniority` per JD.
+
+        @details
+        Builds a JDs x features count matrix (title flags, experience bucket, keyword hits per category,
+        see `_count_keyword_hits`), then applies the weights, caps and thresholds as NumPy array operations.
+        Sub-scores are summed in the same order as the scalar path so the floating point totals match bit for bit.
+
+        @param titles Title candidate per JD (see `TextProcessor.extract_title_candidate`).
+        @param descriptions Full text per JD.
+        @return Dictionary of per-JD arrays:
+            - `score`: float64 total score rounded to 2 decimals.
+            - `level`: int8 codes into `LEVELS`.
+            - `is_senior`: bool flags.
+        """
+        keywords = SeniorityAnalyzer._load_seniority_keywords()
+        descs_lower = [description.lower() for description in descriptions]
+        features = np.hstack((
+            np.array(
+                [SeniorityAnalyzer._extract_features(title.lower(), desc_lower, keywords)
+                 for title, desc_lower in zip(titles, descs_lower)],
+                dtype=np.int64
+            ).reshape(-1, 4),
+            SeniorityAnalyzer._count_keyword_hits(descs_lower, keywords)
+        ))
+
+        has_managerial = features[:, 0] == 1
+        has_senior = features[:, 1] == 1
+        has_junior = features[:, 2] == 1
+
+        # 1. Title Score (Max 5.0)
+        title_score = np.select([has_managerial, has_senior, ~has_junior], [5.0, 4.0, 2.5], default=0.0)
+
+        # 2. Years of Experience (Max 5.0)
+        experience_score = np.select([features[:, 3] == 2, features[:, 3] == 1], [5.0, 2.5], default=0.0)
+
+        # 3-7. Keyword Categories
+        total_score = title_score + experience_score
+        for column, (_, multiplier, max_cap) in enumerate(SeniorityAnalyzer.KEYWORD_WEIGHTS, start=4):
+            total_score = total_score + np.minimum(max_cap, features[:, column] * multiplier)
+
+        # Final Classification
+        level = np.select(
+            [has_managerial, total_score >= 9.0, total_score >= 5.0],
+            [SeniorityAnalyzer.LEVELS.index(name) for name in ("Managerial", "Senior", "Mid")],
+            default=SeniorityAnalyzer.LEVELS.index("Junior")
+        ).astype(np.int8)
+
+        return {
+            # Python's round() rather than np.round(), which rounds some half-way cases differently
+            "score": np.array([round(float(score), 2) for score in total_score], dtype=np.float64),
+            "level": level,
+            "is_senior": (total_score >= 9.0) | has_managerial
+        }
@@ -1,7 +1,12 @@
 import logging
 import re
-from typing import List, Dict, Set
+from datetime import date
+from typing import List, Dict, Set, Optional
 from utils.seniority_analyzer import SeniorityAnalyzer
+from utils.fuzzy_matcher import FuzzySkillIndex
+from utils.ngram_matcher import NgramSkillMatcher
+from core.taxonomy import TaxonomyManager
+from core.skill_matrix import SkillMatrix
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -190,6 +195,23 @@ class TextProcessor:
         logger.debug(f"Returning heuristic candidate: '{heuristic_candidate}'")
         return heuristic_candidate
 
+    _POSTED_DATE_PATTERN = re.compile(r"^\s*(?:date posted|posting date|posted on|posted)\s*:?\s*(\d{4})-(\d{2})-(\d{2})\b", re.IGNORECASE | re.MULTILINE)
+
+    @staticmethod
+    def extract_posting_date(text: str) -> Optional[date]:
+        """!
+        @brief Reads the posting date of a JD from a header line such as `Posted: 2026-10-12` or `Date Posted: 2026-10-12`.
+        @return The date, or None if the JD carries no (valid) posting date.
+        """
+        match = TextProcessor._POSTED_DATE_PATTERN.search(text)
+        if not match:
+            return None
+        try:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            logger.debug(f"Invalid posting date '{match.group(0).strip()}'.")
+            return None
+
     @staticmethod
     def clean_text(text: str) -> str:
         """!
@@ -201,9 +223,17 @@ class TextProcessor:
         return text
 
     @staticmethod
-    def extract_skills(text: str, sorted_terms: List[str], alias_map: Dict[str, str]) -> List[str]:
+    def extract_skills(
+        text: str,
+        sorted_terms: List[str],
+        alias_map: Dict[str, str],
+        fuzzy_index: Optional[FuzzySkillIndex] = None) -> List[str]:
         """!
         @brief Scans text for known skills (Canonicals AND Aliases) using Greedy Longest-Match + Masking.
+
+        @details
+        If a `fuzzy_index` is supplied, a second typo-tolerant pass runs over the text left unmasked
+        by the exact pass and its hits are added to the exact matches (e.g. "kubernates" -> "kubernetes").
         """
         found_ids: Set[str] = set()
         work_text: str = TextProcessor.clean_text(text)
@@ -222,6 +252,97 @@ class TextProcessor:
                     found_ids.add(canonical)
                     # logger.debug(f"Found skill: '{term}' -> '{canonical}'")
                 work_text = re.sub(pattern, ' @@@ ', work_text)
+
+        if fuzzy_index is not None:
+            found_ids.update(fuzzy_index.match_text(work_text))
         
         # logger.debug(f"Total unique skills found: {len(found_ids)}")
         return list(found_ids)
+
+    @staticmethod
+    def extract_skills_ngram(
+        text: str,
+        matcher: NgramSkillMatcher,
+        fuzzy_index: Optional[FuzzySkillIndex] = None) -> List[str]:
+        """!
+        @brief Same contract as `extract_skills`, using token n-gram hash lookups instead of per-term regex scans.
+
+        @details
+        The text is cleaned and tokenized once; cost is O(tokens x max_term_len) and independent of taxonomy size.
+        See `NgramSkillMatcher` for how overlaps and word boundaries mirror the regex extractor.
+        """
+        work_text: str = TextProcessor.clean_text(text)
+        matches = matcher.find_matches(work_text)
+        found_ids: Set[str] = {matcher.alias_map[term] for _, _, term in matches}
+
+        if fuzzy_index is not None:
+            found_ids.update(fuzzy_index.match_text(NgramSkillMatcher.mask(work_text, matches)))
+
+        return list(found_ids)
+
+    @staticmethod
+    def extract_skills_multi(
+        text: str,
+        matchers: List[NgramSkillMatcher],
+        fuzzy_indexes: Optional[List[Optional[FuzzySkillIndex]]] = None) -> List[List[str]]:
+        """!
+        @brief Extracts skills for several taxonomies at once (one result list per matcher).
+
+        @details
+        Cleaning and tokenization are taxonomy independent, so they run once and only the n-gram
+        lookups (and optional fuzzy pass) are repeated per taxonomy. Each result matches `extract_skills_ngram`.
+        """
+        work_text: str = TextProcessor.clean_text(text)
+        spans = NgramSkillMatcher.tokenize(work_text)
+
+        results: List[List[str]] = []
+        for position, matcher in enumerate(matchers):
+            matches = matcher.find_matches(work_text, spans)
+            found_ids: Set[str] = {matcher.alias_map[term] for _, _, term in matches}
+
+            fuzzy_index = fuzzy_indexes[position] if fuzzy_indexes else None
+            if fuzzy_index is not None:
+                found_ids.update(fuzzy_index.match_text(NgramSkillMatcher.mask(work_text, matches)))
+            results.append(list(found_ids))
+        return results
+
+    @staticmethod
+    def extract_skills_batch(
+        texts: List[str],
+        matcher: Optional[NgramSkillMatcher] = None,
+        fuzzy_index: Optional[FuzzySkillIndex] = None,
+        with_levels: bool = False) -> SkillMatrix:
+        """!
+        @brief Extracts skills for many texts at once into a CSR `SkillMatrix` of interned skill ids.
+
+        @details
+        Setup is paid once per batch: the n-gram matcher (built from `TaxonomyManager.get_alias_map()` if not given)
+        and a direct term -> skill id table, so no per-JD lists of canonical names are built.
+        Results match `extract_skills` (see `NgramSkillMatcher`).
+
+        @param texts Raw Job Description texts.
+        @param matcher Optional prebuilt matcher to reuse across batches.
+        @param fuzzy_index Optional typo-tolerant pass (see `extract_skills`).
+        @param with_levels Also run seniority detection and fill `SkillMatrix.levels`.
+        @return SkillMatrix with one row per text.
+        """
+        if matcher is None:
+            matcher = NgramSkillMatcher(TaxonomyManager.get_alias_map())
+        skill_index: Dict[str, int] = TaxonomyManager.get_skill_index()
+        term_to_id: Dict[str, int] = {term: skill_index[canonical] for term, canonical in matcher.alias_map.items()}
+
+        rows: List[List[int]] = []
+        for text in texts:
+            work_text = TextProcessor.clean_text(text)
+            matches = matcher.find_matches(work_text)
+            row = [term_to_id[term] for _, _, term in matches]
+            if fuzzy_index is not None:
+                fuzzy_ids = fuzzy_index.match_text(NgramSkillMatcher.mask(work_text, matches))
+                row.extend(skill_index[canonical] for canonical in fuzzy_ids)
+            rows.append(row)
+
+        matrix = SkillMatrix.from_rows(rows, list(skill_index.keys()))
+        if with_levels:
+            titles = [TextProcessor.extract_title_candidate(text) for text in texts]
+            matrix.levels = SeniorityAnalyzer.detect_seniority_batch(titles, texts)["level"]
+        return matrix
@@ -0,0 +1,122 @@
+import sys
+import os
+import pickle
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import main
+from config import cfg
+from core.checkpoint import Checkpoint, CheckpointWriter
+from core.edge_accumulator import SpillingEdgeCounter
+from core.graph_engine import GraphBuilder
+
+def test_pack_detects_corruption():
+    data = Checkpoint.pack(pickle.dumps({"position": 3}))
+    assert Checkpoint.unpack(data) == {"position": 3}
+
+    corrupted = bytearray(data)
+    corrupted[-1] ^= 1
+    with pytest.raises(ValueError, match="checksum"):
+        Checkpoint.unpack(bytes(corrupted))
+    with pytest.raises(ValueError):
+        Checkpoint.unpack(data[:10])
+
+def test_writer_keeps_newest_and_latest_skips_invalid(tmp_path):
+    directory = str(tmp_path / "checkpoints")
+    writer = CheckpointWriter(directory, every_jds=10, every_seconds=0, keep=2)
+    writer.start(0, now=0.0)
+    assert not writer.due(9, now=1e9)
+    for position in (10, 20, 30):
+        assert writer.due(position, now=0.0)
+        writer.save({"position": position}, now=0.0)
+    writer.wait()
+
+    assert [os.path.basename(path) for path in Checkpoint.paths(directory)] == ["checkpoint_000000000030.ckpt", "checkpoint_000000000020.ckpt"]
+    with open(Checkpoint.path_for(directory, 30), "r+b") as f:
+        f.truncate(20)
+    assert Checkpoint.latest(directory) == {"position": 20}
+
+    writer.clear()
+    assert Checkpoint.latest(directory) is None
+
+def test_spilling_counter_survives_pickling(tmp_path):
+    counter = SpillingEdgeCounter(max_entries=4)
+    pairs = [("a", "b"), ("a", "c"), ("b", "c"), ("c", "d"), ("a", "d"), ("b", "d"), ("a", "b"), ("d", "e")]
+    for pair in pairs:
+        counter.increment(pair, is_senior=True, is_managerial=False)
+    assert counter.run_count > 0
+
+    counter.persist_runs(str(tmp_path / "runs"))
+    restored = pickle.loads(pickle.dumps(counter))
+    counter.close()
+    restored.increment(("a", "b"), is_senior=False, is_managerial=False)
+
+    merged = dict(restored.items())
+    assert merged[("a", "b")] == {"total": 3, "senior_count": 2, "managerial_count": 0}
+    assert sum(stats["total"] for stats in merged.values()) == len(pairs) + 1
+
+def test_fresh_run_discards_earlier_checkpoints(tmp_path, monkeypatch):
+    directory = tmp_path / "checkpoints" / "single"
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__ENABLED", "true")
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__DIRECTORY", str(tmp_path / "checkpoints"))
+    stale = CheckpointWriter(str(directory), keep=5)
+    for position in (40000, 50000):
+        stale.save({"position": position}, now=0.0)
+    stale.wait()
+    (directory / "edge_runs").mkdir()
+    (directory / "edge_runs" / "run_00000.tsv").write_text("a\tb\t1\t0\t0\n")
+
+    writer = main.build_checkpoint_writer(resume=False)
+    assert Checkpoint.latest(str(directory)) is None
+    assert os.listdir(directory / "edge_runs") == []
+    writer.save({"position": 10000}, now=0.0)
+    writer.wait()
+    assert Checkpoint.latest(str(directory))["position"] == 10000
+
+    assert main.build_checkpoint_writer(resume=True) is not None
+    assert Checkpoint.latest(str(directory))["position"] == 10000
+
+def test_shards_keep_separate_checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__ENABLED", "true")
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__DIRECTORY", str(tmp_path / "checkpoints"))
+    first = main.build_checkpoint_writer(resume=False, shard=0, num_shards=2)
+    first.save({"position": 6}, now=0.0)
+    first.wait()
+
+    second = main.build_checkpoint_writer(resume=False, shard=1, num_shards=2)
+    assert first.directory != second.directory
+    assert os.path.basename(second.directory) == "shard_0001_of_0002"
+    assert Checkpoint.latest(first.directory)["position"] == 6
+    assert Checkpoint.latest(second.directory) is None
+
+def test_resume_matches_uninterrupted_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAREERNAV_PATHS__TEST_INPUT", cfg.get_abs_path("paths.input"))
+    monkeypatch.setenv("CAREERNAV_PATHS__OUTPUT_DIR", str(tmp_path / "reference"))
+    main.process_data()
+
+    monkeypatch.setenv("CAREERNAV_PATHS__OUTPUT_DIR", str(tmp_path / "resumed"))
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__ENABLED", "true")
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__EVERY_JDS", "6")
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__DIRECTORY", str(tmp_path / "checkpoints"))
+
+    update_metrics = GraphBuilder.update_metrics
+    calls = []
+    def crash_at_jd_20(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 20:
+            raise RuntimeError("simulated crash")
+        return update_metrics(*args, **kwargs)
+
+    monkeypatch.setattr(GraphBuilder, "update_metrics", staticmethod(crash_at_jd_20))
+    with pytest.raises(RuntimeError):
+        main.process_data()
+    monkeypatch.setattr(GraphBuilder, "update_metrics", staticmethod(update_metrics))
+    assert Checkpoint.latest(str(tmp_path / "checkpoints" / "single"))["position"] == 18
+
+    main.process_data(resume=True)
+    for name in ("universe.json", "neighbors.json", "nodes.csv", "edges.csv"):
+        with open(tmp_path / "reference" / name, "rb") as expected, open(tmp_path / "resumed" / name, "rb") as actual:
+            assert expected.read() == actual.read(), name
+    assert Checkpoint.paths(str(tmp_path / "checkpoints" / "single")) == []
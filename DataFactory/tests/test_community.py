@@ -0,0 +1,57 @@
+import sys
+import os
+import itertools
+import random
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.adjacency import AdjacencyMatrix
+from core.community import CommunityDetector
+
+def _planted_partition(groups: int, size: int, p_in: float, p_out: float, seed: int = 1):
+    rng = random.Random(seed)
+    nodes = [f"g{g}_{i}" for g in range(groups) for i in range(size)]
+    edges = {}
+    for a, b in itertools.combinations(nodes, 2):
+        same = a.split("_")[0] == b.split("_")[0]
+        if rng.random() < (p_in if same else p_out):
+            edges[(a, b)] = {"total": rng.randint(1, 5)}
+    return nodes, edges
+
+def test_two_cliques_split_at_the_bridge():
+    left = ["a", "b", "c", "d"]
+    right = ["w", "x", "y", "z"]
+    edges = {pair: {"total": 3} for group in (left, right) for pair in itertools.combinations(group, 2)}
+    edges[("d", "w")] = {"total": 1}
+    adjacency = AdjacencyMatrix.from_edges(left + right + ["lonely"], edges)
+
+    labels = CommunityDetector.detect(adjacency)
+    assert len(set(labels[:4])) == 1 and len(set(labels[4:8])) == 1
+    assert labels[0] != labels[4]
+    assert labels[8] == 2  # isolated node is its own (smallest) community
+    # 2m = 74 (each clique stores 36, the bridge 2); each clique has tot = 37
+    assert abs(CommunityDetector.modularity(adjacency, labels) - 2 * (36 / 74 - (37 / 74) ** 2)) < 1e-9
+
+def test_planted_partition_is_recovered_deterministically():
+    nodes, edges = _planted_partition(groups=4, size=30, p_in=0.3, p_out=0.01)
+    adjacency = AdjacencyMatrix.from_edges(nodes, edges)
+    labels = CommunityDetector.detect(adjacency, seed=7)
+    assert (labels == CommunityDetector.detect(adjacency, seed=7)).all()
+
+    for g in range(4):
+        block = labels[g * 30:(g + 1) * 30]
+        assert len(set(block.tolist())) == 1
+    assert len(set(labels.tolist())) == 4
+
+def test_summaries_and_node_field():
+    nodes_list = [
+        {"id": "a", "group": "LANG", "val": 5, "seniorityScore": 0.5},
+        {"id": "b", "group": "LANG", "val": 9, "seniorityScore": 1.0},
+        {"id": "c", "group": "DB", "val": 1, "seniorityScore": 0.0},
+    ]
+    adjacency = AdjacencyMatrix.from_edges(["a", "b", "c"], {("a", "b"): {"total": 4}})
+    labels = CommunityDetector.detect(adjacency)
+    summaries = CommunityDetector.summarize(nodes_list, ["a", "b", "c"], labels, adjacency)
+    assert [node["community"] for node in nodes_list] == [0, 0, 1]
+    assert summaries[0] == {"id": 0, "size": 2, "topSkills": ["b", "a"], "dominantGroup": "LANG", "avgSeniorityScore": 0.75, "internalWeight": 4}
@@ -0,0 +1,76 @@
+import sys
+import os
+import re
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.taxonomy import TaxonomyManager
+from utils.text_processor import TextProcessor
+from utils.ngram_matcher import NgramSkillMatcher
+from utils.differential import DifferentialRunner, Engine
+
+SKILLS = ("python", "kafka", "sql")
+
+def _words(text: str):
+    return re.findall(r"[a-z]+,?", text.lower())
+
+def _reference(jds):
+    return [(tuple(sorted({word.rstrip(",") for word in _words(jd)} & set(SKILLS))), "Senior" if "lead" in jd.lower() else "Mid") for jd in jds]
+
+def _buggy(jds):
+    # Misses skills written right before a comma, and ignores the title
+    return [(tuple(sorted({word for word in _words(jd)} & set(SKILLS))), "Mid") for jd in jds]
+
+def test_minimize_keeps_only_the_failing_words():
+    text = "alpha beta\ngamma x delta\nepsilon y zeta\neta"
+    minimized = DifferentialRunner.minimize(text, lambda candidate: "x" in candidate.split() and "y" in candidate.split())
+    assert minimized.split() == ["x", "y"]
+    assert DifferentialRunner.minimize("no failure", lambda candidate: False) == "no failure"
+
+def test_compare_analysis_reports_minimized_mismatches():
+    jds = [
+        "Backend Engineer\nWe use python and sql daily.\nAlso some kafka.",
+        "Tech Lead\nStack: python, sql and kafka.\nRemote friendly team.",
+        "Data Engineer\nsql\nnothing else"
+    ]
+    report = DifferentialRunner().compare_analysis(Engine("reference", _reference), Engine("buggy", _buggy), jds)
+
+    assert report["jds"] == 3 and report["identical"] == 2
+    (mismatch,) = report["mismatches"]
+    assert mismatch["jd"] == 1
+    assert mismatch["fields"] == ["skills", "level"]
+    assert mismatch["onlyReference"] == ["python"]
+    assert (mismatch["referenceLevel"], mismatch["alternativeLevel"]) == ("Senior", "Mid")
+    # A single cause survives minimization: either the comma after python or the "Lead" title
+    assert mismatch["repro"]["text"].split() in (["python,"], ["Lead"])
+    assert report["timing"]["reference"] == "reference" and report["timing"]["speedup"] is not None
+
+def test_diff_universes_matches_entries_by_key():
+    expected = {
+        "meta": {"modularity": 0.4},
+        "nodes": [{"id": "python", "val": 3}, {"id": "sql", "val": 2}],
+        "links": [{"source": "python", "target": "sql", "value": 2}]
+    }
+    actual = {
+        "meta": {"modularity": 0.5},
+        "nodes": [{"id": "kafka", "val": 1}, {"id": "python", "val": 4}, {"id": "sql", "val": 2}],
+        "links": [{"source": "python", "target": "sql", "value": 2}]
+    }
+    differences = DifferentialRunner.diff_universes(expected, actual)
+    assert differences["meta"] == ["modularity: 0.4 != 0.5"]
+    assert differences["nodes"]["onlyAlternative"] == ["kafka"]
+    assert differences["nodes"]["changed"] == ["python.val: 3 != 4"]
+    assert differences["nodes"]["sameOrder"] is False
+    assert differences["links"] == {"onlyReference": [], "onlyAlternative": [], "changed": [], "sameOrder": True}
+
+def test_ngram_extractor_matches_regex_on_synthetic_corpus():
+    matchable_terms = TaxonomyManager.get_matchable_terms()
+    alias_map = TaxonomyManager.get_alias_map()
+    matcher = NgramSkillMatcher(alias_map)
+    reference = Engine("regex", lambda jds: [(tuple(sorted(TextProcessor.extract_skills(jd, matchable_terms, alias_map))), "") for jd in jds])
+    alternative = Engine("ngram", lambda jds: [(tuple(sorted(TextProcessor.extract_skills_ngram(jd, matcher))), "") for jd in jds])
+
+    jds = DifferentialRunner.synthetic_corpus(matchable_terms, 200, seed=7)
+    report = DifferentialRunner().compare_analysis(reference, alternative, jds)
+    assert report["mismatches"] == []
@@ -0,0 +1,70 @@
+import sys
+import os
+import random
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.edge_accumulator import SpillingEdgeCounter
+from core.graph_engine import GraphBuilder
+
+SKILLS = [f"skill_{i:02d}" for i in range(30)]
+
+def _random_jobs(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [(rng.sample(SKILLS, rng.randint(2, 8)), rng.random() < 0.4, rng.random() < 0.2) for _ in range(count)]
+
+def test_spilled_counts_match_in_memory_counts():
+    in_memory = GraphBuilder.initialize_stats(SKILLS)
+    spilling = GraphBuilder.initialize_stats(SKILLS)
+    spilling.edge_counts = SpillingEdgeCounter(max_entries=16)
+
+    for found_skills, is_senior, is_managerial in _random_jobs(200):
+        GraphBuilder._update_edges(in_memory, found_skills, is_senior, is_managerial)
+        GraphBuilder._update_edges(spilling, found_skills, is_senior, is_managerial)
+
+    assert spilling.edge_counts.run_count > 0
+    assert list(spilling.edge_counts.items()) == sorted(in_memory.edge_counts.items())
+
+    expected = GraphBuilder.filter_edges(in_memory.edge_counts, SKILLS[:20], 3)
+    actual = GraphBuilder.filter_edges(spilling.edge_counts, SKILLS[:20], 3)
+    assert list(actual.items()) == list(expected.items())
+    spilling.edge_counts.close()
+
+def test_merge_fan_in_is_bounded(monkeypatch):
+    in_memory = GraphBuilder.initialize_stats(SKILLS)
+    spilling = GraphBuilder.initialize_stats(SKILLS)
+    spilling.edge_counts = SpillingEdgeCounter(max_entries=4)
+    for found_skills, is_senior, is_managerial in _random_jobs(200):
+        GraphBuilder._update_edges(in_memory, found_skills, is_senior, is_managerial)
+        GraphBuilder._update_edges(spilling, found_skills, is_senior, is_managerial)
+
+    read_run = SpillingEdgeCounter._read_run
+    open_runs, peak = [0], [0]
+    def tracked_read_run(run_path):
+        open_runs[0] += 1
+        peak[0] = max(peak[0], open_runs[0])
+        try:
+            yield from read_run(run_path)
+        finally:
+            open_runs[0] -= 1
+
+    monkeypatch.setattr(SpillingEdgeCounter, "MERGE_FAN_IN", 3)
+    monkeypatch.setattr(SpillingEdgeCounter, "_read_run", staticmethod(tracked_read_run))
+    run_files = sorted(os.listdir(spilling.edge_counts._run_dir))
+    assert spilling.edge_counts.run_count > 10
+
+    assert list(spilling.edge_counts.items()) == sorted(in_memory.edge_counts.items())
+    assert peak[0] <= 3
+    # Intermediate runs are removed, spilled runs are kept
+    assert sorted(os.listdir(spilling.edge_counts._run_dir)) == run_files
+    spilling.edge_counts.close()
+
+def test_close_removes_run_files():
+    counter = SpillingEdgeCounter(max_entries=2)
+    for i in range(10):
+        counter.increment((f"a{i}", f"b{i}"), False, False)
+    run_dir = counter._run_dir
+    assert os.listdir(run_dir)
+    counter.close()
+    assert not os.path.exists(run_dir)
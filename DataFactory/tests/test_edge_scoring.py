@@ -0,0 +1,39 @@
+import sys
+import os
+import math
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.edge_scoring import EdgeScorer
+
+NODE_STATS = {"agile": {"total": 10}, "python": {"total": 5}, "django": {"total": 3}, "kafka": {"total": 2}}
+EDGES = {
+    ("agile", "django"): {"total": 3},
+    ("agile", "kafka"): {"total": 1},
+    ("agile", "python"): {"total": 5},
+    ("django", "python"): {"total": 3},
+}
+
+def test_scores_match_definitions():
+    scores = EdgeScorer.score_edges(EDGES, NODE_STATS, total_jobs=10)
+    pair = scores[("django", "python")]
+    p_ab, p_a, p_b = 0.3, 0.3, 0.5
+    assert pair["lift"] == pytest.approx(p_ab / (p_a * p_b), abs=1e-4)
+    assert pair["pmi"] == pytest.approx(math.log(p_ab / (p_a * p_b)), abs=1e-4)
+    assert pair["npmi"] == pytest.approx(math.log(p_ab / (p_a * p_b)) / -math.log(p_ab), abs=1e-4)
+    # "agile" is in every JD, so its edges carry no information
+    assert scores[("agile", "python")]["pmi"] == pytest.approx(0.0)
+    # kafka's only edge: degree 1 on its side, (1 - 1/9)^2 on agile's side
+    assert scores[("agile", "kafka")]["disparity"] == pytest.approx((8 / 9) ** 2, abs=1e-4)
+
+def test_pruning_modes():
+    scores = EdgeScorer.score_edges(EDGES, NODE_STATS, total_jobs=10)
+    assert EdgeScorer.prune_edges(EDGES, scores, "none") is EDGES
+    assert list(EdgeScorer.prune_edges(EDGES, scores, "npmi", min_npmi=0.1)) == [("django", "python")]
+    top1 = EdgeScorer.prune_edges(EDGES, scores, "topk", top_k=1)
+    # agile ties at npmi 0 and keeps its heaviest edge; kafka keeps its only edge
+    assert set(top1) == {("agile", "python"), ("django", "python"), ("agile", "kafka")}
+    with pytest.raises(ValueError):
+        EdgeScorer.prune_edges(EDGES, scores, "bogus")
@@ -0,0 +1,51 @@
+import sys
+import os
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.fuzzy_matcher import FuzzySkillIndex
+from utils.text_processor import TextProcessor
+
+ALIAS_MAP = {
+    "kubernetes": "kubernetes",
+    "k8s": "kubernetes",
+    "postgresql": "postgresql",
+    "node.js": "node_js",
+    "node_js": "node_js",
+    "code_reviews": "code_reviews",
+    "containerd": "containerd",
+    "java": "java",
+    "scala": "scala",
+}
+SORTED_TERMS = sorted(ALIAS_MAP, key=lambda x: (-len(x), x))
+
+def test_typos_and_variants_resolve():
+    index = FuzzySkillIndex(ALIAS_MAP, max_edit_distance=1, min_term_length=7)
+    assert index.lookup("kubernates") == "kubernetes"
+    assert index.lookup("postgre sql") == "postgresql"
+    assert ALIAS_MAP[index.lookup("node js")] == "node_js"
+    assert index.lookup("code reviews") == "code_reviews"
+
+def test_short_terms_and_truncations_stay_exact():
+    index = FuzzySkillIndex(ALIAS_MAP, max_edit_distance=2, min_term_length=7)
+    assert index.lookup("jave") is None
+    assert index.lookup("scale") is None
+    assert index.lookup("container") is None
+    # Exact terms are left to the exact matcher
+    assert index.lookup("kubernetes") is None
+
+def test_extract_skills_adds_fuzzy_hits_only_when_enabled():
+    text = "Deploy on Kubernates, store data in Postgre SQL and build APIs with Node JS."
+    exact = set(TextProcessor.extract_skills(text, SORTED_TERMS, ALIAS_MAP))
+    assert exact == set()
+
+    index = FuzzySkillIndex(ALIAS_MAP)
+    fuzzy = set(TextProcessor.extract_skills(text, SORTED_TERMS, ALIAS_MAP, index))
+    assert fuzzy == {"kubernetes", "postgresql", "node_js"}
+
+def test_masked_exact_matches_are_barriers():
+    index = FuzzySkillIndex(ALIAS_MAP)
+    # "k8s" is matched exactly and masked, so it cannot be glued onto a neighbouring token
+    found = set(TextProcessor.extract_skills("k8s cluster", SORTED_TERMS, ALIAS_MAP, index))
+    assert found == {"kubernetes"}
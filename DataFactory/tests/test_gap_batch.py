@@ -0,0 +1,95 @@
+import sys
+import os
+import random
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.gap_batch import BatchGapAnalyzer
+
+# Same fixture as CareerNavigator.Tests/Engines/GapAnalyzerTests.cs
+UNIVERSE = {
+    "nodes": [
+        {"id": "C#", "isSenior": False},
+        {"id": "TypeScript", "isSenior": False},
+        {"id": "React", "isSenior": False},
+        {"id": "Next.js", "isSenior": False},
+        {"id": "Azure", "isSenior": True},
+        {"id": "System Design", "isSenior": True}
+    ],
+    "links": [
+        {"source": "TypeScript", "target": "Next.js", "value": 10},
+        {"source": "C#", "target": "Azure", "value": 10}
+    ]
+}
+
+def _pair(user_skills, user_level, job_skills, job_level):
+    analyzer = BatchGapAnalyzer(UNIVERSE)
+    profiles = analyzer.encode([user_skills], [user_level])
+    jobs = analyzer.encode([job_skills], [job_level])
+    return analyzer.pair(profiles, jobs, 0, 0), analyzer.analyze(profiles, jobs)
+
+def test_matches_core_gap_analyzer_cases():
+    result, batch = _pair(["C#", "SQL"], "Mid", ["C#", "SQL", "Azure"], "Mid")
+    assert result["missingSkills"] == ["azure"]
+    assert batch.missing_count[0, 0] == 1
+
+    result, batch = _pair(["HTML"], "Mid", ["Next.js"], "Mid")
+    assert result["missingSkills"] == ["next.js"]
+    assert result["implicitSkills"] == ["typescript"]
+    assert batch.implicit_count[0, 0] == 1
+
+    result, batch = _pair(["C#"], "Mid", ["C#"], "Senior")
+    assert result["seniorityMismatch"] and batch.seniority_mismatch[0, 0]
+
+    result, batch = _pair(["C#", "System Design"], "Senior", ["C#"], "Senior")
+    assert not result["seniorityMismatch"] and not batch.seniority_mismatch[0, 0]
+
+    # Senior profile without any isSenior skill fails the elite check
+    result, batch = _pair(["C#"], "Senior", ["C#"], "Senior")
+    assert result["seniorityMismatch"] and batch.lacks_elite_skills[0]
+
+def _reference(universe, user_skills, job_skills):
+    """Straight port of the string-based Core algorithm (missing + implicit)."""
+    user = {skill.lower() for skill in user_skills}
+    job = {skill.lower() for skill in job_skills}
+    missing = job - user
+    implicit = set()
+    for link in universe["links"]:
+        source, target = link["source"].lower(), link["target"].lower()
+        for a, b in ((source, target), (target, source)):
+            if a in missing and b not in user and b not in job:
+                implicit.add(b)
+    return missing, implicit
+
+def test_batch_matches_reference_on_random_cohort():
+    rng = random.Random(4)
+    skills = [f"skill_{i}" for i in range(150)]
+    universe = {
+        "nodes": [{"id": skill, "isSenior": rng.random() < 0.2} for skill in skills],
+        "links": [{"source": a, "target": b} for a, b in (rng.sample(skills, 2) for _ in range(600))]
+    }
+    levels = ["Junior", "Mid", "Senior", "Managerial"]
+    profile_lists = [rng.sample(skills, rng.randint(0, 25)) for _ in range(40)]
+    job_lists = [rng.sample(skills, rng.randint(1, 12)) for _ in range(30)]
+
+    analyzer = BatchGapAnalyzer(universe)
+    profiles = analyzer.encode(profile_lists, [rng.choice(levels) for _ in profile_lists])
+    jobs = analyzer.encode(job_lists, [rng.choice(levels) for _ in job_lists])
+    result = analyzer.analyze(profiles, jobs)
+
+    for p in range(0, 40, 7):
+        for q in range(30):
+            missing, implicit = _reference(universe, profile_lists[p], job_lists[q])
+            assert result.missing_count[p, q] == len(missing)
+            assert result.implicit_count[p, q] == len(implicit)
+            detail = analyzer.pair(profiles, jobs, p, q)
+            assert set(detail["missingSkills"]) == missing
+            assert set(detail["implicitSkills"]) == implicit
+
+    report = analyzer.cohort_report(profiles, jobs, result, top_n=3)
+    assert len(report) == 30
+    for entry in report:
+        assert entry["readyProfiles"] == int((result.missing_count[:, entry["job"]] == 0).sum())
+        for skill, lacking in entry["topMissing"]:
+            assert lacking == sum(skill not in {s.lower() for s in profile} for profile in profile_lists)
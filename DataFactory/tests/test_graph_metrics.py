@@ -0,0 +1,68 @@
+import sys
+import os
+import itertools
+import random
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import numpy as np
+from core.adjacency import AdjacencyMatrix
+from utils.analytics import AnalyticsEngine
+
+def _random_graph(n: int = 25, p: float = 0.25, seed: int = 3):
+    rng = random.Random(seed)
+    nodes = [f"s{i:02d}" for i in range(n)]
+    edges = {(a, b): {"total": rng.randint(1, 9)} for a, b in itertools.combinations(nodes, 2) if rng.random() < p}
+    return nodes, edges
+
+def test_adjacency_is_symmetric_csr():
+    adjacency = AdjacencyMatrix.from_edges(["a", "b", "c"], {("a", "b"): {"total": 2}, ("b", "c"): {"total": 5}})
+    assert adjacency.indptr.tolist() == [0, 1, 3, 4]
+    assert adjacency.neighbors(1).tolist() == [0, 2]
+    assert adjacency.strength().tolist() == [2.0, 7.0, 5.0]
+
+def test_metrics_match_reference_definitions():
+    nodes, edges = _random_graph()
+    nodes.append("isolated")
+    metrics = AnalyticsEngine.calculate_graph_metrics(nodes, edges, tol=1e-12, max_iter=1000, wedge_chunk_size=7)
+
+    neighbors = {node: {} for node in nodes}
+    for (a, b), stats in edges.items():
+        neighbors[a][b] = stats["total"]
+        neighbors[b][a] = stats["total"]
+
+    # Clustering: closed neighbor pairs / all neighbor pairs
+    for i, node in enumerate(nodes):
+        pairs = list(itertools.combinations(neighbors[node], 2))
+        expected = sum(1 for u, w in pairs if w in neighbors[u]) / len(pairs) if pairs else 0.0
+        assert metrics["clustering"][i] == pytest.approx(expected)
+
+    # PageRank: stationary point of the damped weighted random walk
+    rank = metrics["pageRank"]
+    assert rank.sum() == pytest.approx(1.0)
+    strength = {node: sum(neighbors[node].values()) for node in nodes}
+    dangling = sum(rank[i] for i, node in enumerate(nodes) if strength[node] == 0)
+    for j, node in enumerate(nodes):
+        inflow = sum(rank[nodes.index(u)] * w / strength[u] for u, w in neighbors[node].items())
+        assert rank[j] == pytest.approx(0.85 * (inflow + dangling / len(nodes)) + 0.15 / len(nodes))
+
+    # Eigenvector centrality: principal eigenvector of W
+    dense = np.zeros((len(nodes), len(nodes)))
+    for (a, b), stats in edges.items():
+        dense[nodes.index(a), nodes.index(b)] = dense[nodes.index(b), nodes.index(a)] = stats["total"]
+    eigenvalues, eigenvectors = np.linalg.eigh(dense)
+    principal = np.abs(eigenvectors[:, np.argmax(eigenvalues)])
+    assert np.allclose(metrics["eigenvectorCentrality"], principal, atol=1e-6)
+
+def test_attach_graph_metrics_and_histogram():
+    nodes_list = [{"id": "a"}, {"id": "b"}]
+    metrics = AnalyticsEngine.calculate_graph_metrics(["a", "b"], {("a", "b"): {"total": 3}})
+    summary = AnalyticsEngine.attach_graph_metrics(nodes_list, ["a", "b"], metrics)
+    assert nodes_list[0]["degree"] == 1 and nodes_list[0]["weightedDegree"] == 3.0
+    assert summary["pageRank"]["max"] == pytest.approx(0.5)
+
+    meta = AnalyticsEngine.calculate_seniority_distribution([0.0, 0.3, 0.7, 1.0, 0.95], 5)
+    assert meta["seniorityDistribution"]["0.9-1.0"] == 2
+    assert meta["seniorityDistribution"]["0.3-0.4"] == 1
@@ -0,0 +1,65 @@
+import sys
+import os
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.graph_store import GraphStore
+
+def _link(source, target, value):
+    return {"source": source, "target": target, "value": value, "seniorityScore": 0.5}
+
+UNIVERSE = {
+    "meta": {"generation": 3},
+    "nodes": [
+        {"id": "python", "group": "LANG", "val": 10},
+        {"id": "go", "group": "LANG", "val": 4},
+        {"id": "sql", "group": "DATA", "val": 8},
+        {"id": "spark", "group": "DATA", "val": 6},
+        {"id": "kafka", "group": "DATA", "val": 5},
+        {"id": "figma", "group": "DESIGN", "val": 2}
+    ],
+    "links": [
+        _link("python", "sql", 7),
+        _link("python", "spark", 5),
+        _link("go", "python", 2),
+        _link("kafka", "spark", 4),
+        _link("sql", "spark", 1),
+        _link("figma", "go", 1)
+    ]
+}
+
+def _store(tmp_path) -> GraphStore:
+    path = str(tmp_path / "graph.sqlite")
+    GraphStore.build(UNIVERSE, path)
+    return GraphStore(path)
+
+def test_top_edges_and_nodes(tmp_path):
+    with _store(tmp_path) as store:
+        assert store.meta() == {"generation": 3}
+        assert store.node("spark") == {"id": "spark", "group": "DATA", "val": 6}
+        assert store.node("rust") is None
+        assert [(link["source"], link["target"]) for link in store.top_edges("spark", limit=2)] == [("python", "spark"), ("kafka", "spark")]
+        assert store.top_edges("python", min_weight=6) == [_link("python", "sql", 7)]
+
+def test_ego_network(tmp_path):
+    with _store(tmp_path) as store:
+        one_hop = store.ego_network("python", hops=1, min_weight=2)
+        assert [node["id"] for node in one_hop["nodes"]] == ["go", "python", "spark", "sql"]
+        # Induced links only: sql-spark is below min_weight, kafka and figma are two hops away
+        assert [(link["source"], link["target"]) for link in one_hop["links"]] == [("go", "python"), ("python", "spark"), ("python", "sql")]
+
+        two_hops = store.ego_network("python", hops=2)
+        assert len(two_hops["nodes"]) == 6
+        assert len(two_hops["links"]) == len(UNIVERSE["links"])
+
+        capped = store.ego_network("python", hops=2, max_nodes=2)
+        assert [node["id"] for node in capped["nodes"]] == ["python", "sql"]
+        assert store.ego_network("rust") == {"nodes": [], "links": []}
+
+def test_group_subgraph(tmp_path):
+    with _store(tmp_path) as store:
+        data = store.group_subgraph("DATA")
+        assert [node["id"] for node in data["nodes"]] == ["kafka", "spark", "sql"]
+        assert [(link["source"], link["target"]) for link in data["links"]] == [("kafka", "spark"), ("sql", "spark")]
+        assert store.group_subgraph("DATA", min_weight=2)["links"] == [_link("kafka", "spark", 4)]
@@ -0,0 +1,43 @@
+import sys
+import os
+import random
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.inverted_index import InvertedIndex
+from ingestion.reader import Reader
+from ingestion.writer import Writer
+
+SKILLS = ["kafka", "flink", "spark", "python", "java"]
+LEVELS = ["Junior", "Mid", "Senior", "Managerial"]
+
+def _corpus(count: int = 400, seed: int = 5):
+    rng = random.Random(seed)
+    return [(set(rng.sample(SKILLS, rng.randint(0, 4))), rng.choice(LEVELS)) for _ in range(count)]
+
+def test_varint_roundtrip():
+    ordinals = [0, 1, 127, 128, 300, 16384, 2 ** 21 + 5]
+    encoded = InvertedIndex.encode_postings(ordinals)
+    assert InvertedIndex.decode_postings(encoded) == ordinals
+    # Gaps below 128 take a single byte
+    assert len(InvertedIndex.encode_postings(list(range(1000)))) == 1000
+
+def test_queries_match_brute_force_after_reload(tmp_path):
+    corpus = _corpus()
+    index = InvertedIndex()
+    for ordinal, (skills, level) in enumerate(corpus):
+        index.add(ordinal, skills, level)
+
+    Writer.save_inverted_index(index, output_dir=str(tmp_path))
+    loaded = Reader.load_inverted_index(os.path.join(str(tmp_path), "inverted_index.bin"))
+
+    expected = [i for i, (skills, level) in enumerate(corpus) if {"kafka", "flink"} <= skills and level == "Senior"]
+    assert index.query(all_of=["kafka", "flink"], levels=["Senior"]) == expected
+    assert loaded.query(all_of=["kafka", "flink"], levels=["Senior"]) == expected
+
+    expected = [i for i, (skills, _) in enumerate(corpus) if skills & {"spark", "java"} and "python" not in skills]
+    assert loaded.query(any_of=["spark", "java"], none_of=["python"]) == expected
+    assert loaded.count(none_of=SKILLS) == sum(1 for skills, _ in corpus if not skills)
+    assert loaded.postings("kafka") == index.postings("kafka")
+    assert loaded.query(all_of=["unknown_skill"]) == []
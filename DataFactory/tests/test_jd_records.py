@@ -0,0 +1,102 @@
+import sys
+import os
+import pickle
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import main
+from config import cfg
+from core.graph_engine import GraphBuilder
+from core.jd_records import JDRecordWriter, JDRecords
+from core.temporal_stats import TemporalStats
+
+SKILL_INDEX = {"python": 0, "docker": 1, "kafka": 2}
+LEVELS = ["Junior", "Mid", "Senior", "Managerial"]
+ROWS = [
+    ("Job Title: Data Engineer\nkafka, python", "Data Engineer", 6.5, "Mid", ["python", "kafka"]),
+    ("Job Title: Intern\nDocker", "Intern", 0.0, "Junior", ["docker"]),
+    ("Job Title: Head of Data", "Head of Data", 12.0, "Managerial", []),
+]
+
+def write_rows(writer, rows, first=0):
+    for ordinal, (text, title, score, level, skills) in enumerate(rows, start=first):
+        writer.add(ordinal, text, title, score, level, skills)
+
+def test_npz_roundtrip_and_column_selection(tmp_path):
+    writer = JDRecordWriter(str(tmp_path), SKILL_INDEX, LEVELS, row_group_size=2, fmt="npz")
+    writer.start()
+    write_rows(writer, ROWS)
+    writer.close()
+
+    records = JDRecords(str(tmp_path))
+    assert records.n_rows == 3 and len(records.manifest["parts"]) == 2
+
+    columns = records.read()
+    assert columns["ordinal"].tolist() == [0, 1, 2]
+    assert columns["title"].tolist() == ["Data Engineer", "Intern", "Head of Data"]
+    assert columns["score"].tolist() == [6.5, 0.0, 12.0]
+    assert [records.levels[code] for code in columns["level"]] == ["Mid", "Junior", "Managerial"]
+    assert [columns["skills"].row_names(i) for i in range(3)] == [["python", "kafka"], ["docker"], []]
+    assert format(int(columns["hash"][0]), "016x") == TemporalStats.fingerprint(ROWS[0][0])
+
+    assert list(records.read(["level"])) == ["level"]
+    with pytest.raises(ValueError):
+        records.read(["salary"])
+
+def test_restored_writer_drops_parts_written_after_checkpoint(tmp_path):
+    writer = JDRecordWriter(str(tmp_path), SKILL_INDEX, LEVELS, row_group_size=2, fmt="npz")
+    writer.start()
+    write_rows(writer, ROWS[:1])
+    snapshot = pickle.dumps(writer)
+    write_rows(writer, ROWS[1:], first=1)
+
+    restored = pickle.loads(snapshot)
+    restored.start()
+    assert sorted(os.listdir(tmp_path)) == []
+    write_rows(restored, ROWS[1:], first=1)
+    restored.close()
+    assert JDRecords(str(tmp_path)).read(["ordinal"])["ordinal"].tolist() == [0, 1, 2]
+
+def test_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        JDRecordWriter(str(tmp_path), SKILL_INDEX, LEVELS, fmt="csv")
+    with pytest.raises(ValueError):
+        JDRecords(str(tmp_path))
+
+def test_resumed_run_writes_the_same_records(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAREERNAV_PATHS__TEST_INPUT", cfg.get_abs_path("paths.input"))
+    monkeypatch.setenv("CAREERNAV_EXPORT__JD_RECORDS", "true")
+    monkeypatch.setenv("CAREERNAV_EXPORT__JD_RECORDS_FORMAT", "npz")
+    monkeypatch.setenv("CAREERNAV_EXPORT__JD_RECORDS_ROW_GROUP", "4")
+    monkeypatch.setenv("CAREERNAV_PATHS__OUTPUT_DIR", str(tmp_path / "reference"))
+    main.process_data()
+
+    monkeypatch.setenv("CAREERNAV_PATHS__OUTPUT_DIR", str(tmp_path / "resumed"))
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__ENABLED", "true")
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__EVERY_JDS", "6")
+    monkeypatch.setenv("CAREERNAV_CHECKPOINT__DIRECTORY", str(tmp_path / "checkpoints"))
+
+    update_metrics = GraphBuilder.update_metrics
+    calls = []
+    def crash_at_jd_17(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 17:
+            raise RuntimeError("simulated crash")
+        return update_metrics(*args, **kwargs)
+
+    monkeypatch.setattr(GraphBuilder, "update_metrics", staticmethod(crash_at_jd_17))
+    with pytest.raises(RuntimeError):
+        main.process_data()
+    monkeypatch.setattr(GraphBuilder, "update_metrics", staticmethod(update_metrics))
+    main.process_data(resume=True)
+
+    expected = JDRecords(str(tmp_path / "reference" / "jd_records"))
+    actual = JDRecords(str(tmp_path / "resumed" / "jd_records"))
+    assert actual.manifest == expected.manifest
+    for column, values in expected.read(["ordinal", "hash", "title", "score", "level"]).items():
+        assert actual.read([column])[column].tolist() == values.tolist(), column
+    expected_skills, actual_skills = expected.read(["skills"])["skills"], actual.read(["skills"])["skills"]
+    assert actual_skills.indptr.tolist() == expected_skills.indptr.tolist()
+    assert actual_skills.indices.tolist() == expected_skills.indices.tolist()
@@ -0,0 +1,51 @@
+import sys
+import os
+import itertools
+import json
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import numpy as np
+from core.adjacency import AdjacencyMatrix
+from core.layout import ForceLayout
+from ingestion.reader import Reader
+
+def _two_clusters(size: int = 12):
+    left = [f"l{i}" for i in range(size)]
+    right = [f"r{i}" for i in range(size)]
+    edges = {pair: {"total": 3} for group in (left, right) for pair in itertools.combinations(group, 2)}
+    edges[("l0", "r0")] = {"total": 1}
+    return AdjacencyMatrix.from_edges(left + right, edges), size
+
+def _mean_distance(positions: np.ndarray, a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.linalg.norm(positions[a][:, None, :] - positions[b][None, :, :], axis=2).mean())
+
+def test_layout_is_deterministic_and_separates_clusters():
+    adjacency, size = _two_clusters()
+    first = ForceLayout.compute(adjacency, seed=3, iterations=150)
+    assert np.array_equal(first, ForceLayout.compute(adjacency, seed=3, iterations=150))
+
+    left, right = np.arange(size), np.arange(size, 2 * size)
+    assert _mean_distance(first, left, right) > 2 * _mean_distance(first, left, left)
+
+def test_grid_approximation_separates_clusters():
+    adjacency, size = _two_clusters(size=40)
+    positions = ForceLayout.compute(adjacency, seed=3, iterations=150, exact_threshold=10)
+    left, right = np.arange(size), np.arange(size, 2 * size)
+    assert _mean_distance(positions, left, right) > 2 * _mean_distance(positions, left, left)
+
+def test_warm_start_keeps_positions_stable(tmp_path):
+    adjacency, _ = _two_clusters()
+    cold = ForceLayout.compute(adjacency, seed=3, iterations=150)
+    previous = ForceLayout.to_dict(adjacency.node_ids, cold)
+
+    universe_path = tmp_path / "universe.json"
+    universe_path.write_text(json.dumps({"nodes": [{"id": node, "x": x, "y": y} for node, (x, y) in previous.items()]}))
+    loaded = Reader.load_node_positions(str(universe_path))
+    assert loaded == previous
+
+    warm = ForceLayout.compute(adjacency, seed=99, iterations=20, initial_positions=loaded)
+    # Movement is bounded by the cold start temperature, regardless of the (different) seed
+    assert np.abs(warm - cold).max() < 2 * ForceLayout.K
+    assert Reader.load_node_positions(str(tmp_path / "missing.json")) == {}
@@ -0,0 +1,132 @@
+import sys
+import os
+import time
+import numpy as np
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.match_index import MatchIndex
+from core.skill_matrix import SkillMatrix
+from core.inverted_index import InvertedIndex
+from utils.seniority_analyzer import SeniorityAnalyzer
+
+def _random_corpus(n_docs: int, n_skills: int, seed: int = 0) -> SkillMatrix:
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, n_skills + 1) ** 1.1
+    popularity /= popularity.sum()
+    rows = [rng.choice(n_skills, size=rng.integers(1, 12), p=popularity).tolist() for _ in range(n_docs)]
+    levels = rng.integers(0, len(SeniorityAnalyzer.LEVELS), n_docs).tolist()
+    return SkillMatrix.from_rows(rows, [f"skill_{i}" for i in range(n_skills)], levels)
+
+def _brute_force(matrix: SkillMatrix, skills, level: str, decay: float = 0.8):
+    """Dense cosine of idf vectors times the seniority affinity, for every JD."""
+    dense = np.zeros((matrix.n_rows, matrix.n_skills))
+    dense[matrix.row_ids(), matrix.indices] = 1.0
+    idf = np.log((matrix.n_rows + 1) / (dense.sum(axis=0) + 1)) + 1
+    jd_vectors = dense * idf
+    jd_vectors /= np.maximum(np.linalg.norm(jd_vectors, axis=1, keepdims=True), 1e-12)
+    query = np.zeros(matrix.n_skills)
+    query[[matrix.skill_ids.index(skill) for skill in skills]] = 1.0
+    query *= idf
+    query /= np.linalg.norm(query)
+    affinity = decay ** np.abs(SeniorityAnalyzer.LEVELS.index(level) - matrix.levels.astype(int))
+    return jd_vectors @ query * affinity
+
+def _assert_matches(index: MatchIndex, matrix: SkillMatrix, skills, level: str, k: int = 10):
+    results = index.search(skills, level, k)
+    expected = _brute_force(matrix, skills, level)
+    expected_ids = np.lexsort((np.arange(len(expected)), -expected))[:len(results)]
+    assert len(results) == min(k, int((expected > 0).sum()))
+    np.testing.assert_allclose([score for _, score in results], expected[expected_ids], rtol=1e-5)
+    # Same ranking, up to float32 near-ties
+    for (jd, score), expected_jd in zip(results, expected_ids):
+        assert jd == expected_jd or abs(expected[jd] - expected[expected_jd]) < 1e-5
+
+def test_search_matches_brute_force():
+    matrix = _random_corpus(4000, 60)
+    index = MatchIndex.from_skill_matrix(matrix)
+    rng = np.random.default_rng(1)
+    for _ in range(40):
+        # Mix of popular and rare skills exercises both the pruned and the dense paths
+        skills = [f"skill_{i}" for i in rng.choice(60, size=rng.integers(1, 8), replace=False)]
+        _assert_matches(index, matrix, skills, rng.choice(SeniorityAnalyzer.LEVELS))
+
+def test_pruned_search_matches_brute_force():
+    # Rare skills set the top-k threshold, so the popular skills' postings are only probed for candidates
+    matrix = _random_corpus(20000, 200)
+    index = MatchIndex.from_skill_matrix(matrix)
+    rng = np.random.default_rng(2)
+    for _ in range(20):
+        skill_ids = list(rng.choice(np.arange(120, 200), size=2, replace=False)) + list(rng.choice(5, size=2, replace=False))
+        _assert_matches(index, matrix, [f"skill_{i}" for i in skill_ids], rng.choice(["Junior", "Senior"]))
+
+def test_search_batch_and_unknown_skills():
+    matrix = _random_corpus(500, 30, seed=3)
+    index = MatchIndex.from_skill_matrix(matrix)
+    profiles = [["skill_1", "skill_7"], ["skill_20", "unknown"], ["unknown"]]
+    batch = index.search_batch(profiles, ["Senior", "Junior", "Mid"], k=5)
+    assert batch[0] == index.search(profiles[0], "Senior", 5)
+    assert batch[1] == index.search(["skill_20"], "Junior", 5)
+    assert batch[2] == []
+
+def test_unused_skills_in_vocabulary():
+    # Skills 0, 2 and 4 never occur, including the last ones of the vocabulary
+    matrix = SkillMatrix.from_rows([[1, 3], [1], [3]], ["a", "b", "c", "d", "e"], [1, 1, 2])
+    index = MatchIndex.from_skill_matrix(matrix)
+    assert index.search(["a", "e"]) == []
+    _assert_matches(index, matrix, ["b", "d"], "Mid")
+
+    empty = MatchIndex.from_skill_matrix(SkillMatrix.from_rows([[], []], ["a", "b"], [0, 0]))
+    assert empty.search(["a"]) == []
+
+def test_from_inverted_index_matches_skill_matrix():
+    inverted = InvertedIndex()
+    jobs = [(["python", "sql"], "Senior"), (["python"], "Junior"), (["kafka", "sql"], "Mid"), (["go"], "Managerial")]
+    for ordinal, (skills, level) in enumerate(jobs):
+        inverted.add(ordinal, skills, level)
+    index = MatchIndex.from_inverted_index(inverted)
+
+    assert index.n_docs == 4
+    # JD 1 (python only, two levels away) still beats JD 2 (sql plus the rarer kafka, one level away)
+    results = index.search(["python", "sql"], "Senior", k=3)
+    assert [jd for jd, _ in results] == [0, 1, 2]
+    assert abs(results[0][1] - 1.0) < 1e-6
+
+def test_dense_search_is_faster_than_ranking_every_match():
+    # Zipf-distributed skills over 300k JDs: profiles of the most frequent skills take the dense path
+    n_docs, n_skills = 300000, 400
+    rng = np.random.default_rng(5)
+    popularity = 1 / np.arange(1, n_skills + 1) ** 1.1
+    lengths = rng.integers(1, 16, n_docs)
+    keys = np.unique(np.repeat(np.arange(n_docs), lengths) * n_skills + rng.choice(n_skills, size=lengths.sum(), p=popularity / popularity.sum()))
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(keys // n_skills, minlength=n_docs))])
+    matrix = SkillMatrix(indptr, (keys % n_skills).astype(np.int32), [f"skill_{i}" for i in range(n_skills)], rng.integers(0, 4, n_docs).astype(np.int8))
+    index = MatchIndex.from_skill_matrix(matrix)
+    profiles = [[f"skill_{i}" for i in rng.choice(12, size=rng.integers(2, 6), replace=False)] for _ in range(30)]
+    levels = [SeniorityAnalyzer.LEVELS[i] for i in rng.integers(0, 4, len(profiles))]
+
+    def rank_every_match(skills, level):
+        # The dense path before the sampled bound: score and rank every matching JD
+        ids, query_weights = index._query_vector(skills)
+        order = np.argsort(-query_weights * index._max_weight[ids], kind="stable")
+        ids, query_weights = ids[order], query_weights[order]
+        starts, ends = index.skill_ptr[ids], index.skill_ptr[ids + 1]
+        dense = np.bincount(np.concatenate([index.jd_ids[a:b] for a, b in zip(starts, ends)]),
+                            weights=np.concatenate([index.weights[a:b] * w for a, b, w in zip(starts, ends, query_weights)]), minlength=index.n_docs)
+        candidates = np.flatnonzero(dense)
+        scores = (dense[candidates] * index._affinity[SeniorityAnalyzer.LEVELS.index(level), index.jd_levels[candidates]]).astype(np.float32)
+        return index._top_k(candidates, scores, 10)
+
+    def best_of(run):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            results = run()
+            timings.append(time.perf_counter() - start)
+        return min(timings), results
+
+    baseline, expected = best_of(lambda: [rank_every_match(skills, level) for skills, level in zip(profiles, levels)])
+    batch, actual = best_of(lambda: index.search_batch(profiles, levels, k=10))
+    assert actual == expected
+    assert baseline / batch > 1.5, f"ranking every match {baseline:.3f}s, search_batch {batch:.3f}s"
@@ -0,0 +1,46 @@
+import sys
+import os
+import json
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from config import cfg
+from core.taxonomy import TaxonomyManager
+from ingestion.reader import Reader
+from utils.ngram_matcher import NgramSkillMatcher
+from utils.text_processor import TextProcessor
+from utils.analytics import AnalyticsEngine
+
+def _draft_taxonomy(tmp_path) -> str:
+    taxonomy = {"Streaming": {"kafka": ["apache kafka"], "flink": []}, "Languages": {"python": ["py3"]}}
+    path = tmp_path / "alias_draft.json"
+    path.write_text(json.dumps(taxonomy))
+    return str(path)
+
+def test_taxonomy_caches_are_keyed_by_path(tmp_path):
+    draft_path = _draft_taxonomy(tmp_path)
+    assert TaxonomyManager.get_alias_map(draft_path) == {"kafka": "kafka", "apache kafka": "kafka", "flink": "flink", "python": "python", "py3": "python"}
+    assert TaxonomyManager.get_skill_ids(draft_path) == ["kafka", "flink", "python"]
+    # The default taxonomy is unaffected
+    assert TaxonomyManager.get_alias_map() is TaxonomyManager.get_alias_map(cfg.get_abs_path("paths.alias_json"))
+    assert len(TaxonomyManager.get_alias_map()) > 5
+
+def test_multi_extraction_matches_single_taxonomy_runs(tmp_path):
+    draft_path = _draft_taxonomy(tmp_path)
+    matchers = [NgramSkillMatcher(TaxonomyManager.get_alias_map()), NgramSkillMatcher(TaxonomyManager.get_alias_map(draft_path))]
+
+    for jd in Reader.load_raw_jds(cfg.get_abs_path("paths.input"))[:10]:
+        combined = TextProcessor.extract_skills_multi(jd, matchers)
+        for matcher, found in zip(matchers, combined):
+            assert set(found) == set(TextProcessor.extract_skills_ngram(jd, matcher))
+
+def test_taxonomy_diff_report():
+    diff = AnalyticsEngine.compare_taxonomy_runs({
+        "current": {"kafka": {"total": 4}, "java": {"total": 2}, "go": {"total": 0}},
+        "draft": {"kafka": {"total": 7}, "java": {"total": 2}},
+    }, baseline="current")
+    comparison = diff["comparisons"]["draft"]
+    assert comparison["totalHits"] == {"baseline": 6, "candidate": 9}
+    assert comparison["gained"] == [{"skill": "kafka", "baseline": 4, "candidate": 7, "delta": 3}]
+    assert comparison["lost"] == []
@@ -0,0 +1,36 @@
+import sys
+import os
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.neighbor_index import NeighborIndex
+from core.edge_scoring import EdgeScorer
+
+NODES = [
+    {"id": "python", "val": 10, "isSenior": False},
+    {"id": "git", "val": 20, "isSenior": False},
+    {"id": "kafka", "val": 4, "isSenior": True},
+    {"id": "django", "val": 5, "isSenior": False},
+]
+EDGES = {
+    ("git", "python"): {"total": 8},
+    ("kafka", "python"): {"total": 3},
+    ("django", "python"): {"total": 3},
+}
+NODE_STATS = {node["id"]: {"total": node["val"]} for node in NODES}
+SCORES = EdgeScorer.score_edges(EDGES, NODE_STATS, total_jobs=20)
+
+def test_rankings():
+    index = NeighborIndex.build(NODES, EDGES, SCORES, k=2)
+    python = index["python"]
+    assert python["byWeight"] == [["git", 8], ["django", 3]]
+    # lift(kafka) = 3 * 20 / (10 * 4) = 1.5, lift(django) = 1.2, lift(git) = 0.8
+    assert python["byLift"] == [["kafka", 1.5], ["django", 1.2]]
+    assert python["byRelevance"] == [["git", 8.0], ["kafka", 4.5]]
+    assert index["kafka"]["byWeight"] == [["python", 3]]
+
+def test_edges_to_inactive_nodes_are_ignored():
+    index = NeighborIndex.build(NODES[:2], EDGES, SCORES)
+    assert set(index) == {"python", "git"}
+    assert index["python"]["byWeight"] == [["git", 8]]
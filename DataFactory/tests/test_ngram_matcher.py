@@ -0,0 +1,52 @@
+import sys
+import os
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.ngram_matcher import NgramSkillMatcher
+from utils.text_processor import TextProcessor
+
+ALIAS_MAP = {
+    "c++": "cpp",
+    "c": "c",
+    "c#": "csharp",
+    ".net": ".net",
+    "asp.net": "asp.net",
+    "node.js": "node_js",
+    "node": "node",
+    "java": "java",
+    "javascript": "javascript",
+    "machine learning": "machine_learning",
+    "learning": "learning",
+}
+SORTED_TERMS = sorted(ALIAS_MAP, key=lambda x: (-len(x), x))
+
+def test_special_terms_stay_intact():
+    matcher = NgramSkillMatcher(ALIAS_MAP)
+    found = set(TextProcessor.extract_skills_ngram("C++, C#, .NET and Node.js", matcher))
+    assert found == {"cpp", "csharp", ".net", "node_js"}
+
+def test_matches_regex_extractor_on_edge_cases():
+    matcher = NgramSkillMatcher(ALIAS_MAP)
+    texts = [
+        "asp.net core",
+        "c++17 and c",
+        "java/javascript",
+        "node . js",
+        "machine learning, learning",
+        "c++c++ c++",
+        "x.net",
+        "c#c",
+        "Visit https://nodejs.org for node",
+    ]
+    for text in texts:
+        regex_found = set(TextProcessor.extract_skills(text, SORTED_TERMS, ALIAS_MAP))
+        ngram_found = set(TextProcessor.extract_skills_ngram(text, matcher))
+        assert regex_found == ngram_found, text
+
+def test_mask_matches_regex_residue():
+    matcher = NgramSkillMatcher(ALIAS_MAP)
+    clean = TextProcessor.clean_text("Java and Node.js")
+    masked = NgramSkillMatcher.mask(clean, matcher.find_matches(clean))
+    assert masked == " @@@  and  @@@ "
@@ -0,0 +1,93 @@
+import sys
+import os
+import random
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import main
+from core.partial_stats import PartialStats
+from core.edge_accumulator import SpillingEdgeCounter
+from core.graph_engine import GraphBuilder
+from ingestion.reader import Reader
+from ingestion.writer import Writer
+
+SKILLS = [f"skill_{i:02d}" for i in range(25)]
+LEVELS = ["Junior", "Mid", "Senior", "Managerial"]
+
+def _random_corpus(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [(f"jd {i} {rng.random()}", rng.sample(SKILLS, rng.randint(1, 7)), rng.choice(LEVELS)) for i in range(count)]
+
+def _accumulate(stats, corpus):
+    for _, found_skills, level in corpus:
+        stats.seniority_dist[level] += 1
+        GraphBuilder.update_metrics(stats, found_skills, level)
+    return stats
+
+def test_shard_of_is_deterministic_and_in_range():
+    assert PartialStats.shard_of("Senior Data Engineer", 8) == PartialStats.shard_of("Senior Data Engineer", 8)
+    assert all(0 <= PartialStats.shard_of(f"jd {i}", 5) < 5 for i in range(100))
+
+def test_merged_shards_match_single_run(tmp_path):
+    corpus = _random_corpus(300)
+    single = _accumulate(GraphBuilder.initialize_stats(SKILLS), corpus)
+
+    num_shards = 4
+    paths = []
+    for shard in range(num_shards):
+        shard_corpus = [job for job in corpus if PartialStats.shard_of(job[0], num_shards) == shard]
+        stats = _accumulate(GraphBuilder.initialize_stats(SKILLS), shard_corpus)
+        path = str(tmp_path / f"partial_{shard}.json.gz")
+        Writer.save_partial_stats(PartialStats.to_document(stats, len(shard_corpus), shard, num_shards), path)
+        paths.append(path)
+
+    merged = GraphBuilder.initialize_stats(SKILLS)
+    documents = [Reader.load_partial_stats(path) for path in reversed(paths)]
+    total_jobs = sum(PartialStats.merge_into(merged, document) for document in documents)
+
+    assert total_jobs == len(corpus)
+    assert merged.node_stats == single.node_stats
+    assert list(merged.node_stats) == list(single.node_stats)
+    assert merged.edge_counts == single.edge_counts
+    assert merged.seniority_dist == single.seniority_dist
+    assert PartialStats.missing_shards(documents) == []
+    assert PartialStats.missing_shards(documents[1:]) == [3]
+
+def test_reduce_rejects_mixed_shard_counts(tmp_path):
+    corpus = _random_corpus(20)
+    paths = []
+    for num_shards in (4, 8):
+        stats = _accumulate(GraphBuilder.initialize_stats(SKILLS), corpus)
+        path = str(tmp_path / f"partial_0_of_{num_shards}.json.gz")
+        Writer.save_partial_stats(PartialStats.to_document(stats, len(corpus), 0, num_shards), path)
+        paths.append(path)
+
+    with pytest.raises(ValueError, match="4-shard run"):
+        main.reduce_partials(paths)
+    with pytest.raises(ValueError, match="given twice"):
+        main.reduce_partials([paths[0], paths[0]])
+
+def test_merge_into_spilling_counter():
+    corpus = _random_corpus(120, seed=11)
+    single = _accumulate(GraphBuilder.initialize_stats(SKILLS), corpus)
+
+    merged = GraphBuilder.initialize_stats(SKILLS)
+    merged.edge_counts = SpillingEdgeCounter(max_entries=20)
+    for shard in range(2):
+        shard_corpus = [job for job in corpus if PartialStats.shard_of(job[0], 2) == shard]
+        stats = _accumulate(GraphBuilder.initialize_stats(SKILLS), shard_corpus)
+        PartialStats.merge_into(merged, PartialStats.to_document(stats, len(shard_corpus), shard, 2))
+
+    assert list(merged.edge_counts.items()) == sorted(single.edge_counts.items())
+    merged.edge_counts.close()
+
+def test_merge_rejects_unknown_versions():
+    stats = GraphBuilder.initialize_stats(SKILLS)
+    document = PartialStats.to_document(stats, 0)
+    document["version"] = PartialStats.VERSION + 1
+    with pytest.raises(ValueError):
+        PartialStats.merge_into(stats, document)
+    with pytest.raises(ValueError):
+        PartialStats.merge_into(stats, {"version": PartialStats.VERSION})
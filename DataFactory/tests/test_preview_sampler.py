@@ -0,0 +1,68 @@
+import sys
+import os
+import random
+from collections import Counter
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.preview_sampler import PreviewSampler
+from core.graph_engine import GraphBuilder
+from ingestion.reader import Reader
+
+def test_reservoir_is_deterministic_and_in_stream_order():
+    sample, seen = PreviewSampler.reservoir(iter(range(10_000)), 50, seed=7)
+    assert seen == 10_000
+    assert len(sample) == 50 == len(set(sample))
+    assert sample == sorted(sample)
+    assert sample == PreviewSampler.reservoir(iter(range(10_000)), 50, seed=7)[0]
+
+def test_reservoir_keeps_short_streams_whole():
+    assert PreviewSampler.reservoir(iter("abc"), 10) == (["a", "b", "c"], 3)
+
+def test_reservoir_is_uniform():
+    hits = Counter()
+    for seed in range(2000):
+        hits.update(PreviewSampler.reservoir(iter(range(20)), 5, seed=seed)[0])
+    # Each item is expected 2000 * 5 / 20 = 500 times
+    assert all(400 < hits[item] < 600 for item in range(20))
+
+def test_bernoulli_fraction():
+    sample, seen = PreviewSampler.bernoulli(iter(range(20_000)), 0.1, seed=1)
+    assert seen == 20_000
+    assert 1800 < len(sample) < 2200
+
+def test_interval_is_exact_on_full_sample_and_covers_truth():
+    assert PreviewSampler.interval(7, 100, 100) == (7, 7)
+
+    rng = random.Random(5)
+    corpus = [rng.random() < 0.08 for _ in range(5000)]
+    truth = sum(corpus)
+    covered = 0
+    for seed in range(200):
+        sample, _ = PreviewSampler.reservoir(iter(corpus), 400, seed=seed)
+        low, high = PreviewSampler.interval(sum(sample), len(sample), len(corpus), confidence=0.95)
+        covered += low <= truth <= high
+    assert covered >= 180
+
+def test_scale_stats_scales_counts_and_returns_intervals():
+    stats = GraphBuilder.initialize_stats(["python", "sql", "go"])
+    for found_skills, level in [(["python", "sql"], "Senior"), (["python"], "Junior")]:
+        stats.seniority_dist[level] += 1
+        GraphBuilder.update_metrics(stats, found_skills, level)
+
+    intervals = PreviewSampler.scale_stats(stats, sample_size=2, corpus_size=10)
+
+    assert stats.node_stats["python"] == {"total": 10, "senior_count": 5, "managerial_count": 0}
+    assert stats.edge_counts[("python", "sql")]["total"] == 5
+    assert stats.seniority_dist == Counter({"Senior": 5, "Junior": 5})
+    assert set(intervals["nodes"]) == {"python", "sql"}
+    low, high = intervals["edges"][("python", "sql")]
+    assert 1 <= low <= 5 <= high <= 9
+
+def test_iter_raw_jds_matches_load_raw_jds(tmp_path):
+    path = tmp_path / "jds.txt"
+    path.write_text("First JD\n###END###\n\n###END###Second JD ###END### Third", encoding="utf-8")
+    expected = ["First JD", "Second JD", "Third"]
+    assert Reader.load_raw_jds(str(path)) == expected
+    assert list(Reader.iter_raw_jds(str(path), chunk_size=4)) == expected
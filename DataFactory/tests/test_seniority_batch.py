@@ -0,0 +1,70 @@
+import sys
+import os
+import time
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from config import cfg
+from ingestion.reader import Reader
+from utils.text_processor import TextProcessor
+from utils.seniority_analyzer import SeniorityAnalyzer
+
+def test_batch_scores_match_scalar_path():
+    jds = Reader.load_raw_jds(cfg.get_abs_path("paths.input"))
+    titles = [TextProcessor.extract_title_candidate(jd) for jd in jds]
+    # Hand-written cases covering every title branch and experience bucket
+    titles += ["Junior Software Engineer", "Software Engineer", "Senior Backend Architect", "Engineering Manager", "Head of Product"]
+    jds += [
+        "Help us develop features, fix bugs, and learn from our team.",
+        "Implement new features. 3 years of experience required.",
+        "Lead the design of distributed systems. 8 years of experience. Mentor junior engineers.",
+        "Manage a team of 10 engineers. Drive the roadmap. 10 years of experience.",
+        "Define product strategy and vision.",
+    ]
+
+    batch = SeniorityAnalyzer.detect_seniority_batch(titles, jds)
+
+    for i, (title, jd) in enumerate(zip(titles, jds)):
+        scalar = SeniorityAnalyzer.detect_seniority(title, jd)
+        assert batch["score"][i] == scalar["score"]
+        assert SeniorityAnalyzer.LEVELS[batch["level"][i]] == scalar["level"]
+        assert bool(batch["is_senior"][i]) == scalar["is_senior"]
+
+def test_empty_batch():
+    batch = SeniorityAnalyzer.detect_seniority_batch([], [])
+    assert len(batch["score"]) == 0 and len(batch["level"]) == 0
+
+def test_experience_and_keyword_edge_cases_match_scalar_path():
+    titles = ["Engineer"] * 8
+    jds = [
+        "15 years of experience",           # two-digit number
+        "5+ yrs with python",               # '+' suffix, abbreviated unit
+        "at least 3\n\t years",             # whitespace run before the unit
+        "10years of architecture",          # no whitespace, keyword inside a longer word
+        "year one, then 4 years; 5 year",   # several occurrences, the last one senior
+        "yrs years year",                   # units without a number
+        "désign patterns and architecté — observability",  # non-ASCII text around keywords
+        "leadleadlead microservices",       # repeated keyword counts once
+    ]
+    batch = SeniorityAnalyzer.detect_seniority_batch(titles, jds)
+    for i, (title, jd) in enumerate(zip(titles, jds)):
+        assert batch["score"][i] == SeniorityAnalyzer.detect_seniority(title, jd)["score"], jd
+
+def test_batch_is_faster_than_scalar_path():
+    jds = Reader.load_raw_jds(cfg.get_abs_path("paths.input"))
+    # Distinct texts, so nothing downstream can benefit from repeated inputs
+    jds = [f"{jd}\nref {i}" for i, jd in enumerate(jds * 40)]
+    titles = [TextProcessor.extract_title_candidate(jd) for jd in jds]
+
+    def best_of(run):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    scalar = best_of(lambda: [SeniorityAnalyzer.detect_seniority(title, jd) for title, jd in zip(titles, jds)])
+    batch = best_of(lambda: SeniorityAnalyzer.detect_seniority_batch(titles, jds))
+    assert scalar / batch > 1.5, f"scalar {scalar:.3f}s, batch {batch:.3f}s"
@@ -0,0 +1,91 @@
+import sys
+import os
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+import numpy as np
+from config import cfg
+from core.taxonomy import TaxonomyManager
+from core.graph_engine import GraphBuilder
+from core.edge_accumulator import ColumnarEdgeCounter
+from core.skill_matrix import SkillMatrix
+from ingestion.reader import Reader
+from utils.text_processor import TextProcessor
+from utils.seniority_analyzer import SeniorityAnalyzer
+
+def test_from_rows_dedupes_and_sorts():
+    matrix = SkillMatrix.from_rows([[3, 1, 3], [], [0]], ["a", "b", "c", "d"], levels=[0, 1, 2])
+    assert matrix.indptr.tolist() == [0, 2, 2, 3]
+    assert matrix.row(0).tolist() == [1, 3]
+    assert matrix.row_names(0) == ["b", "d"]
+    assert matrix.row_ids().tolist() == [0, 0, 2]
+    assert matrix.levels.dtype == np.int8
+
+def test_batch_extraction_and_graph_update_match_per_jd_path():
+    jds = Reader.load_raw_jds(cfg.get_abs_path("paths.input"))[:10]
+    matchable_terms = TaxonomyManager.get_matchable_terms()
+    alias_map = TaxonomyManager.get_alias_map()
+    all_skills = TaxonomyManager.get_all_skills()
+
+    reference = GraphBuilder.initialize_stats(all_skills)
+    for jd in jds:
+        found_skills = TextProcessor.extract_skills(jd, matchable_terms, alias_map)
+        level = SeniorityAnalyzer.detect_seniority(TextProcessor.extract_title_candidate(jd), jd)["level"]
+        reference.seniority_dist[level] += 1
+        GraphBuilder.update_metrics(reference, found_skills, level)
+
+    matrix = TextProcessor.extract_skills_batch(jds, with_levels=True)
+    assert matrix.n_rows == len(jds)
+    assert set(matrix.row_names(0)) == set(TextProcessor.extract_skills(jds[0], matchable_terms, alias_map))
+
+    batched = GraphBuilder.initialize_stats(all_skills)
+    GraphBuilder.update_metrics_batch(batched, matrix)
+
+    assert batched.node_stats == reference.node_stats
+    assert batched.edge_counts == reference.edge_counts
+    assert batched.seniority_dist == reference.seniority_dist
+
+def test_batch_edges_match_per_row_order_and_spilling():
+    # Ids deliberately not in name order, so pairs must be oriented by name
+    skill_ids = ["kafka", "aws", "python", "docker", "sql", "go"]
+    rng = np.random.default_rng(4)
+    rows = [rng.choice(len(skill_ids), size=rng.integers(0, 6), replace=False).tolist() for _ in range(300)]
+    levels = rng.integers(0, len(SeniorityAnalyzer.LEVELS), len(rows)).tolist()
+    matrix = SkillMatrix.from_rows(rows, skill_ids, levels)
+
+    reference = GraphBuilder.initialize_stats(skill_ids)
+    for i in range(matrix.n_rows):
+        GraphBuilder.update_metrics(reference, matrix.row_names(i), SeniorityAnalyzer.LEVELS[levels[i]])
+
+    batched = GraphBuilder.initialize_stats(skill_ids)
+    GraphBuilder.update_metrics_batch(batched, matrix)
+    assert list(batched.edge_counts.items()) == list(reference.edge_counts.items())
+
+    spilling = GraphBuilder.initialize_stats(skill_ids, edge_memory_budget_mb=0.001)
+    GraphBuilder.update_metrics_batch(spilling, matrix)
+    assert list(spilling.edge_counts.items()) == sorted(reference.edge_counts.items())
+    spilling.edge_counts.close()
+
+def test_columnar_edge_counter_matches_per_row_counts():
+    skill_ids = ["kafka", "aws", "python", "docker", "sql", "go"]
+    rng = np.random.default_rng(7)
+    rows = [rng.choice(len(skill_ids), size=rng.integers(0, 6), replace=False).tolist() for _ in range(300)]
+    levels = rng.integers(0, len(SeniorityAnalyzer.LEVELS), len(rows)).tolist()
+
+    reference = GraphBuilder.initialize_stats(skill_ids)
+    for row, level in zip(rows, levels):
+        GraphBuilder.update_metrics(reference, [skill_ids[skill_id] for skill_id in row], SeniorityAnalyzer.LEVELS[level])
+
+    columnar = GraphBuilder.initialize_stats(skill_ids, edge_skill_ids=skill_ids)
+    columnar.edge_counts.compact_every = 50
+    # Batches and single JDs mixed, with compactions in between
+    GraphBuilder.update_metrics_batch(columnar, SkillMatrix.from_rows(rows[:100], skill_ids, levels[:100]))
+    for row, level in zip(rows[100:150], levels[100:150]):
+        GraphBuilder.update_metrics(columnar, [skill_ids[skill_id] for skill_id in row], SeniorityAnalyzer.LEVELS[level])
+    GraphBuilder.update_metrics_batch(columnar, SkillMatrix.from_rows(rows[150:], skill_ids, levels[150:]))
+
+    assert isinstance(columnar.edge_counts, ColumnarEdgeCounter)
+    assert list(columnar.edge_counts.items()) == sorted(reference.edge_counts.items())
+    assert len(columnar.edge_counts) == len(reference.edge_counts)
+    assert columnar.node_stats == reference.node_stats
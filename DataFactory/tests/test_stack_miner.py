@@ -0,0 +1,55 @@
+import sys
+import os
+import itertools
+import random
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.inverted_index import InvertedIndex
+from core.stack_miner import StackMiner
+
+SKILLS = ["spark", "kafka", "airflow", "python", "java", "scala", "docker"]
+
+def _build(count: int = 300, seed: int = 11):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        skills = set(rng.sample(SKILLS, rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            skills |= {"spark", "kafka", "airflow"}
+        corpus.append((skills, rng.choice(["Junior", "Mid", "Senior", "Managerial"])))
+    index = InvertedIndex()
+    for ordinal, (skills, level) in enumerate(corpus):
+        index.add(ordinal, skills, level)
+    return corpus, index
+
+def _brute_force(corpus, size: int):
+    counts = {}
+    for skills, level in corpus:
+        for combo in itertools.combinations(sorted(skills), size):
+            total, senior = counts.get(combo, (0, 0))
+            counts[combo] = (total + 1, senior + (level in ("Senior", "Managerial")))
+    return counts
+
+def test_top_stacks_match_brute_force():
+    corpus, index = _build()
+    stacks = StackMiner.mine(index, min_support=0.05, max_size=3, top_n=5)
+
+    for size in (2, 3):
+        expected = _brute_force(corpus, size)
+        mined = [stack for stack in stacks if stack["size"] == size]
+        assert len(mined) == 5
+        kth_support = sorted((total for total, _ in expected.values()), reverse=True)[4]
+        for stack in mined:
+            total, senior = expected[tuple(stack["skills"])]
+            assert stack["support"] == total >= kth_support
+            assert stack["seniorityRatio"] == round(senior / total, 2)
+
+    assert stacks[5]["skills"] == ["airflow", "kafka", "spark"]
+
+def test_min_support_is_respected():
+    corpus, index = _build()
+    stacks = StackMiner.mine(index, min_support=200, max_size=3, top_n=50)
+    assert all(stack["support"] >= 200 for stack in stacks)
+    assert StackMiner.mine(InvertedIndex()) == []
@@ -0,0 +1,52 @@
+import sys
+import os
+import json
+import time
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '../src')
+
+# Import cost of `main` on top of the interpreter's own startup. Loading numpy, parsing the settings
+# or opening the log file at import each blow through it.
+IMPORT_BUDGET_MS = 100
+
+def _run(code: str, extra_env=None) -> str:
+    env = dict(os.environ)
+    # Let the interpreter cache bytecode, as a deployed install would
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.update(extra_env or {})
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True)
+    return result.stdout
+
+def _best_time_ms(code: str, runs: int = 5) -> float:
+    _run(code)
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(code)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+def test_import_has_no_side_effects():
+    state = json.loads(_run(
+        "import sys, json, logging, main; "
+        "print(json.dumps({'numpy': 'numpy._core' in sys.modules, 'yaml': 'yaml' in sys.modules, "
+        "'handlers': len(logging.getLogger().handlers)}))"))
+    assert state == {"numpy": False, "yaml": False, "handlers": 0}
+
+def test_environment_overrides_skip_the_settings_file():
+    state = json.loads(_run(
+        "import sys, json; from config import cfg; "
+        "print(json.dumps({'input': cfg.get('paths.input'), 'threshold': cfg.get('pipeline.threshold'), 'yaml': 'yaml' in sys.modules}))",
+        {"CAREERNAV_PATHS__INPUT": "/tmp/jds.txt", "CAREERNAV_PIPELINE__THRESHOLD": "7"}))
+    assert state == {"input": "/tmp/jds.txt", "threshold": 7, "yaml": False}
+
+    # Once the file is read, overrides also show in whole sections
+    section = json.loads(_run(
+        "import json; from config import cfg; print(json.dumps(cfg.get('export')))",
+        {"CAREERNAV_EXPORT__GRAPH_STORE": "true"}))
+    assert section["graph_store"] is True
+
+def test_import_time_budget():
+    overhead = _best_time_ms("import main") - _best_time_ms("pass")
+    assert overhead < IMPORT_BUDGET_MS, f"importing main costs {overhead:.0f} ms (budget {IMPORT_BUDGET_MS} ms)"
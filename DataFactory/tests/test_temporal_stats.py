@@ -0,0 +1,106 @@
+import sys
+import os
+import pytest
+from datetime import date, timedelta
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.temporal_stats import TemporalStats
+from core.graph_engine import GraphBuilder
+from utils.text_processor import TextProcessor
+
+SKILLS = ["python", "sql", "kafka", "spark"]
+AS_OF = date(2026, 10, 15)
+
+def _jobs():
+    # (days before AS_OF, skills, level)
+    return [
+        (0, ["python", "sql"], "Senior"),
+        (3, ["python", "kafka"], "Mid"),
+        (20, ["kafka", "spark"], "Senior"),
+        (60, ["python", "spark"], "Junior"),
+        (200, ["sql", "spark"], "Managerial"),
+    ]
+
+def _temporal(**kwargs) -> TemporalStats:
+    temporal = TemporalStats(SKILLS, **kwargs)
+    for i, (age, skills, level) in enumerate(_jobs()):
+        temporal.add(f"jd{i}", skills, level, AS_OF - timedelta(days=age))
+    return temporal
+
+def test_buckets_are_aligned_and_windows_sum_them():
+    temporal = _temporal(bucket_days=7)
+    assert all(bucket.weekday() == 0 for bucket in temporal.buckets)
+
+    stats, total_jobs = temporal.window(30, as_of=AS_OF)
+    assert total_jobs == 3
+    assert stats.node_stats["python"]["total"] == 2
+    assert stats.node_stats["spark"] == {"total": 1, "senior_count": 1, "managerial_count": 0}
+    assert stats.edge_counts[("kafka", "python")]["total"] == 1
+
+    everything, total_jobs = temporal.window(10_000, as_of=AS_OF)
+    assert total_jobs == 5
+    assert everything.node_stats["sql"]["managerial_count"] == 1
+
+def test_decayed_view_matches_direct_weighting():
+    half_life = 30.0
+    temporal = _temporal(half_life_days=half_life)
+    stats, decayed_jobs = temporal.decayed_view(as_of=AS_OF, precision=10)
+
+    expected = GraphBuilder.initialize_stats(SKILLS)
+    for age, skills, level in _jobs():
+        GraphBuilder.update_metrics(expected, skills, level, weight=2.0 ** (-age / half_life))
+
+    for skill in SKILLS:
+        assert stats.node_stats[skill]["total"] == pytest.approx(expected.node_stats[skill]["total"])
+    assert stats.edge_counts[("kafka", "spark")]["senior_count"] == pytest.approx(2.0 ** (-20 / half_life))
+    assert decayed_jobs == pytest.approx(sum(2.0 ** (-age / half_life) for age, _, _ in _jobs()))
+
+def test_landmark_moves_without_changing_the_view():
+    temporal = TemporalStats(SKILLS, half_life_days=1.0)
+    temporal.add("old", ["python", "sql"], "Mid", AS_OF - timedelta(days=300))
+    temporal.add("new", ["python"], "Mid", AS_OF)
+    assert temporal.landmark == AS_OF
+
+    stats, _ = temporal.decayed_view(as_of=AS_OF, precision=10)
+    assert stats.node_stats["python"]["total"] == pytest.approx(1.0)
+
+def test_duplicates_are_ignored_and_state_round_trips():
+    temporal = _temporal()
+    assert "jd0" in temporal
+    assert not temporal.add("jd0", ["python"], "Senior", AS_OF)
+
+    restored = TemporalStats.from_document(temporal.to_document(), SKILLS)
+    assert restored.window(90, AS_OF)[0].node_stats == temporal.window(90, AS_OF)[0].node_stats
+    assert restored.decayed_view(AS_OF) == temporal.decayed_view(AS_OF)
+    assert "jd4" in restored
+
+    with pytest.raises(ValueError):
+        TemporalStats.from_document(temporal.to_document(), SKILLS, bucket_days=1)
+
+def test_prune_drops_old_buckets_only():
+    temporal = _temporal()
+    decayed_before = temporal.decayed_view(AS_OF)
+    assert temporal.prune(retention_days=90, as_of=AS_OF) == 1
+    assert temporal.window(10_000, AS_OF)[1] == 4
+    assert "jd4" not in temporal
+    assert temporal.decayed_view(AS_OF) == decayed_before
+
+def test_pruned_jds_are_not_counted_again():
+    temporal = _temporal()
+    temporal.prune(retention_days=90, as_of=AS_OF)
+    temporal = TemporalStats.from_document(temporal.to_document(), SKILLS)
+    decayed_before = temporal.decayed_view(AS_OF)
+
+    # The next run re-reads the whole corpus, including the JD of the pruned bucket
+    for i, (age, skills, level) in enumerate(_jobs()):
+        assert not temporal.add(f"jd{i}", skills, level, AS_OF - timedelta(days=age))
+    assert temporal.decayed_view(AS_OF) == decayed_before
+    assert sorted(temporal.buckets) == sorted(_temporal().buckets)[1:]
+
+def test_extract_posting_date():
+    assert TextProcessor.extract_posting_date("Data Engineer\nPosted: 2026-09-30\nWe use Spark.") == date(2026, 9, 30)
+    assert TextProcessor.extract_posting_date("Date Posted 2026-01-02") == date(2026, 1, 2)
+    assert TextProcessor.extract_posting_date("Posted: 2026-13-40") is None
+    assert TextProcessor.extract_posting_date("No date here") is None
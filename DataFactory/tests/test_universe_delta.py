@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+import pytest
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.universe_delta import UniverseDelta
+from ingestion.reader import Reader
+from ingestion.writer import Writer
+
+def _edge(total: int, senior: int = 0):
+    return {"total": total, "senior_count": senior, "managerial_count": 0}
+
+# Skills that do not change, so deltas are smaller than the universe (otherwise a snapshot is written instead)
+STABLE = [{"id": f"stable_{i:02d}", "val": 5} for i in range(20)]
+
+GENERATIONS = [
+    ([{"id": "python", "val": 3}, {"id": "django", "val": 2}] + STABLE, {("django", "python"): _edge(2)}),
+    ([{"id": "python", "val": 4}, {"id": "django", "val": 2}, {"id": "kafka", "val": 1}] + STABLE, {("django", "python"): _edge(2), ("kafka", "python"): _edge(1, 1)}),
+    ([{"id": "python", "val": 4}, {"id": "kafka", "val": 2}] + STABLE, {("kafka", "python"): _edge(2, 1)}),
+]
+
+def _export(output_dir: str, nodes, edges, snapshot_every: int, keep_snapshots: int = 3):
+    previous = Reader.load_json(os.path.join(output_dir, "universe.json"))
+    meta = {"generation": previous.get("meta", {}).get("generation", 0) + 1}
+    universe = Writer.save_universe(nodes, edges, meta=meta, output_dir=output_dir)
+    return previous, universe, Writer.save_generation(universe, previous, output_dir, snapshot_every, keep_snapshots)
+
+def _canonical(universe):
+    return (sorted(json.dumps(n, sort_keys=True) for n in universe["nodes"]),
+            sorted(json.dumps(l, sort_keys=True) for l in universe["links"]))
+
+def test_deltas_replay_to_the_latest_universe(tmp_path):
+    output_dir = str(tmp_path)
+    for nodes, edges in GENERATIONS:
+        previous, universe, manifest = _export(output_dir, nodes, edges, snapshot_every=2)
+        if previous:
+            delta = Reader.load_json(os.path.join(output_dir, manifest["deltas"][-1]["file"]))
+            assert _canonical(UniverseDelta.apply(previous, delta)) == _canonical(universe)
+
+    assert manifest["generation"] == 3
+    assert [entry["generation"] for entry in manifest["snapshots"]] == [1, 2]
+    assert [entry["generation"] for entry in manifest["deltas"]] == [2, 3]
+
+    last = Reader.load_json(os.path.join(output_dir, "deltas", "delta_000003.json"))
+    assert last["nodes"]["removed"] == ["django"]
+    assert [node["id"] for node in last["nodes"]["changed"]] == ["kafka"]
+    assert last["links"]["removed"] == [["django", "python"]]
+
+def test_retention_and_generation_check(tmp_path):
+    output_dir = str(tmp_path)
+    for nodes, edges in GENERATIONS:
+        _, _, manifest = _export(output_dir, nodes, edges, snapshot_every=1, keep_snapshots=1)
+
+    assert [entry["generation"] for entry in manifest["snapshots"]] == [3]
+    assert manifest["deltas"] == []
+    assert sorted(os.listdir(os.path.join(output_dir, "snapshots"))) == ["universe_000003.json"]
+    assert os.listdir(os.path.join(output_dir, "deltas")) == []
+
+    with pytest.raises(ValueError):
+        UniverseDelta.apply({"meta": {"generation": 5}}, {"generation": 3, "baseGeneration": 2})
+
+def _universe(generation: int, page_rank_scale: float, extra_links: int = 0, val: int = 10):
+    nodes = [{"id": f"skill_{i:02d}", "val": val, "pageRank": round(0.01 * (i + 1) * page_rank_scale, 6)} for i in range(30)]
+    links = [{"source": "skill_00", "target": f"skill_{i:02d}", "value": 3, "lift": 1.5} for i in range(1, 1 + extra_links)]
+    return {"meta": {"generation": generation}, "nodes": nodes, "links": links}
+
+def test_derived_metrics_within_tolerance_do_not_mark_changes(tmp_path):
+    output_dir = str(tmp_path)
+    # pageRank drifts by 0.4% per generation: below the 1% tolerance each time, but not cumulatively
+    universes = [_universe(generation, 1 + 0.004 * generation) for generation in range(1, 6)]
+    consumer = universes[0]
+    Writer.save_generation(universes[0], {}, output_dir, snapshot_every=0)
+    for previous, universe in zip(universes, universes[1:]):
+        manifest = Writer.save_generation(universe, previous, output_dir, snapshot_every=0)
+        delta = Reader.load_json(os.path.join(output_dir, manifest["deltas"][-1]["file"]))
+        assert delta["nodes"]["changed"] == [] and delta["nodes"]["added"] == []
+        consumer = UniverseDelta.apply(consumer, delta)
+        for held, exported in zip(consumer["nodes"], universe["nodes"]):
+            assert abs(held["pageRank"] - exported["pageRank"]) <= 0.01 * exported["pageRank"]
+
+    # Metrics are resent once the drift since the consumer's copy exceeds the tolerance
+    assert [len(Reader.load_json(os.path.join(output_dir, entry["file"]))["metrics"]["nodes"]) for entry in manifest["deltas"]] == [0, 0, 30, 0]
+    assert [entry["generation"] for entry in manifest["snapshots"]] == [1]
+
+def test_oversized_delta_is_replaced_by_a_snapshot(tmp_path):
+    output_dir = str(tmp_path)
+    Writer.save_generation(_universe(1, 1), {}, output_dir, snapshot_every=0)
+    manifest = Writer.save_generation(_universe(2, 1, extra_links=29, val=11), _universe(1, 1), output_dir, snapshot_every=0)
+    assert manifest["deltas"] == []
+    assert [entry["generation"] for entry in manifest["snapshots"]] == [1, 2]
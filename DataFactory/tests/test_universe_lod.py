@@ -0,0 +1,70 @@
+import sys
+import os
+import json
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from core.universe_lod import UniverseLOD
+from ingestion.writer import Writer
+
+UNIVERSE = {
+    "meta": {"totalSkills": 4, "communities": {"0": ["python", "django", "docker", "k8s"]}},
+    "nodes": [
+        {"id": "python", "group": "Languages", "val": 10, "seniorityScore": 0.5, "x": 0.0, "y": 0.0},
+        {"id": "django", "group": "Languages", "val": 5, "seniorityScore": 0.2, "x": 3.0, "y": 1.5},
+        {"id": "docker", "group": "Cloud/Ops", "val": 8, "seniorityScore": 0.8, "x": -2.0, "y": 4.0},
+        {"id": "k8s", "group": "Cloud/Ops", "val": 2, "seniorityScore": 1.0, "x": -4.0, "y": 6.0}
+    ],
+    "links": [
+        {"source": "python", "target": "django", "value": 4},
+        {"source": "docker", "target": "k8s", "value": 2},
+        {"source": "python", "target": "docker", "value": 3},
+        {"source": "django", "target": "k8s", "value": 1}
+    ]
+}
+
+def test_overview_rolls_up_groups():
+    overview = UniverseLOD.overview(UNIVERSE)
+    groups = {node["id"]: node for node in overview["nodes"]}
+
+    assert sorted(groups) == ["Cloud/Ops", "Languages"]
+    assert groups["Languages"]["val"] == 15
+    assert groups["Languages"]["internalValue"] == 4
+    assert groups["Languages"]["topSkills"] == ["python", "django"]
+    assert groups["Languages"]["x"] == 1.0
+    assert overview["links"] == [{"source": "Cloud/Ops", "target": "Languages", "value": 4, "links": 2}]
+    assert "communities" not in overview["meta"]
+
+def test_tiles_share_cross_links():
+    tiles = UniverseLOD.tiles(UNIVERSE)
+
+    assert [link["source"] for link in tiles["Languages"]["links"]] == ["python"]
+    assert tiles["Languages"]["crossLinks"] == tiles["Cloud/Ops"]["crossLinks"]
+    assert tiles["Languages"]["external"] == {"docker": "Cloud/Ops", "k8s": "Cloud/Ops"}
+    # Every link lands in exactly one tile, or in both tiles of a cross-group pair
+    assert sum(len(tile["links"]) for tile in tiles.values()) + len(tiles["Languages"]["crossLinks"]) == len(UNIVERSE["links"])
+
+def test_save_lod_writes_index_last_and_drops_stale_tiles(tmp_path, monkeypatch):
+    stale = tmp_path / "lod" / "tiles" / "Removed.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("{}")
+
+    # Stale tiles are removed only once the new index no longer lists them
+    remove = os.remove
+    def checked_remove(path):
+        assert "Removed" not in (tmp_path / "lod" / "index.json").read_text()
+        remove(path)
+    monkeypatch.setattr(os, "remove", checked_remove)
+
+    index = Writer.save_lod(UNIVERSE, output_dir=str(tmp_path))
+
+    lod_dir = tmp_path / "lod"
+    assert json.loads((lod_dir / "index.json").read_text()) == index
+    assert not stale.exists()
+    assert not any(name.endswith(".tmp") for name in os.listdir(lod_dir / "tiles") + os.listdir(lod_dir))
+    entry = index["tiles"]["Cloud/Ops"]
+    assert entry["path"] == "tiles/Cloud_Ops.json"
+    assert entry["bbox"] == [-4.0, 4.0, -2.0, 6.0]
+    assert entry["bytes"] == os.path.getsize(lod_dir / entry["path"])
+    assert index["overview"]["bytes"] == os.path.getsize(lod_dir / "overview.json")